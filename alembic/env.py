@@ -27,6 +27,17 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Columns that exist in the database but are deliberately not mapped, so that
+# autogenerate does not drop them (see app.posts.models.search_vector)
+UNMAPPED_COLUMNS = {("posts", "search_vector")}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "column" and reflected and compare_to is None:
+        return (object.table.name, name) not in UNMAPPED_COLUMNS
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -49,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -71,7 +83,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,42 @@
+"""add posts votes_count
+
+Revision ID: 31904e689111
+Revises: 31a380d2035e
+Create Date: 2026-10-18 10:03:27.142871
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "31904e689111"
+down_revision: Union[str, Sequence[str], None] = "31a380d2035e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("votes_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill the counter from the votes cast so far
+    op.execute(
+        """
+        UPDATE posts
+        SET votes_count = counts.votes
+        FROM (SELECT post_id, count(*) AS votes FROM votes GROUP BY post_id) AS counts
+        WHERE counts.post_id = posts.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("posts", "votes_count")
@@ -0,0 +1,35 @@
+"""add posts created_at index
+
+Revision ID: 31a380d2035e
+Revises: edad86651b04
+Create Date: 2026-10-18 09:12:40.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "31a380d2035e"
+down_revision: Union[str, Sequence[str], None] = "edad86651b04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets keyset pagination seek straight to a page, newest posts first
+    op.create_index(
+        "ix_posts_created_at_id",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_created_at_id", table_name="posts")
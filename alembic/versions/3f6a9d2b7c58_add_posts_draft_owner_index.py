@@ -0,0 +1,38 @@
+"""add posts draft owner index
+
+Revision ID: 3f6a9d2b7c58
+Revises: 8b4e2c7d1f93
+Create Date: 2026-10-18 20:06:12.834917
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a9d2b7c58"
+down_revision: Union[str, Sequence[str], None] = "8b4e2c7d1f93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial: only drafts are indexed, so the draft owners lookup the posts
+    # cache runs after every post write or vote reads a few entries instead
+    # of scanning posts
+    op.create_index(
+        "ix_posts_draft_owner_id",
+        "posts",
+        ["owner_id"],
+        unique=False,
+        postgresql_where=sa.text("published IS NOT TRUE"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_draft_owner_id", table_name="posts")
@@ -0,0 +1,56 @@
+"""add posts search vector
+
+Revision ID: 5c2f8e4b9a71
+Revises: d0aa7bde343e
+Create Date: 2026-10-18 19:05:12.371846
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2f8e4b9a71"
+down_revision: Union[str, Sequence[str], None] = "d0aa7bde343e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT = "to_tsvector('english'::regconfig, title || ' ' || content)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored, so ranking reads the tsvector instead of recomputing it per row.
+    # Adding a stored generated column rewrites the table under an exclusive
+    # lock.
+    op.add_column(
+        "posts",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_posts_search_vector",
+        "posts",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_posts_search_document", table_name="posts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_posts_search_document",
+        "posts",
+        [sa.text(SEARCH_DOCUMENT)],
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_posts_search_vector", table_name="posts")
+    op.drop_column("posts", "search_vector")
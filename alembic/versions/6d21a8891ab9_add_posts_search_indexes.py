@@ -0,0 +1,48 @@
+"""add posts search indexes
+
+Revision ID: 6d21a8891ab9
+Revises: 31904e689111
+Create Date: 2026-10-18 11:26:51.904417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d21a8891ab9"
+down_revision: Union[str, Sequence[str], None] = "31904e689111"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Makes ILIKE '%term%' on titles indexable and provides similarity()
+    op.create_index(
+        "ix_posts_title_trgm",
+        "posts",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+    # Must match the searched to_tsvector() expression exactly to be used.
+    # Replaced by the stored posts.search_vector column in 5c2f8e4b9a71.
+    op.create_index(
+        "ix_posts_search_document",
+        "posts",
+        [sa.text("to_tsvector('english'::regconfig, title || ' ' || content)")],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_search_document", table_name="posts")
+    op.drop_index("ix_posts_title_trgm", table_name="posts")
@@ -0,0 +1,80 @@
+"""replace post rankings view with table
+
+Revision ID: 8b4e2c7d1f93
+Revises: 5c2f8e4b9a71
+Create Date: 2026-10-18 19:41:06.207315
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4e2c7d1f93"
+down_revision: Union[str, Sequence[str], None] = "5c2f8e4b9a71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORES = """
+    SELECT
+        posts.id AS post_id,
+        count(votes.post_id) AS top_score,
+        coalesce(
+            sum(power(0.5, extract(epoch FROM now() - votes.created_at) / 86400)),
+            0
+        )::double precision AS hot_score
+    FROM posts
+    LEFT JOIN votes ON votes.post_id = posts.id
+    GROUP BY posts.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A table rather than a view: posts get a zero row when created, so ranked
+    # listings can inner-join it without waiting for the next refresh
+    op.execute("DROP MATERIALIZED VIEW post_rankings")
+    op.create_table(
+        "post_rankings",
+        sa.Column(
+            "post_id",
+            sa.String(),
+            sa.ForeignKey("posts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("top_score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hot_score", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_post_rankings_top",
+        "post_rankings",
+        [sa.text("top_score DESC"), "post_id"],
+    )
+    op.create_index(
+        "ix_post_rankings_hot",
+        "post_rankings",
+        [sa.text("hot_score DESC"), "post_id"],
+    )
+    op.execute(f"INSERT INTO post_rankings (post_id, top_score, hot_score) {SCORES}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("post_rankings")
+    op.execute(f"CREATE MATERIALIZED VIEW post_rankings AS {SCORES} WITH DATA")
+    op.create_index(
+        "ix_post_rankings_post_id", "post_rankings", ["post_id"], unique=True
+    )
+    op.create_index(
+        "ix_post_rankings_top",
+        "post_rankings",
+        [sa.text("top_score DESC"), "post_id"],
+    )
+    op.create_index(
+        "ix_post_rankings_hot",
+        "post_rankings",
+        [sa.text("hot_score DESC"), "post_id"],
+    )
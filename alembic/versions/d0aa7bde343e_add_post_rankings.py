@@ -0,0 +1,73 @@
+"""add post rankings
+
+Revision ID: d0aa7bde343e
+Revises: 6d21a8891ab9
+Create Date: 2026-10-18 14:02:37.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0aa7bde343e"
+down_revision: Union[str, Sequence[str], None] = "6d21a8891ab9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing votes get the migration time, their real time is unknown
+    op.add_column(
+        "votes",
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+    # Scores behind GET /posts?sort=top|hot, as of the last refresh. "hot"
+    # sums votes decayed with a 24 hour half-life. Refreshed periodically by
+    # the API (see app.posts.composition.build_post_rankings_refresher).
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW post_rankings AS
+        SELECT
+            posts.id AS post_id,
+            count(votes.post_id) AS top_score,
+            coalesce(
+                sum(power(0.5, extract(epoch FROM now() - votes.created_at) / 86400)),
+                0
+            )::double precision AS hot_score
+        FROM posts
+        LEFT JOIN votes ON votes.post_id = posts.id
+        GROUP BY posts.id
+        WITH DATA
+        """
+    )
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "ix_post_rankings_post_id", "post_rankings", ["post_id"], unique=True
+    )
+    op.create_index(
+        "ix_post_rankings_top",
+        "post_rankings",
+        [sa.text("top_score DESC"), "post_id"],
+    )
+    op.create_index(
+        "ix_post_rankings_hot",
+        "post_rankings",
+        [sa.text("hot_score DESC"), "post_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW post_rankings")
+    op.drop_column("votes", "created_at")
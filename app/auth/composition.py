@@ -1,3 +1,5 @@
+from app.core.tracing import traced
+
 from .providers import JwtOAuth2TokenProvider
 from .repositories import AuthRepository
 from .routes import AuthRouter
@@ -6,9 +8,11 @@ from .use_cases import AuthenticateUserUseCase
 
 
 def build_auth_router():
-    repository = AuthRepository()
-    service = AuthService(repository)
-    token_provider = JwtOAuth2TokenProvider()
-    authenticate_user_use_case = AuthenticateUserUseCase(service, token_provider)
+    repository = traced(AuthRepository(), "repository")
+    service = traced(AuthService(repository), "service")
+    token_provider = traced(JwtOAuth2TokenProvider(), "provider")
+    authenticate_user_use_case = traced(
+        AuthenticateUserUseCase(service, token_provider), "use_case"
+    )
 
     return AuthRouter(authenticate_user_use_case).router
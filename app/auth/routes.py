@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from app.core.dependencies.database import get_db
+from app.core.dependencies.database import DatabaseSession, get_db
 
 from .exceptions import PasswordVerificationException, UserNotFoundException
 from .models import Token
@@ -18,18 +17,18 @@ class AuthRouter:
 
     # === Public Route Handlers ===
 
-    def login(
+    async def login(
         self,
         credentials: OAuth2PasswordRequestForm = Depends(),
-        db: Session = Depends(get_db),
+        db: DatabaseSession = Depends(get_db),
     ):
         try:
-            token: Token = self.authenticate_user_use_case.execute(
+            # The use case runs its own session steps, so the password check
+            # is awaited outside them
+            token: Token = await self.authenticate_user_use_case.execute(
                 db, credentials.username, credentials.password
             )
-            return TokenOut(
-                access_token=token.access_token, token_type=token.token_type
-            )
+            return TokenOut(access_token=token.access_token, token_type=token.token_type)
         except (UserNotFoundException, PasswordVerificationException):
             self._report_invalid_login()
 
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from sqlalchemy.orm import Session
 
+from app.core.dependencies.database import DatabaseSession, run_in_session
 from app.users.models import User
 
 from .exceptions import PasswordVerificationException, UserNotFoundException
@@ -11,7 +12,7 @@ from .utils import verify_password
 
 class AuthServiceABC(ABC):
     @abstractmethod
-    def authenticate_user(self, db, username: str, password: str) -> User:
+    async def authenticate_user(self, db, username: str, password: str) -> User:
         pass
 
 
@@ -19,13 +20,28 @@ class AuthService(AuthServiceABC):
     def __init__(self, repository: AuthRepositoryABC):
         self.repository = repository
 
-    def authenticate_user(self, db: Session, username: str, password: str) -> User:
-        user = self.repository.get_user_by_email(db, username)
+    async def authenticate_user(
+        self, db: DatabaseSession, username: str, password: str
+    ) -> User:
+        user = await run_in_session(
+            db, lambda session: self._find_user(session, username)
+        )
 
         if not user:
             raise UserNotFoundException()
 
-        if not verify_password(password, str(user.password)):
+        # Awaited on the event loop, outside the session: a login waiting for
+        # bcrypt holds neither a threadpool thread nor a connection
+        if not await verify_password(password, str(user.password)):
             raise PasswordVerificationException()
 
         return user
+
+    # === Private Helpers ===
+
+    def _find_user(self, db: Session, username: str) -> User | None:
+        user = self.repository.get_user_by_email(db, username)
+        # End the read transaction so its connection goes back to the pool;
+        # sessions do not expire objects on commit
+        db.commit()
+        return user
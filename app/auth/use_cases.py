@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from sqlalchemy.orm import Session
+from app.core.dependencies.database import DatabaseSession
 
 from .models import Token, TokenPayload
 from .providers import OAuth2TokenProviderABC
@@ -9,7 +9,7 @@ from .services import AuthServiceABC
 
 class AuthenticateUserUseCaseABC(ABC):
     @abstractmethod
-    def execute(self, db: Session, username: str, password: str) -> Token:
+    async def execute(self, db: DatabaseSession, username: str, password: str) -> Token:
         pass
 
 
@@ -22,8 +22,8 @@ class AuthenticateUserUseCase(AuthenticateUserUseCaseABC):
         self.auth_service = auth_service
         self.token_provider = token_provider
 
-    def execute(self, db: Session, username: str, password: str) -> Token:
-        user = self.auth_service.authenticate_user(db, username, password)
+    async def execute(self, db: DatabaseSession, username: str, password: str) -> Token:
+        user = await self.auth_service.authenticate_user(db, username, password)
         access_token = self.token_provider.create_access_token(
             payload=TokenPayload(user_id=str(user.id))
         )
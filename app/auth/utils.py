@@ -1,5 +1,7 @@
 from passlib.context import CryptContext
 
+from app.core.workers import password_hashing_pool
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -7,5 +9,15 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # if we change the implementation later, we can do so here directly.
 # Remember to keep this in sync with app/users/utils.py
 # Kept separate for clarity of concerns and to allow microservice separation.
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    # bcrypt takes ~250 ms of CPU, so it runs in the worker pool
+    return await password_hashing_pool.run(
+        _verify_password, plain_password, hashed_password
+    )
+
+
+# Helper functions
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache whose entries also expire after `ttl`
+    seconds.
+
+    `invalidate()` bumps a generation counter instead of walking the entries:
+    readers only see entries stored under the current generation, and older
+    ones age out through the LRU and TTL bounds. Callers that compute a value
+    should read `generation` before querying and pass it to `put()`, so a
+    value computed before a concurrent invalidation is never served after it.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    # === Public API ===
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry_key = (self._generation, key)
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[entry_key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(entry_key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is None:
+                generation = self._generation
+            if generation != self._generation:
+                return  # computed before an invalidation, already stale
+
+            entry_key = (generation, key)
+            self._entries[entry_key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop((self._generation, key), None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
@@ -1,4 +1,5 @@
 import os
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -6,16 +7,78 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # --- database
     database_url: str
+    database_stack: Literal["sync", "async"] = "sync"
+
+    # --- connection pools, per engine and process (see app/core/pool.py)
+    db_pool_size: int = 10  # connections kept open, also opened at startup
+    db_max_overflow: int = 10  # extra connections opened under load
+    db_pool_timeout: float = 10  # seconds to wait for a connection before a 503
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced, -1 never
+    db_pool_pre_ping: bool = True  # test connections on checkout
+    db_pool_warmup: bool = True
+
+    # --- read replicas (see app/core/replicas.py)
+    database_replica_urls: list[str] = []  # reads go to the primary when empty
+    replica_health_check_interval: float = 5  # seconds
+    read_your_writes_window: int = 5  # seconds reads stay on the primary, 0 disables
+
+    # --- query instrumentation (see app/core/query_stats.py)
+    slow_query_threshold_ms: float = 500  # 0 disables the slow query log
+    query_repeat_warning_threshold: int = 0  # e.g. 10 in development, 0 disables
+
+    # --- layer tracing (see app/core/tracing.py)
+    tracing_enabled: bool = False
+    tracing_export_path: str = "traces.jsonl"  # OTLP/JSON lines, one trace each
+
+    # --- request profiling (see app/core/profiling.py)
+    profiling_enabled: bool = False
+    profiling_token: str = ""  # admin secret sent as X-Profile-Token, empty disables
+    profiling_sample_rate: int = 0  # also profile 1 in N requests, 0 disables
+    profiling_interval: float = 0.001  # seconds between samples
+    profiling_max_entries: int = 50  # profiles kept per process
 
     # --- auth
     oauth_hash_key: str
     oauth_algorithm: str
-    oauth_token_ttl: int
+    oauth_token_ttl: int  # minutes
+
+    # --- current user cache (per process)
+    user_cache_enabled: bool = True
+    user_cache_ttl: float = 15  # seconds a change made elsewhere may go unseen
+    user_cache_max_entries: int = 10_000
+
+    # --- password hashing pool (per process)
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 64  # waiting calls before answering 503
+    password_hash_retry_after: int = 1  # seconds
 
     # --- pagination
     default_page_size: int
     max_page_size: int
 
+    # --- posts search
+    posts_search_strategy: Literal["fulltext", "ilike"] = "fulltext"
+
+    # --- posts summary reads (view=summary)
+    posts_excerpt_length: int = 200  # characters of content kept in excerpts
+
+    # --- posts batch reads (GET /posts/batch)
+    posts_batch_max_ids: int = 100
+
+    # --- posts bulk creation (POST /posts/bulk)
+    posts_bulk_max_items: int = 1000
+
+    # --- posts rankings (sort=top|hot)
+    posts_rankings_refresh_interval: float = 60  # seconds, 0 disables refreshing
+
+    # --- posts listing cache (per process)
+    posts_cache_enabled: bool = True
+    posts_cache_ttl: float = 30  # seconds
+    posts_cache_max_entries: int = 1024
+
+    # --- votes bulk submission (POST /votes/bulk)
+    votes_bulk_max_items: int = 1000
+
     model_config = {
         "env_file": ".env" if os.path.exists(".env") else None,
         "extra": "ignore",
@@ -1,23 +1,60 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
 
 from app.auth.providers import JwtOAuth2TokenProvider, OAuth2TokenProviderABC
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.users.models import User
 
-from .database import get_db
+from .database import (
+    REPLICA_SESSION,
+    DatabaseSession,
+    get_db,
+    get_read_db,
+    run_in_session,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+# Snapshots of authenticated users, so that most requests skip the users
+# lookup. Each worker process holds its own cache; see _forget_changed_users
+# for invalidation and for why snapshots only live user_cache_ttl seconds.
+user_cache = TTLCache(
+    max_size=settings.user_cache_max_entries, ttl=settings.user_cache_ttl
+)
+
 
 def get_token_provider() -> OAuth2TokenProviderABC:
     return JwtOAuth2TokenProvider()
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: DatabaseSession = Depends(get_db),
     token_provider: OAuth2TokenProviderABC = Depends(get_token_provider),
+) -> User:
+    return await _authenticate(token, db, token_provider)
+
+
+async def get_current_user_for_reads(
+    token: str = Depends(oauth2_scheme),
+    db: DatabaseSession = Depends(get_read_db),
+    token_provider: OAuth2TokenProviderABC = Depends(get_token_provider),
+) -> User:
+    """
+    get_current_user for read-only endpoints: the user is looked up (on a
+    cache miss) in the request's get_read_db session, possibly on a replica.
+    """
+    return await _authenticate(token, db, token_provider)
+
+
+# Helper functions
+
+
+async def _authenticate(
+    token: str, db: DatabaseSession, token_provider: OAuth2TokenProviderABC
 ) -> User:
     # TODO: Convert to a custom exception class and let the client to handle it
     credentials_exception = HTTPException(
@@ -27,7 +64,8 @@ def get_current_user(
     )
 
     payload = token_provider.verify_access_token(token, credentials_exception)
-    user = _fetch_user(str(payload.user_id), db)
+    user_id = str(payload.user_id)
+    user = await run_in_session(db, lambda session: _fetch_user(user_id, session))
 
     if not user:
         raise credentials_exception
@@ -35,11 +73,62 @@ def get_current_user(
     return user
 
 
-# Helper functions
+def _fetch_user(user_id: str, db: Session) -> User:
+    if settings.user_cache_enabled:
+        snapshot = user_cache.get(user_id)
+        if snapshot is not None:
+            # Attach a copy to this request's session without a SELECT
+            return db.merge(snapshot, load=False)
+
+    generation = user_cache.generation
+    user = db.query(User).filter(User.id == user_id).first()
+    # A lagging replica could still return a changed user after the cache
+    # was invalidated, so only primary reads are cached
+    if user and settings.user_cache_enabled and not db.info.get(REPLICA_SESSION):
+        user_cache.put(user_id, _snapshot(user), generation)
+    return user
 
 
-def _fetch_user(user_id: str, db: Session) -> User:
-    # TODO: Cache user lookups to avoid hitting the database on
-    # every request; use ACCESS_TOKEN_EXPIRE_MINUTES as cache expiry
+def _snapshot(user: User) -> User:
+    snapshot = User(
+        **{column.key: getattr(user, column.key) for column in User.__table__.columns}
+    )
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+# Cache invalidation: any committed change to a user (e.g. deactivation)
+# drops every cached snapshot. Dropping them all bumps the cache generation,
+# which also discards lookups that read the old row while the change was in
+# flight. Bulk UPDATE/DELETE statements bypass these ORM events; call
+# user_cache.invalidate() after issuing them.
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_changed_user(mapper, connection, user: User) -> None:
+    session = object_session(user)
+    if session is not None:
+        session.info["users_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_changed_users(session: Session) -> None:
+    """
+    Drop the snapshots when this process commits a change to a user.
+
+    Only this process sees the event: other workers, and changes made in plain
+    SQL (migrations, admin scripts, psql), are not signalled. Their snapshots
+    are bounded by the short user_cache_ttl instead, so a deactivated user
+    loses access within that many seconds everywhere. A version checked on
+    use would put a query back on every request, and pub/sub would need a
+    listener per process plus triggers to see plain SQL; the short TTL keeps
+    the cache's point, skipping the users lookup within a client's bursts.
+    """
+    if session.info.pop("users_changed", False):
+        user_cache.invalidate()
+
 
-    return db.query(User).filter(User.id == user_id).first()
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop("users_changed", None)
@@ -1,16 +1,181 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar
+
+from fastapi import Request
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.core.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    warm_up_pool,
+)
+from app.core.replicas import READ_PRIMARY_COOKIE, Replica, ReplicaSet, make_replica
+
+T = TypeVar("T")
+
+# A request's session: a plain Session on the sync stack, an AsyncSession on
+# the async one (see get_db and run_in_session)
+DatabaseSession = Session | AsyncSession
+
+# Session.info key set on sessions reading from a replica
+REPLICA_SESSION = "replica"
+
+# Set for one request by middlewares wrapping the session work it sends to
+# the threadpool (see ProfilingMiddleware): run_in_session then calls
+# hook(operation, db) there instead of operation(db)
+session_operation_hook: ContextVar[Callable[..., Any] | None] = ContextVar(
+    "session_operation_hook", default=None
+)
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Shared by the primary and replica engines
+_pool_options = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
+
+engine = create_engine(
+    settings.database_url, poolclass=InstrumentedQueuePool, **_pool_options
+)
+# Objects stay loaded after commit, so repositories can return rows fetched
+# with RETURNING without reloading them
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_stack == "async":
+    async_engine = create_async_engine(
+        make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **_pool_options,
+    )
+    # Also required here: route handlers serialize results on the event loop,
+    # where an expired attribute could not be refreshed
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def _create_replica(url: str) -> Replica:
+    # Same engine and session options as the primary, on the configured stack
+    if settings.database_stack == "async":
+        replica_engine = create_async_engine(
+            make_url(url).set(drivername="postgresql+asyncpg"),
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **_pool_options,
+        )
+        session_factory = async_sessionmaker(
+            replica_engine,
+            autoflush=False,
+            expire_on_commit=False,
+            info={REPLICA_SESSION: True},
+        )
+        return make_replica(url, replica_engine.sync_engine, session_factory)
+
+    replica_engine = create_engine(url, poolclass=InstrumentedQueuePool, **_pool_options)
+    session_factory = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=replica_engine,
+        info={REPLICA_SESSION: True},
+    )
+    return make_replica(url, replica_engine, session_factory)
+
 
-def get_db():
+read_replicas = ReplicaSet(
+    [_create_replica(url) for url in settings.database_replica_urls]
+)
+
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_db = get_async_db if settings.database_stack == "async" else get_sync_db
+
+
+# Read-only endpoints take their session from get_read_db: a replica when
+# there are healthy ones, else the primary. Objects read there must not be
+# written through another session.
+
+
+def get_sync_read_db(request: Request):
+    replica = _pick_read_replica(request)
+    db = replica.session_factory() if replica else SessionLocal()
+    try:
+        yield db
+    except OperationalError:
+        if replica:
+            read_replicas.mark_unhealthy(replica)
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    replica = _pick_read_replica(request)
+    async with (replica.session_factory if replica else AsyncSessionLocal)() as db:
+        try:
+            yield db
+        except OperationalError:
+            if replica:
+                read_replicas.mark_unhealthy(replica)
+            raise
+
+
+get_read_db = (
+    get_async_read_db if settings.database_stack == "async" else get_sync_read_db
+)
+
+
+async def warm_up_pools() -> None:
+    """Open the pool size's worth of connections on the primary and replicas."""
+    primary = async_engine.sync_engine if async_engine else engine
+    for pool_engine in [primary, *(replica.engine for replica in read_replicas.replicas)]:
+        await warm_up_pool(pool_engine, settings.db_pool_size)
+
+
+async def run_in_session(db: DatabaseSession, operation: Callable[[Session], T]) -> T:
+    """
+    Run `operation` (use case calls written against a sync Session) without
+    blocking the event loop.
+
+    On the async stack it runs through AsyncSession.run_sync, so every query
+    is awaited on asyncpg; on the sync stack it runs on the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(operation)
+    hook = session_operation_hook.get()
+    if hook is None:
+        return await run_in_threadpool(operation, db)
+    return await run_in_threadpool(hook, operation, db)
+
+
+# Helper functions
+
+
+def _pick_read_replica(request: Request) -> Replica | None:
+    # Clients that just wrote read from the primary (see ReadYourWritesMiddleware)
+    if request.cookies.get(READ_PRIMARY_COOKIE):
+        return None
+    return read_replicas.pick()
@@ -0,0 +1,2 @@
+class WorkerPoolSaturatedException(Exception):
+    pass
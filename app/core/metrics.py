@@ -0,0 +1,155 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import Engine, QueuePool, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Multiprocess mode (several uvicorn workers) is enabled the prometheus_client
+# way: PROMETHEUS_MULTIPROC_DIR must point to an empty directory before the
+# processes start, and every process writes its samples there
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being served.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Connections the pool keeps open.", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections opened beyond the pool size (negative while below it).",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent getting a connection from the pool (waiting, or connecting).",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after the pool timeout (answered with 503).",
+)
+
+WORKER_POOL_TASK_DURATION = Histogram(
+    "worker_pool_task_duration_seconds",
+    "Time spent running a task in a worker process (e.g. bcrypt).",
+    ["pool", "task"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5),
+)
+WORKER_POOL_QUEUE_WAIT = Histogram(
+    "worker_pool_queue_wait_seconds",
+    "Time a task waited for a free worker process.",
+    ["pool"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+WORKER_POOL_REJECTED = Counter(
+    "worker_pool_rejected_total",
+    "Tasks rejected because the worker pool queue was full.",
+    ["pool"],
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording count, latency and status code per route
+    template (e.g. /posts/{post_id}) and the number of requests in flight.
+
+    Requests that match no route share one label, so arbitrary paths cannot
+    blow up the metrics cardinality.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            HTTP_REQUEST_DURATION.labels(*labels).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(*labels, str(status_code)).inc()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Keep the pool gauges up to date as connections are checked out and in."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return  # e.g. NullPool or SQLite's pools keep no such counters
+
+    def on_checkout(*_):
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(pool.overflow())
+
+    def on_checkin(*_):
+        # Fired before the pool takes the connection back: account for it, and
+        # for the overflow connection closed when the pool is already full
+        closed = pool.checkedin() >= pool.size()
+        DB_POOL_CHECKED_OUT.set(pool.checkedout() - 1)
+        DB_POOL_OVERFLOW.set(pool.overflow() - closed)
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Samples in the text exposition format, with their content type."""
+    registry = REGISTRY
+    if MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this process' live gauges (in flight, pool) on shutdown."""
+    if MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,82 @@
+import logging
+import time
+
+from sqlalchemy import AsyncAdaptedQueuePool, Engine, QueuePool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from app.core.metrics import DB_POOL_TIMEOUTS, DB_POOL_WAIT
+from app.core.query_stats import record_pool_checkout
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedCheckoutMixin:
+    # Times Pool.connect, which engines call for every checkout: waiting for an
+    # idle connection, or opening one while below the pool size plus overflow
+    # (and the pre-ping, when enabled)
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            waited = time.perf_counter() - started
+            DB_POOL_TIMEOUTS.inc()
+            record_pool_checkout(waited, timed_out=True)
+            logger.warning(
+                "Timed out after %.1f ms waiting for a database connection "
+                "(%d checked out, pool size %d)",
+                waited * 1000,
+                self.checkedout(),
+                self.size(),
+            )
+            raise
+        waited = time.perf_counter() - started
+        DB_POOL_WAIT.observe(waited)
+        record_pool_checkout(waited)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool reporting checkout waits and timeouts (metrics, query stats)."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """The async stack's InstrumentedQueuePool."""
+
+
+async def warm_up_pool(engine: Engine, connections: int) -> None:
+    """
+    Open `connections` connections and return them to the pool, so the first
+    requests do not pay for connecting. Failures are logged, not raised: the
+    pool connects on demand anyway.
+    """
+    try:
+        if engine.dialect.is_async:
+            async_engine = AsyncEngine(engine)
+            opened = []
+            try:
+                for _ in range(connections):
+                    opened.append(await async_engine.connect())
+            finally:
+                for connection in opened:
+                    await connection.close()
+        else:
+            await run_in_threadpool(_warm_up_sync_pool, engine, connections)
+    except (SQLAlchemyError, OSError):
+        logger.warning("Could not warm up the pool of %s", engine.url, exc_info=True)
+
+
+# Helper functions
+
+
+def _warm_up_sync_pool(engine: Engine, connections: int) -> None:
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
@@ -0,0 +1,266 @@
+import hmac
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from pyinstrument import Profiler
+from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+from pyinstrument.session import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.dependencies.database import session_operation_hook
+
+T = TypeVar("T")
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+RENDERERS = {"speedscope": SpeedscopeRenderer, "html": HTMLRenderer}
+
+
+@dataclass
+class ProfileEntry:
+    id: int
+    method: str
+    route: str
+    status: int
+    duration_ms: float
+    sampled: bool  # picked by the 1-in-N sampler, rather than requested
+    session: Session = field(repr=False)
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": round(self.duration_ms, 2),
+            "sampled": self.sampled,
+        }
+
+
+class ProfileStore:
+    """Thread-safe ring buffer keeping the last `max_entries` request profiles."""
+
+    def __init__(self, max_entries: int):
+        self._entries: deque[ProfileEntry] = deque(maxlen=max_entries)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def new_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+    def add(self, entry: ProfileEntry) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def get(self, profile_id: int) -> ProfileEntry | None:
+        with self._lock:
+            return next(
+                (entry for entry in self._entries if entry.id == profile_id), None
+            )
+
+    def list(self) -> list[ProfileEntry]:
+        with self._lock:
+            return list(self._entries)
+
+    def aggregate(self, method: str, route: str) -> Session | None:
+        """The kept profiles of one route combined into a single session."""
+        with self._lock:
+            sessions = [
+                entry.session
+                for entry in self._entries
+                if entry.method == method and entry.route == route
+            ]
+        return _combine(sessions)
+
+
+def render_profile(session: Session, profile_format: str) -> str:
+    return RENDERERS[profile_format]().render(session)
+
+
+class _RequestProfile:
+    # Sessions recorded on threadpool threads while the request runs
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.thread_sessions: list[Session] = []
+        self.lock = threading.Lock()
+
+    def run(self, operation: Callable[..., T], *args: Any) -> T:
+        # The request profiler only samples the event loop thread, so session
+        # work sent to the threadpool is profiled here (see run_in_session)
+        profiler = Profiler(interval=self.interval, async_mode="disabled")
+        profiler.start()
+        try:
+            return operation(*args)
+        finally:
+            session = profiler.stop()
+            with self.lock:
+                self.thread_sessions.append(session)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling single requests with pyinstrument, a sampling
+    profiler, and keeping the profiles in a ProfileStore.
+
+    A request is profiled when it carries the admin `X-Profile-Token` header
+    (its response then gets an `X-Profile-Id` header), or when it is picked
+    by the 1-in-`sample_rate` sampler. Other requests only pay for a header
+    lookup and a random draw. Profiled requests also set the session operation
+    hook, so their database work on the threadpool lands in the profile.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        token: str,
+        sample_rate: int = 0,
+        interval: float = 0.001,
+    ):
+        self.app = app
+        self._store = store
+        self._token = token
+        self._sample_rate = sample_rate
+        self._interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = is_profile_token_valid(
+            _header(scope, PROFILE_TOKEN_HEADER), self._token
+        )
+        sampled = (
+            not requested
+            and self._sample_rate > 0
+            and random.randrange(self._sample_rate) == 0
+        )
+        if not (requested or sampled):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self._store.new_id()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if requested:
+                    MutableHeaders(scope=message)[PROFILE_ID_HEADER] = str(profile_id)
+            await send(message)
+
+        request_profile = _RequestProfile(self._interval)
+        hook_token = session_operation_hook.set(request_profile.run)
+        profiler = Profiler(interval=self._interval, async_mode="enabled")
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            duration_ms = (time.perf_counter() - started) * 1000
+            session_operation_hook.reset(hook_token)
+            route = scope.get("route")
+            self._store.add(
+                ProfileEntry(
+                    id=profile_id,
+                    method=scope["method"],
+                    route=getattr(route, "path", scope["path"]),
+                    status=status_code,
+                    duration_ms=duration_ms,
+                    sampled=sampled,
+                    session=_combine([session, *request_profile.thread_sessions]),
+                )
+            )
+
+
+def admin_token_guard(token: str) -> Callable[..., None]:
+    """
+    Dependency answering 404, as if the route did not exist, unless the
+    request carries the admin `token` in its `X-Profile-Token` header.
+    """
+
+    def require_admin_token(
+        candidate: str | None = Header(None, alias=PROFILE_TOKEN_HEADER),
+    ) -> None:
+        if not is_profile_token_valid(candidate, token):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    return require_admin_token
+
+
+def build_profiles_router(store: ProfileStore, token: str) -> APIRouter:
+    """Admin endpoints listing and downloading the profiles kept in `store`."""
+    router = APIRouter(
+        prefix="/internal/profiles",
+        include_in_schema=False,
+        dependencies=[Depends(admin_token_guard(token))],
+    )
+
+    @router.get("")
+    def list_profiles():
+        return {"data": [entry.summary() for entry in store.list()]}
+
+    # Declared before /{profile_id}, which would otherwise match "aggregate"
+    @router.get("/aggregate")
+    def aggregate_profiles(method: str, route: str, format: str = "speedscope"):
+        session = store.aggregate(method.upper(), route)
+        if session is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        return _profile_response(session, format)
+
+    @router.get("/{profile_id}")
+    def get_profile(profile_id: int, format: str = "speedscope"):
+        entry = store.get(profile_id)
+        if entry is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        return _profile_response(entry.session, format)
+
+    return router
+
+
+def is_profile_token_valid(candidate: str | None, token: str) -> bool:
+    # An empty token disables on-demand profiling altogether
+    if not token or candidate is None:
+        return False
+    return hmac.compare_digest(candidate.encode(), token.encode())
+
+
+# Helper functions
+
+
+def _header(scope: Scope, name: str) -> str | None:
+    name_bytes = name.lower().encode()
+    for key, value in scope["headers"]:
+        if key == name_bytes:
+            return value.decode("latin-1")
+    return None
+
+
+def _profile_response(session: Session, profile_format: str) -> Response:
+    if profile_format not in RENDERERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"format must be one of {', '.join(RENDERERS)}",
+        )
+    media_type = "text/html" if profile_format == "html" else "application/json"
+    return Response(render_profile(session, profile_format), media_type=media_type)
+
+
+def _combine(sessions: list[Session]) -> Session | None:
+    if not sessions:
+        return None
+    combined = sessions[0]
+    for session in sessions[1:]:
+        combined = Session.combine(combined, session)
+    return combined
@@ -0,0 +1,169 @@
+import logging
+import time
+import warnings
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "?"
+
+
+class RepeatedQueryWarning(UserWarning):
+    """The same statement ran many times in one request (likely an N+1)."""
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    duration: float = 0.0  # seconds
+    shapes: Counter[str] = field(default_factory=Counter)
+    pool_wait: float = 0.0  # seconds spent getting connections from the pool
+    pool_timeouts: int = 0
+
+
+# Stats of the request being served. Sessions run on the threadpool or in a
+# greenlet, both of which see the request's context.
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def instrument_queries(
+    engine: Engine, slow_query_threshold: float = 0, repeat_threshold: int = 0
+) -> None:
+    """
+    Count statements and database time per request, log statements slower
+    than `slow_query_threshold` seconds (with redacted parameters) and warn
+    when one statement runs more than `repeat_threshold` times in a request.
+    Zero disables the log and the warning.
+    """
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+
+        if slow_query_threshold and elapsed >= slow_query_threshold:
+            redacted = _redact(parameters)
+            logger.warning(
+                "Slow query (%.1f ms): %s; parameters: %s",
+                elapsed * 1000,
+                statement,
+                redacted,
+                extra={
+                    "db_duration_ms": round(elapsed * 1000, 2),
+                    "db_statement": statement,
+                    "db_parameters": redacted,
+                },
+            )
+
+        stats = _current_stats.get()
+        if stats is None:
+            return  # outside a request, e.g. a periodic task
+        stats.statements += 1
+        stats.duration += elapsed
+        stats.shapes[statement] += 1
+        # Warn once, when the threshold is crossed
+        if repeat_threshold and stats.shapes[statement] == repeat_threshold + 1:
+            warnings.warn(
+                f"Statement ran more than {repeat_threshold} times in one request, "
+                f"consider eager loading or batching: {statement}",
+                RepeatedQueryWarning,
+            )
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def record_pool_checkout(waited: float, timed_out: bool = False) -> None:
+    """Add a pool checkout (see app/core/pool.py) to the current request's stats."""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.pool_wait += waited
+    stats.pool_timeouts += timed_out
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware collecting the query stats of each request. They are sent
+    as a Server-Timing header (`db;dur=<ms>;desc="<n> statements"`, and
+    `pool;dur=<ms>` for the time spent getting connections) and logged with
+    structured fields once the request is done.
+
+    Statements run after the response has started (e.g. in dependency
+    teardown) only appear in the log.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", _server_timing(stats, started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            route = scope.get("route")
+            logger.info(
+                "%s %s %s: %d statements in %.1f ms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                stats.statements,
+                stats.duration * 1000,
+                extra={
+                    "http_method": scope["method"],
+                    "http_route": getattr(route, "path", None),
+                    "http_status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    "db_statements": stats.statements,
+                    "db_duration_ms": round(stats.duration * 1000, 2),
+                    "db_pool_wait_ms": round(stats.pool_wait * 1000, 2),
+                    "db_pool_timeouts": stats.pool_timeouts,
+                },
+            )
+
+
+# Helper functions
+
+
+def _server_timing(stats: QueryStats, started: float) -> str:
+    return (
+        f'db;dur={stats.duration * 1000:.2f};desc="{stats.statements} statements", '
+        f"pool;dur={stats.pool_wait * 1000:.2f}, "
+        f"app;dur={(time.perf_counter() - started) * 1000:.2f}"
+    )
+
+
+def _redact(parameters):
+    # Keep the shape (names, row count) so the statement can be reproduced
+    if isinstance(parameters, dict):
+        return {name: REDACTED for name in parameters}
+    if isinstance(parameters, (list, tuple)):
+        return [
+            _redact(row) if isinstance(row, (dict, list, tuple)) else REDACTED
+            for row in parameters
+        ]
+    return REDACTED
@@ -0,0 +1,114 @@
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy import Engine, create_engine, make_url, text
+from sqlalchemy.pool import NullPool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Set after a successful write, so the client's next reads see it (see
+# ReadYourWritesMiddleware)
+READ_PRIMARY_COOKIE = "read_primary"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@dataclass
+class Replica:
+    name: str  # the URL without its password, for logs
+    engine: Engine  # sync view of the engine, for instrumentation
+    session_factory: Callable[[], Any]
+    ping: Callable[[], object]
+    healthy: bool = True
+
+
+class ReplicaSet:
+    """
+    Read replicas picked round-robin, skipping the unhealthy ones. Replicas
+    are marked unhealthy when a ping or a read fails, and healthy again once
+    check_health() reaches them.
+    """
+
+    def __init__(self, replicas: list[Replica]):
+        self.replicas = replicas
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self) -> Replica | None:
+        """The next healthy replica, or None to read from the primary."""
+        if not self.replicas:
+            return None
+        with self._lock:
+            start = next(self._turns)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica.healthy:
+                return replica
+        return None
+
+    def check_health(self) -> None:
+        for replica in self.replicas:
+            try:
+                replica.ping()
+            except Exception:
+                self.mark_unhealthy(replica)
+            else:
+                if not replica.healthy:
+                    logger.warning("Read replica %s is healthy again", replica.name)
+                replica.healthy = True
+
+    def mark_unhealthy(self, replica: Replica) -> None:
+        if replica.healthy:
+            logger.warning(
+                "Read replica %s is unhealthy, its reads go to the others",
+                replica.name,
+            )
+        replica.healthy = False
+
+
+def make_replica(url: str, engine: Engine, session_factory: Callable[[], Any]) -> Replica:
+    """
+    A replica reading through `session_factory` and pinged over a separate,
+    unpooled sync connection (so pings work the same on both database stacks).
+    """
+    ping_engine = create_engine(url, poolclass=NullPool)
+
+    def ping():
+        with ping_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    name = make_url(url).render_as_string(hide_password=True)
+    return Replica(name=name, engine=engine, session_factory=session_factory, ping=ping)
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware setting a short-lived `read_primary` cookie on successful
+    writes. get_read_db sends the reads of clients holding it to the primary,
+    so they see their own writes despite replication lag.
+    """
+
+    def __init__(self, app: ASGIApp, window: int):
+        self.app = app
+        self._cookie = (
+            f"{READ_PRIMARY_COOKIE}=1; Max-Age={window}; Path=/; HttpOnly; SameSite=Lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("Set-Cookie", self._cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,19 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson, for handlers that build their payload
+    from plain dicts shaped like their response model.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder pass, so the payload must already match the schema; the
+    route keeps declaring response_model for the OpenAPI document. Datetimes
+    use a `Z` suffix for UTC, like Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
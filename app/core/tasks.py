@@ -0,0 +1,43 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Runs `task` every `interval` seconds on a daemon thread, between start()
+    and stop(). Failures are logged and retried on the next run.
+    """
+
+    def __init__(self, name: str, interval: float, task: Callable[[], object]):
+        self._name = name
+        self._interval = interval
+        self._task = task
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # === Public API ===
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # === Private Helpers ===
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._task()
+            except Exception:
+                logger.exception("Periodic task %s failed", self._name)
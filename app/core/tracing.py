@@ -0,0 +1,322 @@
+import functools
+import inspect
+import json
+import os
+import queue
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+SERVICE_NAME = "fastapi-demo"
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, str] = field(default_factory=dict)
+    error: bool = False
+
+
+@dataclass
+class Trace:
+    spans: list[Span] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# The open span of the request being traced, and the trace collecting spans.
+# Like the query stats, they reach the threadpool and AsyncSession.run_sync.
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+
+
+class SpanRecorder:
+    """Context manager opening a child span of the current one, if any."""
+
+    def __init__(self, name: str, attributes: dict[str, str] | None = None):
+        self._name = name
+        self._attributes = attributes or {}
+        self._span: Span | None = None
+        self._token = None
+
+    def __enter__(self) -> Span | None:
+        parent, trace = _current_span.get(), _current_trace.get()
+        if parent is None or trace is None:
+            return None  # not tracing this request
+        self._span = Span(
+            trace_id=parent.trace_id,
+            span_id=_new_id(8),
+            parent_id=parent.span_id,
+            name=self._name,
+            start_ns=time.time_ns(),
+            attributes=self._attributes,
+        )
+        with trace.lock:
+            trace.spans.append(self._span)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, *_):
+        if self._span is None:
+            return
+        self._span.end_ns = time.time_ns()
+        self._span.error = exc_type is not None
+        _current_span.reset(self._token)
+
+
+class TracingProxy:
+    """
+    Wraps a collaborator (use case, service, policy, repository) so every
+    public method call is recorded as a span named `<layer> <Class>.<method>`.
+    """
+
+    def __init__(self, target: Any, layer: str):
+        self._target = target
+        self._layer = layer
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        span_name = f"{self._layer} {type(self._target).__name__}.{name}"
+
+        if inspect.iscoroutinefunction(attribute):
+            # The span has to stay open until the coroutine finishes
+
+            @functools.wraps(attribute)
+            async def traced_async_call(*args, **kwargs):
+                with SpanRecorder(span_name, {"layer": self._layer}):
+                    return await attribute(*args, **kwargs)
+
+            return traced_async_call
+
+        @functools.wraps(attribute)
+        def traced_call(*args, **kwargs):
+            with SpanRecorder(span_name, {"layer": self._layer}):
+                return attribute(*args, **kwargs)
+
+        return traced_call
+
+
+def traced(target: T, layer: str) -> T:
+    """Wrap `target` in a TracingProxy when tracing is enabled."""
+    if not settings.tracing_enabled:
+        return target
+    return TracingProxy(target, layer)  # type: ignore[return-value]
+
+
+class FileSpanExporter:
+    """
+    Appends each finished trace to a file as one line of OTLP/JSON (an
+    ExportTraceServiceRequest), the format of the OpenTelemetry Collector's
+    file exporter.
+
+    `export` only queues the trace: a background thread serializes queued
+    traces and appends them in batches, so requests never wait on the file.
+    Traces exported while `max_queue` are already waiting are dropped.
+    """
+
+    def __init__(self, path: str, max_queue: int = 10_000, batch_size: int = 100):
+        self._path = path
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        self._start_writer()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            pass
+
+    def shutdown(self) -> None:
+        """Write the queued traces, then stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    # === Private Helpers ===
+
+    def _start_writer(self) -> None:
+        # Started on first use, like the worker pools
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_batches, name="span-exporter", daemon=True
+                )
+                self._writer.start()
+
+    def _write_batches(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [
+                json.dumps(_to_otlp(spans), separators=(",", ":")) + "\n"
+                for spans in batch
+                if spans is not None
+            ]
+            if lines:
+                with open(self._path, "a") as file:
+                    file.writelines(lines)
+            if batch[-1] is None:
+                return
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root span of each request and exporting the
+    finished trace. The time between the last layer span and the start of
+    the response is recorded as a `serialize response` span.
+    """
+
+    def __init__(self, app: ASGIApp, exporter: FileSpanExporter):
+        self.app = app
+        self._exporter = exporter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        root = Span(
+            trace_id=_new_id(16),
+            span_id=_new_id(8),
+            parent_id=None,
+            name=f"{scope['method']} {scope['path']}",
+            start_ns=time.time_ns(),
+        )
+        trace.spans.append(root)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root)
+        response_started_ns = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started_ns
+            if message["type"] == "http.response.start":
+                response_started_ns = time.time_ns()
+                root.attributes["http.status_code"] = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            root.end_ns = time.time_ns()
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+            _add_serialization_span(trace, root, response_started_ns)
+            self._exporter.export(trace.spans)
+
+
+def instrument_engine_tracing(engine: Engine) -> None:
+    """Record every statement as a `db` span under the current span."""
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        recorder = SpanRecorder(
+            f"db {statement.split(None, 1)[0]}", {"db.statement": statement}
+        )
+        recorder.__enter__()
+        context._span_recorder = recorder
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._span_recorder.__exit__(None, None, None)
+
+    def handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        recorder = getattr(exception_context.execution_context, "_span_recorder", None)
+        if recorder is not None:
+            recorder.__exit__(type(exception_context.original_exception), None, None)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+
+
+# Helper functions
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+def _add_serialization_span(trace: Trace, root: Span, response_started_ns: int):
+    children = [span for span in trace.spans if span.parent_id == root.span_id]
+    if not children or not response_started_ns:
+        return
+    last_end_ns = max(span.end_ns for span in children)
+    if response_started_ns > last_end_ns:
+        trace.spans.append(
+            Span(
+                trace_id=root.trace_id,
+                span_id=_new_id(8),
+                parent_id=root.span_id,
+                name="serialize response",
+                start_ns=last_end_ns,
+                end_ns=response_started_ns,
+                attributes={"layer": "route"},
+            )
+        )
+
+
+def _to_otlp(spans: list[Span]) -> dict:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", SERVICE_NAME)]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _otlp_span(span: Span) -> dict:
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 2 if span.parent_id is None else 1,  # SERVER, INTERNAL
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            _otlp_attribute(key, value) for key, value in span.attributes.items()
+        ],
+        "status": {"code": 2 if span.error else 0},  # ERROR, UNSET
+    }
+    if span.parent_id is not None:
+        otlp_span["parentSpanId"] = span.parent_id
+    return otlp_span
+
+
+def _otlp_attribute(key: str, value: str) -> dict:
+    return {"key": key, "value": {"stringValue": value}}
@@ -0,0 +1,145 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import WorkerPoolSaturatedException
+from app.core.metrics import (
+    WORKER_POOL_QUEUE_WAIT,
+    WORKER_POOL_REJECTED,
+    WORKER_POOL_TASK_DURATION,
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class WorkerPoolStats:
+    workers: int
+    in_flight: int
+    completed: int
+    rejected: int
+    queue_wait_seconds_total: float
+    queue_wait_seconds_max: float
+    run_seconds_total: float
+    run_seconds_max: float
+
+
+class BoundedProcessPool:
+    """
+    Process pool for CPU-bound calls (bcrypt) that keeps them off the request
+    threadpool and the event loop.
+
+    At most `workers` calls run at once and `max_queue` more may wait;
+    anything beyond that fails fast with WorkerPoolSaturatedException instead
+    of queueing unboundedly. Callers await the result on the event loop, so a
+    queued call holds neither a threadpool thread nor a database connection.
+
+    Timings are also exported as metrics labelled with the pool `name` and
+    the task (function) name.
+    """
+
+    def __init__(self, workers: int, max_queue: int, name: str = "default"):
+        self._name = name
+        self._workers = workers
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    # === Public API ===
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            WORKER_POOL_REJECTED.labels(self._name).inc()
+            raise WorkerPoolSaturatedException()
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            submitted_at = time.monotonic()
+            future = self._get_executor().submit(_timed_call, fn, *args)
+            started_at, run_seconds, result = await asyncio.wrap_future(future)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+        self._record(fn.__name__, started_at - submitted_at, run_seconds)
+        return result
+
+    def stats(self) -> WorkerPoolStats:
+        with self._lock:
+            return WorkerPoolStats(
+                workers=self._workers,
+                in_flight=self._in_flight,
+                completed=self._completed,
+                rejected=self._rejected,
+                queue_wait_seconds_total=self._queue_wait_total,
+                queue_wait_seconds_max=self._queue_wait_max,
+                run_seconds_total=self._run_total,
+                run_seconds_max=self._run_max,
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    # === Private Helpers ===
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Started on first use; spawned rather than forked, so workers do not
+        # inherit the parent's threads, locks or database connections
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _record(self, task: str, queue_wait: float, run_seconds: float) -> None:
+        # Clocks are comparable across processes: time.monotonic() is
+        # system-wide on Linux
+        queue_wait = max(queue_wait, 0.0)
+        WORKER_POOL_QUEUE_WAIT.labels(self._name).observe(queue_wait)
+        WORKER_POOL_TASK_DURATION.labels(self._name, task.lstrip("_")).observe(
+            run_seconds
+        )
+        with self._lock:
+            self._completed += 1
+            self._queue_wait_total += queue_wait
+            self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+            self._run_total += run_seconds
+            self._run_max = max(self._run_max, run_seconds)
+
+
+# Shared by password hashing (users) and verification (auth)
+password_hashing_pool = BoundedProcessPool(
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+    name="password_hashing",
+)
+
+
+# Helper functions
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[float, float, T]:
+    started_at = time.monotonic()
+    result = fn(*args)
+    return started_at, time.monotonic() - started_at, result
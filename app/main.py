@@ -1,11 +1,54 @@
-from fastapi import FastAPI, Request, status
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from fastapi import Depends, FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
 from . import auth, posts, users, votes
+from .core.cache import TTLCache
+from .core.config import settings
+from .core.dependencies.database import (
+    async_engine,
+    engine,
+    read_replicas,
+    warm_up_pools,
+)
+from .core.exceptions import WorkerPoolSaturatedException
+from .core.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    mark_process_dead,
+    render_metrics,
+)
+from .core.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    admin_token_guard,
+    build_profiles_router,
+)
+from .core.query_stats import QueryStatsMiddleware, instrument_queries
+from .core.replicas import ReadYourWritesMiddleware
+from .core.tasks import PeriodicTask
+from .core.tracing import FileSpanExporter, TracingMiddleware, instrument_engine_tracing
+from .core.workers import password_hashing_pool
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Connect before serving, then run the startup and shutdown handlers the
+    # features register with add_event_handler
+    if settings.db_pool_warmup:
+        await warm_up_pools()
+    await app.router.startup()
+    yield
+    await app.router.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_event_handler("shutdown", password_hashing_pool.shutdown)
+app.add_event_handler("shutdown", mark_process_dead)
 
 # Allowed origins for CORS
 allowed_origins = [
@@ -21,6 +64,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.profiling_enabled:
+    profile_store = ProfileStore(max_entries=settings.profiling_max_entries)
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        token=settings.profiling_token,
+        sample_rate=settings.profiling_sample_rate,
+        interval=settings.profiling_interval,
+    )
+    app.include_router(build_profiles_router(profile_store, settings.profiling_token))
+if read_replicas and settings.read_your_writes_window > 0:
+    app.add_middleware(ReadYourWritesMiddleware, window=settings.read_your_writes_window)
+if settings.tracing_enabled:
+    span_exporter = FileSpanExporter(settings.tracing_export_path)
+    app.add_middleware(TracingMiddleware, exporter=span_exporter)
+    app.add_event_handler("shutdown", span_exporter.shutdown)
+app.add_middleware(QueryStatsMiddleware)
+# Added last, so it is the outermost middleware and times the whole request
+app.add_middleware(MetricsMiddleware)
+
+active_engine = async_engine.sync_engine if async_engine else engine
+instrument_engine(active_engine)
+# Statements read from replicas count towards the request's stats and traces
+for instrumented_engine in [active_engine, *(r.engine for r in read_replicas.replicas)]:
+    instrument_queries(
+        instrumented_engine,
+        slow_query_threshold=settings.slow_query_threshold_ms / 1000,
+        repeat_threshold=settings.query_repeat_warning_threshold,
+    )
+    if settings.tracing_enabled:
+        instrument_engine_tracing(instrumented_engine)
+
+if read_replicas:
+    replica_health_checker = PeriodicTask(
+        "replica-health-checker",
+        settings.replica_health_check_interval,
+        read_replicas.check_health,
+    )
+    app.add_event_handler("startup", replica_health_checker.start)
+    app.add_event_handler("shutdown", replica_health_checker.stop)
+
 
 # As per ADR-0004: centralized exception handling for infrastructure errors
 @app.exception_handler(SQLAlchemyError)
@@ -31,8 +115,55 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     )
 
 
+@app.exception_handler(WorkerPoolSaturatedException)
+async def worker_pool_saturated_exception_handler(
+    request: Request, exc: WorkerPoolSaturatedException
+):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy. Please try again later."},
+        headers={"Retry-After": str(settings.password_hash_retry_after)},
+    )
+
+
+# Shared by posts (listings) and votes (invalidation on every vote)
+posts_cache = (
+    TTLCache(max_size=settings.posts_cache_max_entries, ttl=settings.posts_cache_ttl)
+    if settings.posts_cache_enabled
+    else None
+)
+
+
+# Internal numbers for admins, who send the profiling token (404 otherwise)
+require_admin_token = admin_token_guard(settings.profiling_token)
+
+
+@app.get(
+    "/internal/cache-stats",
+    include_in_schema=False,
+    dependencies=[Depends(require_admin_token)],
+)
+def cache_stats():
+    return {"posts": asdict(posts_cache.stats()) if posts_cache else None}
+
+
+@app.get(
+    "/internal/worker-stats",
+    include_in_schema=False,
+    dependencies=[Depends(require_admin_token)],
+)
+def worker_stats():
+    return {"password_hashing": asdict(password_hashing_pool.stats())}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
+
+
 # Mount feature routers
-posts.init_service(app)
+posts.init_service(app, posts_cache)
 users.init_service(app)
 auth.init_service(app)
-votes.init_service(app)
+votes.init_service(app, posts_cache)
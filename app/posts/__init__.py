@@ -1,5 +1,11 @@
-from app.posts.composition import build_posts_router
+from app.core.config import settings
+from app.posts.composition import build_post_rankings_refresher, build_posts_router
 
 
-def init_service(app):
-    app.include_router(build_posts_router())
+def init_service(app, posts_cache=None):
+    app.include_router(build_posts_router(posts_cache))
+
+    if settings.posts_rankings_refresh_interval > 0:
+        rankings_refresher = build_post_rankings_refresher()
+        app.add_event_handler("startup", rankings_refresher.start)
+        app.add_event_handler("shutdown", rankings_refresher.stop)
@@ -1,32 +1,87 @@
 from fastapi import APIRouter
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.dependencies.database import SessionLocal
+from app.core.tasks import PeriodicTask
+from app.core.tracing import traced
+
 from .policies import PostPolicy
-from .repositories import PostRepository
+from .repositories import SEARCH_STRATEGIES, PostRepository
 from .routes import PostsRoutes
 from .services import PostService
 from .use_cases import (
+    CachedGetPostsByCursorUseCase,
+    CachedGetPostsUseCase,
+    CreatePostsUseCase,
     CreatePostUseCase,
     DeletePostUseCase,
     GetPostByIdUseCase,
+    GetPostsByCursorUseCase,
+    GetPostsByIdsUseCase,
     GetPostsUseCase,
     UpdatePostUseCase,
 )
 
 
-def build_posts_router() -> APIRouter:
-    post_repository = PostRepository()
-    post_policy = PostPolicy()
-    post_service = PostService(post_repository, post_policy)
-    get_posts_use_case = GetPostsUseCase(post_service)
-    create_post_use_case = CreatePostUseCase(post_service)
-    get_post_by_id_use_case = GetPostByIdUseCase(post_service)
-    update_post_use_case = UpdatePostUseCase(post_service)
-    delete_post_use_case = DeletePostUseCase(post_service)
+def build_posts_router(posts_cache: TTLCache | None = None) -> APIRouter:
+    search_strategy = SEARCH_STRATEGIES[settings.posts_search_strategy]()
+    post_repository = traced(
+        PostRepository(search_strategy, settings.posts_excerpt_length), "repository"
+    )
+    post_policy = traced(PostPolicy(), "policy")
+    post_service = traced(PostService(post_repository, post_policy), "service")
+    get_posts_use_case = traced(GetPostsUseCase(post_service), "use_case")
+    get_posts_by_cursor_use_case = traced(
+        GetPostsByCursorUseCase(post_service), "use_case"
+    )
+    if posts_cache is not None:
+        get_posts_use_case = traced(
+            CachedGetPostsUseCase(get_posts_use_case, posts_cache, post_service),
+            "use_case",
+        )
+        get_posts_by_cursor_use_case = traced(
+            CachedGetPostsByCursorUseCase(
+                get_posts_by_cursor_use_case, posts_cache, post_service
+            ),
+            "use_case",
+        )
+    create_post_use_case = traced(
+        CreatePostUseCase(post_service, posts_cache), "use_case"
+    )
+    create_posts_use_case = traced(
+        CreatePostsUseCase(post_service, posts_cache), "use_case"
+    )
+    get_post_by_id_use_case = traced(GetPostByIdUseCase(post_service), "use_case")
+    get_posts_by_ids_use_case = traced(GetPostsByIdsUseCase(post_service), "use_case")
+    update_post_use_case = traced(
+        UpdatePostUseCase(post_service, posts_cache), "use_case"
+    )
+    delete_post_use_case = traced(
+        DeletePostUseCase(post_service, posts_cache), "use_case"
+    )
 
     return PostsRoutes(
         get_posts_use_case,
+        get_posts_by_cursor_use_case,
         create_post_use_case,
+        create_posts_use_case,
         get_post_by_id_use_case,
+        get_posts_by_ids_use_case,
         update_post_use_case,
         delete_post_use_case,
     ).router
+
+
+def build_post_rankings_refresher() -> PeriodicTask:
+    post_repository = PostRepository()
+
+    def refresh_rankings():
+        with SessionLocal() as db:
+            post_repository.refresh_rankings(db)
+
+    return PeriodicTask(
+        "post-rankings-refresher",
+        settings.posts_rankings_refresh_interval,
+        refresh_rankings,
+    )
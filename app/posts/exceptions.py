@@ -1,2 +1,10 @@
 class ForbiddenException(Exception):
     pass
+
+
+class InvalidCursorException(Exception):
+    pass
+
+
+class PostsNotCreatedException(Exception):
+    pass
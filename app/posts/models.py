@@ -1,28 +1,154 @@
 import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    case,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import query_expression, relationship
 from sqlalchemy.sql.sqltypes import TIMESTAMP
 
 from app.core.dependencies.database import Base
 
+# Full-text document for posts search: a stored generated column,
+# to_tsvector('english', title || ' ' || content), added by migration
+# 5c2f8e4b9a71 and indexed by ix_posts_search_vector. Postgres-only, so it is
+# not mapped on Post (SQLite test databases have no to_tsvector); alembic/env.py
+# keeps autogenerate from dropping it.
+search_vector = literal_column("posts.search_vector", type_=TSVECTOR)
+
+
+def excerpt(content, length: int):
+    # The first `length` characters of content, with an ellipsis when cut.
+    # Postgres only reads (and decompresses) the start of long values.
+    head = func.substr(content, 1, length + 1, type_=String)
+    cut = func.substr(content, 1, length, type_=String) + "..."
+    return case((func.length(head) > length, cut), else_=head)
+
 
 class Post(Base):
     __tablename__ = "posts"
 
     id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    owner_id = Column(
-        String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
-    )
+    owner_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=False)
     content = Column(String, nullable=False)
     published = Column(Boolean, server_default="TRUE")
     rating = Column(Integer, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default="now()")
+    # Denormalized count of votes, kept in sync by the votes repository
+    votes_count = Column(Integer, nullable=False, server_default="0")
 
     # Retrieve the user who owns this post
     owner = relationship("User")
 
+    # Loaded instead of content by summary reads (see PostRepository)
+    excerpt = query_expression()
+
+    # Fetch created_at and other server defaults with RETURNING on INSERT
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Supports keyset pagination, which seeks on (created_at, id) newest first
+        Index("ix_posts_created_at_id", created_at.desc(), id.desc()),
+        # Covers the draft owners lookup behind the posts cache; drafts are few
+        Index(
+            "ix_posts_draft_owner_id",
+            owner_id,
+            postgresql_where=published.is_not(True),
+        ),
+        # Support posts search; both rely on Postgres-only GIN indexes
+        Index(
+            "ix_posts_title_trgm",
+            title,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_posts_search_vector",
+            literal_column("search_vector"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# Precomputed post scores behind sort=top|hot (migration 8b4e2c7d1f93). Every
+# post gets a zero row when it is created, so ranked listings can inner-join
+# the table in score index order; scores are recomputed in the background
+# (see PostRepository.refresh_rankings). Queried with Core, not mapped.
+post_rankings = Table(
+    "post_rankings",
+    Base.metadata,
+    Column(
+        "post_id",
+        String,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("top_score", Integer, nullable=False, server_default="0"),
+    Column("hot_score", Float, nullable=False, server_default="0"),
+)
+Index(
+    "ix_post_rankings_top",
+    post_rankings.c.top_score.desc(),
+    post_rankings.c.post_id,
+)
+Index(
+    "ix_post_rankings_hot",
+    post_rankings.c.hot_score.desc(),
+    post_rankings.c.post_id,
+)
+
+
+class PostView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"  # an excerpt instead of the content
+
+
+class PostSort(str, Enum):
+    NEW = "new"
+    TOP = "top"
+    HOT = "hot"
+
+
+class PostBulkMode(str, Enum):
+    ATOMIC = "atomic"  # all posts or none
+    BEST_EFFORT = "best_effort"  # every post the database accepts
+
+
+class PostLookupStatus(str, Enum):
+    FOUND = "found"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+
+
+@dataclass(frozen=True)
+class PostLookup:
+    """The outcome of looking up one id of a batch (see get_posts_by_ids)."""
+
+    post_id: str
+    status: PostLookupStatus
+    post: Post | None = None
+    votes: int = 0
+
+
+@dataclass(frozen=True)
+class PostCursor:
+    created_at: datetime
+    id: str
+
 
 class CreatePostData:
     def __init__(
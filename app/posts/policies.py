@@ -1,3 +1,5 @@
+from sqlalchemy import ColumnElement, or_
+
 from app.users.models import User
 
 from .models import Post
@@ -6,7 +8,12 @@ from .models import Post
 class PostPolicy:
     @staticmethod
     def can_view(post: Post, user: User) -> bool:
-        return True
+        return bool(post.published) or str(post.owner_id) == str(user.id)
+
+    @staticmethod
+    def can_view_clause(user: User) -> ColumnElement[bool]:
+        # SQL counterpart of can_view, for filtering listings in the query
+        return or_(Post.published, Post.owner_id == str(user.id))
 
     @staticmethod
     def can_create(user: User) -> bool:
@@ -16,6 +23,11 @@ class PostPolicy:
     def can_update(post: Post, user: User) -> bool:
         return str(post.owner_id) == str(user.id)
 
+    @staticmethod
+    def can_update_clause(user: User) -> ColumnElement[bool]:
+        # SQL counterpart of can_update, for conditional UPDATE statements
+        return Post.owner_id == str(user.id)
+
     @staticmethod
     def can_delete(post: Post, user: User) -> bool:
         return str(post.owner_id) == str(user.id)
@@ -1,18 +1,139 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Sequence
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import (
+    DBAPIError,
+    InterfaceError,
+    OperationalError,
+    ProgrammingError,
+)
+from sqlalchemy.orm import Session, joinedload, load_only, with_expression
 
-from app.votes.models import Vote
+from .exceptions import PostsNotCreatedException
+from .models import (
+    Post,
+    PostBulkMode,
+    PostCursor,
+    PostSort,
+    PostView,
+    excerpt,
+    post_rankings,
+    search_vector,
+)
 
-from .models import Post
+
+class PostSearchStrategyABC(ABC):
+    @abstractmethod
+    def matches(self, search: str) -> ColumnElement[bool]:
+        pass
+
+    @abstractmethod
+    def relevance(self, search: str) -> ColumnElement | None:
+        """Return an expression to rank matches by, or None if unranked."""
+        pass
+
+
+class IlikeSearchStrategy(PostSearchStrategyABC):
+    # Cannot use an index because of the leading wildcard; kept as a fallback
+    # for databases without the search indexes.
+    def matches(self, search: str) -> ColumnElement[bool]:
+        return Post.title.ilike(f"%{search}%")
+
+    def relevance(self, search: str) -> ColumnElement | None:
+        return None
+
+
+class FullTextSearchStrategy(PostSearchStrategyABC):
+    # Words are matched against title and content through the full-text GIN
+    # index, while substrings of the title go through the trigram GIN index
+    # (pg_trgm makes ILIKE '%term%' indexable). Both are OR-ed as a bitmap scan.
+    # Matches are ranked on the stored search_vector, so the document is not
+    # rebuilt from title and content for every matching row.
+    def matches(self, search: str) -> ColumnElement[bool]:
+        return or_(
+            search_vector.op("@@")(_ts_query(search)), Post.title.ilike(f"%{search}%")
+        )
+
+    def relevance(self, search: str) -> ColumnElement | None:
+        return func.ts_rank_cd(search_vector, _ts_query(search)) + func.similarity(
+            Post.title, search
+        )
+
+
+SEARCH_STRATEGIES: dict[str, type[PostSearchStrategyABC]] = {
+    "fulltext": FullTextSearchStrategy,
+    "ilike": IlikeSearchStrategy,
+}
+
+RANKING_SCORES = {
+    PostSort.TOP: post_rankings.c.top_score,
+    PostSort.HOT: post_rankings.c.hot_score,
+}
+
+RANKINGS_REFRESH_LOCK_ID = 7_424_011  # pg advisory lock key, any app-unique int
+
+# Recomputes every post's scores; "hot" sums votes decayed with a 24 hour
+# half-life. Also inserts rows for posts loaded without one (COPY, plain SQL)
+# and skips rows whose scores did not change.
+_REFRESH_RANKINGS = """
+INSERT INTO post_rankings (post_id, top_score, hot_score)
+SELECT
+    posts.id,
+    count(votes.post_id),
+    coalesce(
+        sum(power(0.5, extract(epoch FROM now() - votes.created_at) / 86400)), 0
+    )
+FROM posts
+LEFT JOIN votes ON votes.post_id = posts.id
+GROUP BY posts.id
+ON CONFLICT (post_id) DO UPDATE
+SET top_score = excluded.top_score, hot_score = excluded.hot_score
+WHERE (post_rankings.top_score, post_rankings.hot_score)
+    IS DISTINCT FROM (excluded.top_score, excluded.hot_score)
+"""
 
 
 class PostRepositoryABC(ABC):
     @abstractmethod
     def get_posts(
-        self, page: int, size: int, search: str | None, db: Session
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        can_view: ColumnElement[bool],
+        db: Session,
+    ) -> Sequence[tuple[Post, int]]:
+        """
+        Return a page of the posts for which `can_view` holds, in `sort` order;
+        default: relevance if searching, else new. Summary views load an
+        excerpt instead of the content.
+        """
+        pass
+
+    @abstractmethod
+    def get_posts_after(
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        can_view: ColumnElement[bool],
+        db: Session,
     ) -> Sequence[tuple[Post, int]]:
         pass
 
@@ -21,47 +142,266 @@ class PostRepositoryABC(ABC):
         pass
 
     @abstractmethod
-    def get_post_by_id(self, post_id: str, db: Session) -> Post | None:
+    def create_posts(
+        self, posts: Sequence[Post], mode: PostBulkMode, db: Session
+    ) -> list[Post | None]:
+        """
+        Store `posts` in one transaction, returning each post or, in best-effort
+        mode, None for the ones the database rejected. Raises
+        PostsNotCreatedException when an atomic batch is rejected.
+        """
         pass
 
     @abstractmethod
-    def update_post(self, post: Post, update_data: dict, db: Session) -> Post:
+    def get_post_by_id(self, post_id: str, view: PostView, db: Session) -> Post | None:
+        pass
+
+    @abstractmethod
+    def get_posts_by_ids(
+        self, post_ids: Sequence[str], view: PostView, db: Session
+    ) -> Sequence[tuple[Post, int]]:
+        """Return the posts among `post_ids` that exist, in no particular order."""
+        pass
+
+    @abstractmethod
+    def get_draft_owner_ids(self, db: Session) -> set[str]:
+        """Return the ids of the users owning at least one unpublished post."""
+        pass
+
+    @abstractmethod
+    def post_exists(self, post_id: str, db: Session) -> bool:
+        pass
+
+    @abstractmethod
+    def update_post(
+        self,
+        post_id: str,
+        update_data: dict,
+        can_update: ColumnElement[bool],
+        db: Session,
+    ) -> Post | None:
+        """Update the post if it exists and `can_update` holds, else return None."""
         pass
 
     @abstractmethod
     def delete_post(self, post: Post, db: Session) -> None:
         pass
 
+    @abstractmethod
+    def refresh_rankings(self, db: Session) -> bool:
+        """Recompute the post rankings; False if another process is at it."""
+        pass
+
 
 class PostRepository(PostRepositoryABC):
+    def __init__(
+        self,
+        search_strategy: PostSearchStrategyABC | None = None,
+        excerpt_length: int = 200,
+    ):
+        self._search_strategy = search_strategy or IlikeSearchStrategy()
+        self._excerpt_length = excerpt_length
+
     def get_posts(
-        self, page: int, size: int, search: str | None, db: Session
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        can_view: ColumnElement[bool],
+        db: Session,
     ) -> Sequence[tuple[Post, int]]:
-        query = db.query(Post, func.count(Vote.user_id).label("votes")).outerjoin(
-            Vote, Vote.post_id == Post.id
-        )
+        query = _query_posts_with_owner(db).options(*self._view_options(view))
+        query = query.filter(can_view)
+        relevance = None
         if search:
-            query = query.filter(Post.title.ilike(f"%{search}%"))
-        query = query.group_by(Post.id)
+            query = query.filter(self._search_strategy.matches(search))
+            relevance = self._search_strategy.relevance(search)
+
+        if sort in RANKING_SCORES:
+            # Walks the ranking's score index, joining posts by primary key.
+            # New posts have a zero row from creation until the next refresh.
+            query = query.join(post_rankings, post_rankings.c.post_id == Post.id)
+            query = query.order_by(RANKING_SCORES[sort].desc(), post_rankings.c.post_id)
+        elif sort is None and relevance is not None:
+            query = query.order_by(relevance.desc(), Post.id)
+        else:
+            query = query.order_by(Post.created_at.desc(), Post.id.desc())
         query = query.offset((page - 1) * size).limit(size)
         rows = query.all()  # this is the correct value to return
         return [(row[0], row[1]) for row in rows]  # to avoid linting errors
 
+    def get_posts_after(
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        can_view: ColumnElement[bool],
+        db: Session,
+    ) -> Sequence[tuple[Post, int]]:
+        # Keyset pages are always newest first, so matches are not ranked here
+        query = _query_posts_with_owner(db).options(*self._view_options(view))
+        query = query.filter(can_view)
+        if search:
+            query = query.filter(self._search_strategy.matches(search))
+        if cursor:
+            query = query.filter(
+                tuple_(Post.created_at, Post.id) < tuple_(cursor.created_at, cursor.id)
+            )
+        query = query.order_by(Post.created_at.desc(), Post.id.desc()).limit(size)
+        return [(row[0], row[1]) for row in query.all()]
+
     def create_post(self, post: Post, db: Session) -> Post:
+        # An INSERT ... RETURNING: Post fetches its server defaults eagerly, and
+        # the owner is the current user, already in the session. Then the
+        # post's zero ranking row, so sorted listings include it right away.
         db.add(post)
+        db.flush()
+        _add_rankings([post], db)
         db.commit()
-        db.refresh(post)
         return post
 
-    def get_post_by_id(self, post_id: str, db: Session) -> Post | None:
-        return db.query(Post).filter(Post.id == post_id).first()
+    def create_posts(
+        self, posts: Sequence[Post], mode: PostBulkMode, db: Session
+    ) -> list[Post | None]:
+        # The flush sends the whole batch as multi-row INSERT ... RETURNING
+        # statements (up to 1000 rows each). When the database rejects it,
+        # best-effort batches roll back to a savepoint, which keeps the rest of
+        # the session loaded, and start over post by post.
+        best_effort = mode is PostBulkMode.BEST_EFFORT
+        try:
+            with db.begin_nested() if best_effort else nullcontext():
+                db.add_all(posts)
+                db.flush()
+            created = list(posts)
+        except DBAPIError as exc:
+            if not _rejected_by_database(exc):
+                raise
+            if not best_effort:
+                db.rollback()
+                raise PostsNotCreatedException() from exc
+            created = [_create_in_savepoint(post, db) for post in posts]
+        _add_rankings([post for post in created if post is not None], db)
+        db.commit()
+        return created
+
+    def get_post_by_id(self, post_id: str, view: PostView, db: Session) -> Post | None:
+        query = _query_post_with_owner(post_id, db)
+        return query.options(*self._view_options(view)).first()
+
+    def get_posts_by_ids(
+        self, post_ids: Sequence[str], view: PostView, db: Session
+    ) -> Sequence[tuple[Post, int]]:
+        query = _query_posts_with_owner(db).options(*self._view_options(view))
+        return query.filter(Post.id.in_(post_ids)).all()
+
+    def get_draft_owner_ids(self, db: Session) -> set[str]:
+        # published is nullable; NULL is hidden by can_view like FALSE. Reads
+        # the partial index ix_posts_draft_owner_id, which holds only drafts
+        query = select(Post.owner_id).where(Post.published.is_not(True)).distinct()
+        return {str(owner_id) for owner_id in db.scalars(query)}
 
-    def update_post(self, post: Post, update_data: dict, db: Session) -> Post:
-        db.query(Post).filter(Post.id == post.id).update(update_data)
+    def post_exists(self, post_id: str, db: Session) -> bool:
+        return bool(db.scalar(select(exists().where(Post.id == post_id))))
+
+    def update_post(
+        self,
+        post_id: str,
+        update_data: dict,
+        can_update: ColumnElement[bool],
+        db: Session,
+    ) -> Post | None:
+        # A single UPDATE ... RETURNING, guarded by the update policy
+        post = db.scalars(
+            update(Post)
+            .where(Post.id == post_id, can_update)
+            .values(update_data)
+            .returning(Post),
+            execution_options={"populate_existing": True},
+        ).one_or_none()
         db.commit()
-        db.refresh(post)
         return post
 
     def delete_post(self, post: Post, db: Session) -> None:
         db.delete(post)
         db.commit()
+
+    def refresh_rankings(self, db: Session) -> bool:
+        # Every API process runs the refresher; the advisory lock lets one of
+        # them refresh while the others skip the round. Readers keep seeing
+        # the previous scores until the upsert commits.
+        lock_id = select(func.pg_try_advisory_xact_lock(RANKINGS_REFRESH_LOCK_ID))
+        if not db.scalar(lock_id):
+            db.rollback()
+            return False
+        db.execute(text(_REFRESH_RANKINGS))
+        db.commit()
+        return True
+
+    def _view_options(self, view: PostView) -> tuple:
+        if view is not PostView.SUMMARY:
+            return ()
+        # Every column but content, which is never read (raiseload guards it),
+        # plus the excerpt computed by the database
+        return (
+            load_only(
+                Post.id,
+                Post.owner_id,
+                Post.title,
+                Post.published,
+                Post.rating,
+                Post.created_at,
+                raiseload=True,
+            ),
+            with_expression(Post.excerpt, excerpt(Post.content, self._excerpt_length)),
+        )
+
+
+# Helper functions
+
+
+def _add_rankings(posts: Sequence[Post], db: Session) -> None:
+    # One multi-row INSERT; scores start at their server default, 0
+    if posts:
+        db.execute(insert(post_rankings), [{"post_id": post.id} for post in posts])
+
+
+def _create_in_savepoint(post: Post, db: Session) -> Post | None:
+    try:
+        with db.begin_nested():
+            db.add(post)
+    except DBAPIError as exc:
+        if not _rejected_by_database(exc):
+            raise
+        return None
+    return post
+
+
+def _rejected_by_database(exc: DBAPIError) -> bool:
+    # Invalid values and constraint violations, including asyncpg's client-side
+    # argument checks (plain DBAPIErrors), but not lost connections or SQL bugs
+    return not exc.connection_invalidated and not isinstance(
+        exc, (InterfaceError, OperationalError, ProgrammingError)
+    )
+
+
+def _query_posts_with_owner(db: Session):
+    # PostOut nests the owner, so load it in the same statement instead of
+    # lazily issuing one SELECT per post while serializing a page
+    return db.query(Post, Post.votes_count).options(
+        joinedload(Post.owner, innerjoin=True)
+    )
+
+
+def _query_post_with_owner(post_id: str, db: Session):
+    return (
+        db.query(Post)
+        .options(joinedload(Post.owner, innerjoin=True))
+        .filter(Post.id == post_id)
+    )
+
+
+def _ts_query(search: str):
+    return func.websearch_to_tsquery(literal_column("'english'::regconfig"), search)
@@ -1,93 +1,250 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.config import settings
-from app.core.dependencies.current_user import get_current_user
-from app.core.dependencies.database import get_db
+from app.core.dependencies.current_user import (
+    get_current_user,
+    get_current_user_for_reads,
+)
+from app.core.dependencies.database import (
+    DatabaseSession,
+    get_db,
+    get_read_db,
+    run_in_session,
+)
+from app.core.responses import FastJSONResponse
 from app.users.models import User
 
-from .exceptions import ForbiddenException
-from .models import CreatePostData, UpdatePostData
-from .schemas import PostCreate, PostOut, PostUpdate, PostWithVotes
+from .exceptions import (
+    ForbiddenException,
+    InvalidCursorException,
+    PostsNotCreatedException,
+)
+from .models import (
+    CreatePostData,
+    PostBulkMode,
+    PostCursor,
+    PostLookup,
+    PostLookupStatus,
+    PostSort,
+    PostView,
+    UpdatePostData,
+)
+from .schemas import (
+    PostBatch,
+    PostBulkResult,
+    PostCreate,
+    PostOut,
+    PostsPage,
+    PostSummariesPage,
+    PostSummary,
+    PostUpdate,
+    dump_post_out,
+    dump_post_summary,
+)
 from .use_cases import (
-    CreatePostUseCase,
-    DeletePostUseCase,
-    GetPostByIdUseCase,
-    GetPostsUseCase,
-    UpdatePostUseCase,
+    CreatePostsUseCaseABC,
+    CreatePostUseCaseABC,
+    DeletePostUseCaseABC,
+    GetPostByIdUseCaseABC,
+    GetPostsByCursorUseCaseABC,
+    GetPostsByIdsUseCaseABC,
+    GetPostsUseCaseABC,
+    UpdatePostUseCaseABC,
 )
+from .utils import decode_cursor, encode_cursor
 
 
 class PostsRoutes:
     def __init__(
         self,
-        get_posts_use_case: GetPostsUseCase,
-        create_post_use_case: CreatePostUseCase,
-        get_post_by_id_use_case: GetPostByIdUseCase,
-        update_post_use_case: UpdatePostUseCase,
-        delete_post_use_case: DeletePostUseCase,
+        get_posts_use_case: GetPostsUseCaseABC,
+        get_posts_by_cursor_use_case: GetPostsByCursorUseCaseABC,
+        create_post_use_case: CreatePostUseCaseABC,
+        create_posts_use_case: CreatePostsUseCaseABC,
+        get_post_by_id_use_case: GetPostByIdUseCaseABC,
+        get_posts_by_ids_use_case: GetPostsByIdsUseCaseABC,
+        update_post_use_case: UpdatePostUseCaseABC,
+        delete_post_use_case: DeletePostUseCaseABC,
     ):
         self._get_posts_use_case = get_posts_use_case
+        self._get_posts_by_cursor_use_case = get_posts_by_cursor_use_case
         self._create_post_use_case = create_post_use_case
+        self._create_posts_use_case = create_posts_use_case
         self._get_post_by_id_use_case = get_post_by_id_use_case
+        self._get_posts_by_ids_use_case = get_posts_by_ids_use_case
         self._update_post_use_case = update_post_use_case
         self._delete_post_use_case = delete_post_use_case
 
         self.router = APIRouter(prefix="/posts", tags=["Posts"])
         self._build_routes()
 
-    def get_posts(
+    async def get_posts(
         self,
         page: int = 1,
         size: int = settings.default_page_size,
         search: str | None = None,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        sort: PostSort | None = None,
+        cursor: str | None = None,
+        view: PostView = PostView.FULL,
+        db: DatabaseSession = Depends(get_read_db),
+        current_user: User = Depends(get_current_user_for_reads),
     ):
         if page < 1 or size < 1:
             _report_bad_request("Page and size must be positive integers")
         if size > settings.max_page_size:
             _report_bad_request(f"Size must not exceed {settings.max_page_size}")
-        posts = self._get_posts_use_case.execute(page, size, search, db, current_user)
-        response_data = [
-            PostWithVotes(Post=PostOut.model_validate(post), votes=votes)
-            for post, votes in posts
-        ]
-        return {"data": response_data}
-
-    def create_post(
+
+        # Passing a cursor (an empty one for the first page) switches to keyset
+        # pagination, newest first; plain page/size requests keep using offsets.
+        # Without a sort, offset pages are ranked by relevance when searching
+        # and newest first otherwise.
+        next_cursor = None
+        if cursor is None:
+            posts = await run_in_session(
+                db,
+                lambda session: self._get_posts_use_case.execute(
+                    page, size, search, sort, view, session, current_user
+                ),
+            )
+        else:
+            if page != 1:
+                _report_bad_request("Page and cursor cannot be combined")
+            if sort not in (None, PostSort.NEW):
+                _report_bad_request("Cursor pagination only supports sort=new")
+            after = _parse_cursor(cursor)
+            posts, next_cursor = await run_in_session(
+                db,
+                lambda session: self._get_posts_by_cursor_use_case.execute(
+                    after, size, search, view, session, current_user
+                ),
+            )
+
+        # Built once from the rows and encoded with orjson (see FastJSONResponse)
+        dump_post = _POST_DUMPERS[view]
+        return FastJSONResponse(
+            {
+                "data": [
+                    {"Post": dump_post(post), "votes": votes} for post, votes in posts
+                ],
+                "next_cursor": encode_cursor(next_cursor) if next_cursor else None,
+            }
+        )
+
+    async def create_post(
         self,
         post_data: PostCreate,
-        db: Session = Depends(get_db),
+        db: DatabaseSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ):
-        new_post = self._create_post_use_case.execute(
-            _build_create_post_data(post_data), db, current_user
+        create_data = _build_create_post_data(post_data)
+        new_post = await run_in_session(
+            db,
+            lambda session: self._create_post_use_case.execute(
+                create_data, session, current_user
+            ),
         )
         return {"data": new_post}
 
-    def get_post_by_id(
+    async def create_posts(
         self,
-        post_id: str,
-        db: Session = Depends(get_db),
+        posts_data: list[PostCreate],
+        mode: PostBulkMode = PostBulkMode.ATOMIC,
+        db: DatabaseSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ):
-        post = self._get_post_by_id_use_case.execute(post_id, db, current_user)
-        if not post:
-            _report_not_found(post_id)
-        post_out = PostOut.model_validate(post)
-        return {"data": post_out}
+        if not posts_data:
+            _report_bad_request("At least one post is required")
+        if len(posts_data) > settings.posts_bulk_max_items:
+            _report_bad_request(f"Posts must not exceed {settings.posts_bulk_max_items}")
+
+        create_data = [_build_create_post_data(post_data) for post_data in posts_data]
+        try:
+            posts = await run_in_session(
+                db,
+                lambda session: self._create_posts_use_case.execute(
+                    create_data, mode, session, current_user
+                ),
+            )
+        except ForbiddenException:
+            _report_forbidden()
+        except PostsNotCreatedException:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="The database rejected a post, no posts were created",
+            )
+
+        # 207 when a best-effort batch stored only some of the posts
+        all_created = all(post is not None for post in posts)
+        return FastJSONResponse(
+            {"data": [_dump_bulk_item(index, post) for index, post in enumerate(posts)]},
+            status_code=(
+                status.HTTP_201_CREATED if all_created else status.HTTP_207_MULTI_STATUS
+            ),
+        )
+
+    async def get_post_by_id(
+        self,
+        post_id: str,
+        view: PostView = PostView.FULL,
+        db: DatabaseSession = Depends(get_read_db),
+        current_user: User = Depends(get_current_user_for_reads),
+    ):
+        try:
+            post = await run_in_session(
+                db,
+                lambda session: self._get_post_by_id_use_case.execute(
+                    post_id, view, session, current_user
+                ),
+            )
+            if not post:
+                _report_not_found(post_id)
+            return FastJSONResponse({"data": _POST_DUMPERS[view](post)})
+
+        except ForbiddenException:
+            _report_forbidden()
+
+    async def get_posts_by_ids(
+        self,
+        ids: list[str] = Query(description="Post ids, repeated or comma-separated"),
+        view: PostView = PostView.FULL,
+        db: DatabaseSession = Depends(get_read_db),
+        current_user: User = Depends(get_current_user_for_reads),
+    ):
+        # Repeated ids are looked up once and answered once, in request order
+        post_ids = list(
+            dict.fromkeys(id for value in ids for id in value.split(",") if id)
+        )
+        if not post_ids:
+            _report_bad_request("At least one post id is required")
+        if len(post_ids) > settings.posts_batch_max_ids:
+            _report_bad_request(f"Ids must not exceed {settings.posts_batch_max_ids}")
+
+        lookups = await run_in_session(
+            db,
+            lambda session: self._get_posts_by_ids_use_case.execute(
+                post_ids, view, session, current_user
+            ),
+        )
 
-    def update_post(
+        dump_post = _POST_DUMPERS[view]
+        return FastJSONResponse(
+            {"data": [_dump_post_lookup(lookup, dump_post) for lookup in lookups]}
+        )
+
+    async def update_post(
         self,
         post_id: str,
         post_data: PostUpdate,
-        db: Session = Depends(get_db),
+        db: DatabaseSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ):
         try:
-            post = self._update_post_use_case.execute(
-                post_id, _build_update_post_data(post_data), db, current_user
+            update_data = _build_update_post_data(post_data)
+            post = await run_in_session(
+                db,
+                lambda session: self._update_post_use_case.execute(
+                    post_id, update_data, session, current_user
+                ),
             )
             if post is None:
                 _report_not_found(post_id)
@@ -97,14 +254,19 @@ class PostsRoutes:
         except ForbiddenException:
             _report_forbidden()
 
-    def delete_post(
+    async def delete_post(
         self,
         post_id: str,
-        db: Session = Depends(get_db),
+        db: DatabaseSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ) -> None:
         try:
-            result = self._delete_post_use_case.execute(post_id, db, current_user)
+            result = await run_in_session(
+                db,
+                lambda session: self._delete_post_use_case.execute(
+                    post_id, session, current_user
+                ),
+            )
             if result is None:
                 _report_not_found(post_id)
 
@@ -117,7 +279,7 @@ class PostsRoutes:
         self.router.add_api_route(
             "/",
             self.get_posts,
-            response_model=dict[str, list[PostWithVotes]],
+            response_model=PostsPage | PostSummariesPage,
             methods=["GET"],
         )
         self.router.add_api_route(
@@ -127,10 +289,25 @@ class PostsRoutes:
             status_code=status.HTTP_201_CREATED,
             methods=["POST"],
         )
+        self.router.add_api_route(
+            "/bulk",
+            self.create_posts,
+            response_model=PostBulkResult,
+            status_code=status.HTTP_201_CREATED,
+            responses={status.HTTP_207_MULTI_STATUS: {"model": PostBulkResult}},
+            methods=["POST"],
+        )
+        # Before /{post_id}, which would otherwise take "batch" for an id
+        self.router.add_api_route(
+            "/batch",
+            self.get_posts_by_ids,
+            response_model=PostBatch,
+            methods=["GET"],
+        )
         self.router.add_api_route(
             "/{post_id}",
             self.get_post_by_id,
-            response_model=dict[str, PostOut],
+            response_model=dict[str, PostOut | PostSummary],
             methods=["GET"],
         )
         self.router.add_api_route(
@@ -149,6 +326,52 @@ class PostsRoutes:
         )
 
 
+_POST_DUMPERS = {PostView.FULL: dump_post_out, PostView.SUMMARY: dump_post_summary}
+
+
+def _dump_bulk_item(index: int, post) -> dict:
+    # Every PostBulkItem field, like _dump_post_lookup
+    if post is None:
+        return {
+            "index": index,
+            "status": status.HTTP_422_UNPROCESSABLE_CONTENT,
+            "Post": None,
+            "detail": "The database rejected this post",
+        }
+    return {
+        "index": index,
+        "status": status.HTTP_201_CREATED,
+        "Post": dump_post_out(post),
+        "detail": None,
+    }
+
+
+def _dump_post_lookup(lookup: PostLookup, dump_post) -> dict:
+    # Every PostBatchItem field, like the dump_* helpers in schemas
+    item = {"id": lookup.post_id, "Post": None, "votes": None, "detail": None}
+    if lookup.status is PostLookupStatus.NOT_FOUND:
+        item.update(status=status.HTTP_404_NOT_FOUND, detail="Post not found")
+    elif lookup.status is PostLookupStatus.FORBIDDEN:
+        item.update(
+            status=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to perform requested action",
+        )
+    else:
+        item.update(
+            status=status.HTTP_200_OK, Post=dump_post(lookup.post), votes=lookup.votes
+        )
+    return item
+
+
+def _parse_cursor(cursor: str) -> PostCursor | None:
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorException:
+        _report_bad_request("Invalid cursor")
+
+
 def _build_create_post_data(post_data: PostCreate) -> CreatePostData:
     return CreatePostData(
         title=getattr(post_data, "title"),
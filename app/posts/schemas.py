@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
-from app.users.schemas import UserOut
+from app.users.schemas import UserOut, dump_user_out
 
 
 class PostSchemaBase(BaseModel):
@@ -21,14 +21,99 @@ class PostOut(PostSchemaBase):
     model_config = {"from_attributes": True}
 
 
+def dump_post_out(post) -> dict:
+    """
+    PostOut as a plain dict, straight from a Post row (with its owner loaded),
+    for FastJSONResponse. Keep in sync with PostOut.
+    """
+    return {
+        "title": post.title,
+        "content": post.content,
+        "published": post.published,
+        "rating": post.rating,
+        "id": post.id,
+        "created_at": post.created_at,
+        "owner": dump_user_out(post.owner),
+    }
+
+
+class PostSummary(BaseModel):
+    """A post with an excerpt instead of its content (view=summary)."""
+
+    title: str
+    excerpt: str
+    published: bool = True
+    rating: int | None = None
+    id: UUID
+    created_at: datetime
+    owner: UserOut
+
+    model_config = {"from_attributes": True}
+
+
+def dump_post_summary(post) -> dict:
+    """PostSummary as a plain dict, like dump_post_out. Keep in sync with PostSummary."""
+    return {
+        "title": post.title,
+        "excerpt": post.excerpt,
+        "published": post.published,
+        "rating": post.rating,
+        "id": post.id,
+        "created_at": post.created_at,
+        "owner": dump_user_out(post.owner),
+    }
+
+
 class PostWithVotes(BaseModel):
     Post: PostOut
     votes: int
 
 
+class PostsPage(BaseModel):
+    data: list[PostWithVotes]
+    next_cursor: str | None = None
+
+
+class PostSummaryWithVotes(BaseModel):
+    Post: PostSummary
+    votes: int
+
+
+class PostSummariesPage(BaseModel):
+    data: list[PostSummaryWithVotes]
+    next_cursor: str | None = None
+
+
+class PostBatchItem(BaseModel):
+    """One id of a batch read: the post when status is 200, else a detail."""
+
+    id: str
+    status: int
+    Post: PostOut | PostSummary | None = None
+    votes: int | None = None
+    detail: str | None = None
+
+
+class PostBatch(BaseModel):
+    data: list[PostBatchItem]
+
+
 class PostCreate(PostSchemaBase):
     pass
 
 
 class PostUpdate(PostSchemaBase):
     pass
+
+
+class PostBulkItem(BaseModel):
+    """One post of a bulk creation, by its position in the request."""
+
+    index: int
+    status: int
+    Post: PostOut | None = None
+    detail: str | None = None
+
+
+class PostBulkResult(BaseModel):
+    data: list[PostBulkItem]
@@ -6,7 +6,17 @@ from sqlalchemy.orm import Session
 from app.users.models import User
 
 from .exceptions import ForbiddenException
-from .models import CreatePostData, Post, UpdatePostData
+from .models import (
+    CreatePostData,
+    Post,
+    PostBulkMode,
+    PostCursor,
+    PostLookup,
+    PostLookupStatus,
+    PostSort,
+    PostView,
+    UpdatePostData,
+)
 from .policies import PostPolicy
 from .repositories import PostRepositoryABC
 
@@ -14,22 +24,61 @@ from .repositories import PostRepositoryABC
 class PostServiceABC(ABC):
     @abstractmethod
     def get_posts(
-        self, page: int, size: int, search: str | None, db: Session, current_user: User
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
     ) -> Sequence[tuple[Post, int]]:
         pass
 
+    @abstractmethod
+    def get_posts_by_cursor(
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> tuple[Sequence[tuple[Post, int]], PostCursor | None]:
+        pass
+
     @abstractmethod
     def create_post(
         self, post_data: CreatePostData, db: Session, current_user: User
     ) -> Post:
         pass
 
+    @abstractmethod
+    def create_posts(
+        self,
+        posts_data: Sequence[CreatePostData],
+        mode: PostBulkMode,
+        db: Session,
+        current_user: User,
+    ) -> list[Post | None]:
+        pass
+
     @abstractmethod
     def get_post_by_id(
-        self, post_id: str, db: Session, current_user: User
+        self, post_id: str, view: PostView, db: Session, current_user: User
     ) -> Post | None:
         pass
 
+    @abstractmethod
+    def get_posts_by_ids(
+        self, post_ids: Sequence[str], view: PostView, db: Session, current_user: User
+    ) -> list[PostLookup]:
+        pass
+
+    @abstractmethod
+    def get_draft_owner_ids(self, db: Session) -> set[str]:
+        pass
+
     @abstractmethod
     def update_post(
         self, post_id: str, post_data: UpdatePostData, db: Session, current_user: User
@@ -47,15 +96,38 @@ class PostService(PostServiceABC):
         self._post_policy = post_policy
 
     def get_posts(
-        self, page: int, size: int, search: str | None, db: Session, current_user: User
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
     ) -> Sequence[tuple[Post, int]]:
-        posts = self._post_repository.get_posts(page, size, search, db)
-        filtered_posts = [
-            (post, votes)
-            for post, votes in posts
-            if self._post_policy.can_view(post, current_user)
-        ]
-        return filtered_posts
+        # Filtered in the query, so pages are full
+        can_view = self._post_policy.can_view_clause(current_user)
+        return self._post_repository.get_posts(
+            page, size, search, sort, view, can_view, db
+        )
+
+    def get_posts_by_cursor(
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> tuple[Sequence[tuple[Post, int]], PostCursor | None]:
+        # Fetch one extra row to find out whether there is a next page
+        can_view = self._post_policy.can_view_clause(current_user)
+        posts = self._post_repository.get_posts_after(
+            cursor, size + 1, search, view, can_view, db
+        )
+        page = posts[:size]
+        next_cursor = _build_cursor(page[-1][0]) if len(posts) > size else None
+        return page, next_cursor
 
     def create_post(
         self, post_data: CreatePostData, db: Session, current_user: User
@@ -72,29 +144,77 @@ class PostService(PostServiceABC):
         )
         return self._post_repository.create_post(new_post, db)
 
+    def create_posts(
+        self,
+        posts_data: Sequence[CreatePostData],
+        mode: PostBulkMode,
+        db: Session,
+        current_user: User,
+    ) -> list[Post | None]:
+        # Every post has the same owner, so one policy check covers the batch
+        if not self._post_policy.can_create(current_user):
+            raise ForbiddenException()
+
+        new_posts = [
+            Post(
+                owner_id=current_user.id,
+                title=post_data.title,
+                content=post_data.content,
+                published=post_data.published,
+                rating=post_data.rating,
+            )
+            for post_data in posts_data
+        ]
+        return self._post_repository.create_posts(new_posts, mode, db)
+
     def get_post_by_id(
-        self, post_id: str, db: Session, current_user: User
+        self, post_id: str, view: PostView, db: Session, current_user: User
     ) -> Post | None:
-        post = self._post_repository.get_post_by_id(post_id, db)
+        post = self._post_repository.get_post_by_id(post_id, view, db)
 
-        if not self._post_policy.can_view(post, current_user):
+        if post is not None and not self._post_policy.can_view(post, current_user):
             raise ForbiddenException()
 
         return post
 
+    def get_posts_by_ids(
+        self, post_ids: Sequence[str], view: PostView, db: Session, current_user: User
+    ) -> list[PostLookup]:
+        # One query for the whole batch, then the same policy check as
+        # get_post_by_id on each post, so each id gets its own outcome
+        found = {
+            str(post.id): (post, votes)
+            for post, votes in self._post_repository.get_posts_by_ids(post_ids, view, db)
+        }
+        lookups = []
+        for post_id in post_ids:
+            if post_id not in found:
+                lookups.append(PostLookup(post_id, PostLookupStatus.NOT_FOUND))
+                continue
+            post, votes = found[post_id]
+            if not self._post_policy.can_view(post, current_user):
+                lookups.append(PostLookup(post_id, PostLookupStatus.FORBIDDEN))
+                continue
+            lookups.append(PostLookup(post_id, PostLookupStatus.FOUND, post, votes))
+        return lookups
+
+    def get_draft_owner_ids(self, db: Session) -> set[str]:
+        return self._post_repository.get_draft_owner_ids(db)
+
     def update_post(
         self, post_id: str, post_data: UpdatePostData, db: Session, current_user: User
     ) -> Post | None:
-        post = self._post_repository.get_post_by_id(post_id, db)
-        if not post:
-            return None
-        if not self._post_policy.can_update(post, current_user):
-            raise ForbiddenException()
         update_data = self._build_update_data(post_data)
-        return self._post_repository.update_post(post, update_data, db)
+        post = self._post_repository.update_post(
+            post_id, update_data, self._post_policy.can_update_clause(current_user), db
+        )
+        # Nothing updated: only look the post up to tell 404 from 403
+        if post is None and self._post_repository.post_exists(post_id, db):
+            raise ForbiddenException()
+        return post
 
     def delete_post(self, post_id: str, db: Session, current_user: User) -> None:
-        post = self._post_repository.get_post_by_id(post_id, db)
+        post = self._post_repository.get_post_by_id(post_id, PostView.FULL, db)
         if not post:
             return None
         if not self._post_policy.can_delete(post, current_user):
@@ -113,3 +233,7 @@ class PostService(PostServiceABC):
         if post_data.rating is not None:
             update_data[getattr(Post, "rating")] = post_data.rating
         return update_data
+
+
+def _build_cursor(post: Post) -> PostCursor:
+    return PostCursor(created_at=getattr(post, "created_at"), id=str(post.id))
@@ -3,16 +3,34 @@ from collections.abc import Sequence
 
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.dependencies.database import REPLICA_SESSION
 from app.users.models import User
 
-from .models import CreatePostData, Post, UpdatePostData
+from .models import (
+    CreatePostData,
+    Post,
+    PostBulkMode,
+    PostCursor,
+    PostLookup,
+    PostSort,
+    PostView,
+    UpdatePostData,
+)
 from .services import PostServiceABC
 
 
 class GetPostsUseCaseABC(ABC):
     @abstractmethod
     def execute(
-        self, page: int, size: int, search: str | None, db: Session, current_user: User
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
     ) -> Sequence[tuple[Post, int]]:
         pass
 
@@ -22,32 +40,170 @@ class GetPostsUseCase(GetPostsUseCaseABC):
         self._service = service
 
     def execute(
-        self, page: int, size: int, search: str | None, db: Session, current_user: User
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
     ) -> Sequence[tuple[Post, int]]:
-        return self._service.get_posts(page, size, search, db, current_user)
+        return self._service.get_posts(page, size, search, sort, view, db, current_user)
 
 
-class CreatePostUseCaseABC(ABC):
+# Caching decorators for the listing use cases. PostPolicy.can_view shows
+# users their own unpublished posts, so listings only differ between users who
+# have drafts: everyone else shares one entry (see _viewer_key). Cached rows
+# are shared across requests once their loading session is closed, read-only.
+# Reads from a replica are served but not cached: a lagging replica could
+# still return rows older than the last invalidation.
+class CachedGetPostsUseCase(GetPostsUseCaseABC):
+    def __init__(
+        self, use_case: GetPostsUseCaseABC, cache: TTLCache, service: PostServiceABC
+    ):
+        self._use_case = use_case
+        self._cache = cache
+        self._service = service
+
+    def execute(
+        self,
+        page: int,
+        size: int,
+        search: str | None,
+        sort: PostSort | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> Sequence[tuple[Post, int]]:
+        generation = self._cache.generation
+        viewer = _viewer_key(self._cache, self._service, db, current_user)
+        key = ("page", page, size, search, sort, view, viewer)
+        posts = self._cache.get(key)
+        if posts is None:
+            posts = self._use_case.execute(
+                page, size, search, sort, view, db, current_user
+            )
+            if not db.info.get(REPLICA_SESSION):
+                self._cache.put(key, posts, generation)
+        return posts
+
+
+class GetPostsByCursorUseCaseABC(ABC):
     @abstractmethod
     def execute(
-        self, post_data: CreatePostData, db: Session, current_user: User
-    ) -> Post:
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> tuple[Sequence[tuple[Post, int]], PostCursor | None]:
         pass
 
 
-class CreatePostUseCase(CreatePostUseCaseABC):
+class GetPostsByCursorUseCase(GetPostsByCursorUseCaseABC):
     def __init__(self, service: PostServiceABC):
         self._service = service
 
     def execute(
-        self, post_data: CreatePostData, db: Session, current_user: User
-    ) -> Post:
-        return self._service.create_post(post_data, db, current_user)
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> tuple[Sequence[tuple[Post, int]], PostCursor | None]:
+        return self._service.get_posts_by_cursor(
+            cursor, size, search, view, db, current_user
+        )
+
+
+class CachedGetPostsByCursorUseCase(GetPostsByCursorUseCaseABC):
+    def __init__(
+        self,
+        use_case: GetPostsByCursorUseCaseABC,
+        cache: TTLCache,
+        service: PostServiceABC,
+    ):
+        self._use_case = use_case
+        self._cache = cache
+        self._service = service
+
+    def execute(
+        self,
+        cursor: PostCursor | None,
+        size: int,
+        search: str | None,
+        view: PostView,
+        db: Session,
+        current_user: User,
+    ) -> tuple[Sequence[tuple[Post, int]], PostCursor | None]:
+        generation = self._cache.generation
+        viewer = _viewer_key(self._cache, self._service, db, current_user)
+        key = ("cursor", cursor, size, search, view, viewer)
+        page = self._cache.get(key)
+        if page is None:
+            page = self._use_case.execute(cursor, size, search, view, db, current_user)
+            if not db.info.get(REPLICA_SESSION):
+                self._cache.put(key, page, generation)
+        return page
+
+
+class CreatePostUseCaseABC(ABC):
+    @abstractmethod
+    def execute(self, post_data: CreatePostData, db: Session, current_user: User) -> Post:
+        pass
+
+
+class CreatePostUseCase(CreatePostUseCaseABC):
+    def __init__(self, service: PostServiceABC, posts_cache: TTLCache | None = None):
+        self._service = service
+        self._posts_cache = posts_cache
+
+    def execute(self, post_data: CreatePostData, db: Session, current_user: User) -> Post:
+        post = self._service.create_post(post_data, db, current_user)
+        _invalidate(self._posts_cache)
+        return post
+
+
+class CreatePostsUseCaseABC(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        posts_data: Sequence[CreatePostData],
+        mode: PostBulkMode,
+        db: Session,
+        current_user: User,
+    ) -> list[Post | None]:
+        pass
+
+
+class CreatePostsUseCase(CreatePostsUseCaseABC):
+    def __init__(self, service: PostServiceABC, posts_cache: TTLCache | None = None):
+        self._service = service
+        self._posts_cache = posts_cache
+
+    def execute(
+        self,
+        posts_data: Sequence[CreatePostData],
+        mode: PostBulkMode,
+        db: Session,
+        current_user: User,
+    ) -> list[Post | None]:
+        posts = self._service.create_posts(posts_data, mode, db, current_user)
+        if any(post is not None for post in posts):
+            _invalidate(self._posts_cache)
+        return posts
 
 
 class GetPostByIdUseCaseABC(ABC):
     @abstractmethod
-    def execute(self, post_id: str, db: Session, current_user: User) -> Post | None:
+    def execute(
+        self, post_id: str, view: PostView, db: Session, current_user: User
+    ) -> Post | None:
         pass
 
 
@@ -55,8 +211,28 @@ class GetPostByIdUseCase(GetPostByIdUseCaseABC):
     def __init__(self, service: PostServiceABC):
         self._service = service
 
-    def execute(self, post_id: str, db: Session, current_user: User) -> Post | None:
-        return self._service.get_post_by_id(post_id, db, current_user)
+    def execute(
+        self, post_id: str, view: PostView, db: Session, current_user: User
+    ) -> Post | None:
+        return self._service.get_post_by_id(post_id, view, db, current_user)
+
+
+class GetPostsByIdsUseCaseABC(ABC):
+    @abstractmethod
+    def execute(
+        self, post_ids: Sequence[str], view: PostView, db: Session, current_user: User
+    ) -> list[PostLookup]:
+        pass
+
+
+class GetPostsByIdsUseCase(GetPostsByIdsUseCaseABC):
+    def __init__(self, service: PostServiceABC):
+        self._service = service
+
+    def execute(
+        self, post_ids: Sequence[str], view: PostView, db: Session, current_user: User
+    ) -> list[PostLookup]:
+        return self._service.get_posts_by_ids(post_ids, view, db, current_user)
 
 
 class UpdatePostUseCaseABC(ABC):
@@ -68,13 +244,17 @@ class UpdatePostUseCaseABC(ABC):
 
 
 class UpdatePostUseCase(UpdatePostUseCaseABC):
-    def __init__(self, service: PostServiceABC):
+    def __init__(self, service: PostServiceABC, posts_cache: TTLCache | None = None):
         self._service = service
+        self._posts_cache = posts_cache
 
     def execute(
         self, post_id: str, post_data: UpdatePostData, db: Session, current_user: User
     ) -> Post | None:
-        return self._service.update_post(post_id, post_data, db, current_user)
+        post = self._service.update_post(post_id, post_data, db, current_user)
+        if post is not None:
+            _invalidate(self._posts_cache)
+        return post
 
 
 class DeletePostUseCaseABC(ABC):
@@ -84,8 +264,37 @@ class DeletePostUseCaseABC(ABC):
 
 
 class DeletePostUseCase(DeletePostUseCaseABC):
-    def __init__(self, service: PostServiceABC):
+    def __init__(self, service: PostServiceABC, posts_cache: TTLCache | None = None):
         self._service = service
+        self._posts_cache = posts_cache
 
     def execute(self, post_id: str, db: Session, current_user: User) -> None:
-        return self._service.delete_post(post_id, db, current_user)
+        result = self._service.delete_post(post_id, db, current_user)
+        _invalidate(self._posts_cache)
+        return result
+
+
+# Helper functions
+
+_DRAFT_OWNERS_KEY = ("draft_owners",)
+
+
+def _viewer_key(
+    cache: TTLCache, service: PostServiceABC, db: Session, current_user: User
+) -> str | None:
+    # The user's id for users with drafts, else None for the shared entry.
+    # The draft owners are cached alongside the listings and dropped by the
+    # same invalidations, since every post write invalidates the cache.
+    generation = cache.generation
+    draft_owners = cache.get(_DRAFT_OWNERS_KEY)
+    if draft_owners is None:
+        draft_owners = frozenset(service.get_draft_owner_ids(db))
+        if not db.info.get(REPLICA_SESSION):
+            cache.put(_DRAFT_OWNERS_KEY, draft_owners, generation)
+    user_id = str(current_user.id)
+    return user_id if user_id in draft_owners else None
+
+
+def _invalidate(posts_cache: TTLCache | None) -> None:
+    if posts_cache is not None:
+        posts_cache.invalidate()
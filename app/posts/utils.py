@@ -0,0 +1,29 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from .exceptions import InvalidCursorException
+from .models import PostCursor
+
+
+# Cursors are opaque to clients: a URL-safe base64 encoded JSON document
+# holding the (created_at, id) of the last post of the previous page.
+def encode_cursor(cursor: PostCursor) -> str:
+    payload = json.dumps(
+        {"created_at": cursor.created_at.isoformat(), "id": cursor.id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> PostCursor:
+    try:
+        padding = "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(token + padding))
+        return PostCursor(
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            id=str(payload["id"]),
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
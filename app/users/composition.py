@@ -1,3 +1,5 @@
+from app.core.tracing import traced
+
 from .repositories import UserRepository
 from .routes import UserRoutes
 from .services import UserService
@@ -5,10 +7,10 @@ from .use_cases import CreateUserUseCase, GetUserByIdUseCase
 
 
 def build_user_router():
-    repository = UserRepository()
-    service = UserService(repository)
-    create_user_use_case = CreateUserUseCase(service)
-    get_user_by_id_use_case = GetUserByIdUseCase(service)
+    repository = traced(UserRepository(), "repository")
+    service = traced(UserService(repository), "service")
+    create_user_use_case = traced(CreateUserUseCase(service), "use_case")
+    get_user_by_id_use_case = traced(GetUserByIdUseCase(service), "use_case")
     user_routes = UserRoutes(
         create_user_use_case=create_user_use_case,
         get_user_by_id_use_case=get_user_by_id_use_case,
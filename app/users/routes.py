@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.core.dependencies.database import get_db
+from app.core.dependencies.database import (
+    DatabaseSession,
+    get_db,
+    get_read_db,
+    run_in_session,
+)
+from app.core.responses import FastJSONResponse
 
 from .exceptions import EmailAlreadyExistsException
 from .models import CreateUserData
-from .schemas import UserCreate, UserOut
+from .schemas import UserCreate, UserOut, dump_user_out
 from .use_cases import CreateUserUseCaseABC, GetUserByIdUseCaseABC
 
 
@@ -23,7 +28,9 @@ class UserRoutes:
 
     # === Public Route Handlers ===
 
-    def create_user(self, user_data: UserCreate, db: Session = Depends(get_db)):
+    async def create_user(
+        self, user_data: UserCreate, db: DatabaseSession = Depends(get_db)
+    ):
         """
         Handle user creation.
         """
@@ -31,19 +38,23 @@ class UserRoutes:
             new_user_data = CreateUserData(
                 email=user_data.email, password=user_data.password
             )
-            user = self.create_user_use_case.execute(new_user_data, db)
+            user = await self.create_user_use_case.execute(new_user_data, db)
             return {"data": user}
         except EmailAlreadyExistsException:
             self._report_user_exists(str(user_data.email))
 
-    def get_user_by_id(self, user_id: str, db: Session = Depends(get_db)):
+    async def get_user_by_id(
+        self, user_id: str, db: DatabaseSession = Depends(get_read_db)
+    ):
         """
         Handle fetching a user by ID.
         """
-        user = self.get_user_by_id_use_case.execute(user_id, db)
+        user = await run_in_session(
+            db, lambda session: self.get_user_by_id_use_case.execute(user_id, session)
+        )
         if user is None:
             self._report_user_not_found(user_id)
-        return {"data": user}
+        return FastJSONResponse({"data": dump_user_out(user)})
 
     # === Private Helpers ===
 
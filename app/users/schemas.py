@@ -16,5 +16,18 @@ class UserOut(UserSchemaBase):
     model_config = {"from_attributes": True}
 
 
+def dump_user_out(user) -> dict:
+    """
+    UserOut as a plain dict, straight from a User row, for FastJSONResponse.
+    Keep in sync with UserOut: only its fields may be exposed.
+    """
+    return {
+        "email": user.email,
+        "is_active": user.is_active,
+        "id": user.id,
+        "created_at": user.created_at,
+    }
+
+
 class UserCreate(UserSchemaBase):
     password: str
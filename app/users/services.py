@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from sqlalchemy.orm import Session
 
+from app.core.dependencies.database import DatabaseSession, run_in_session
+
 from .exceptions import EmailAlreadyExistsException
 from .models import CreateUserData, User
 from .repositories import UserRepositoryABC
@@ -10,7 +12,9 @@ from .utils import hash_password
 
 class UserServiceABC(ABC):
     @abstractmethod
-    def create_user(self, new_user_data: CreateUserData, db: Session) -> User:
+    async def create_user(
+        self, new_user_data: CreateUserData, db: DatabaseSession
+    ) -> User:
         pass
 
     @abstractmethod
@@ -22,16 +26,32 @@ class UserService(UserServiceABC):
     def __init__(self, repository: UserRepositoryABC):
         self.repository = repository
 
-    def create_user(self, new_user_data: CreateUserData, db: Session) -> User:
-        if self.repository.get_user_by_email(db, new_user_data.email):
+    async def create_user(
+        self, new_user_data: CreateUserData, db: DatabaseSession
+    ) -> User:
+        if await run_in_session(
+            db, lambda session: self._email_taken(session, new_user_data.email)
+        ):
             raise EmailAlreadyExistsException(new_user_data.email)
 
-        hashed_password = hash_password(new_user_data.password)
+        # Awaited on the event loop, between the two session steps: no
+        # threadpool thread or connection is held while bcrypt runs
+        hashed_password = await hash_password(new_user_data.password)
         new_user = User(
             email=new_user_data.email, password=hashed_password, is_active=True
         )
 
-        return self.repository.add_user(db, new_user)
+        return await run_in_session(
+            db, lambda session: self.repository.add_user(session, new_user)
+        )
 
     def get_user_by_id(self, user_id: str, db: Session) -> User | None:
         return self.repository.get_user_by_id(db, user_id)
+
+    # === Private Helpers ===
+
+    def _email_taken(self, db: Session, email: str) -> bool:
+        taken = self.repository.get_user_by_email(db, email) is not None
+        # End the read transaction so its connection goes back to the pool
+        db.commit()
+        return taken
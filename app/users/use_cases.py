@@ -2,13 +2,15 @@ from abc import ABC, abstractmethod
 
 from sqlalchemy.orm import Session
 
+from app.core.dependencies.database import DatabaseSession
+
 from .models import CreateUserData, User
 from .services import UserServiceABC
 
 
 class CreateUserUseCaseABC(ABC):
     @abstractmethod
-    def execute(self, new_user_data: CreateUserData, db: Session) -> User:
+    async def execute(self, new_user_data: CreateUserData, db: DatabaseSession) -> User:
         pass
 
 
@@ -22,8 +24,8 @@ class CreateUserUseCase(CreateUserUseCaseABC):
     def __init__(self, service: UserServiceABC):
         self.service = service
 
-    def execute(self, new_user_data: CreateUserData, db: Session) -> User:
-        return self.service.create_user(new_user_data, db)
+    async def execute(self, new_user_data: CreateUserData, db: DatabaseSession) -> User:
+        return await self.service.create_user(new_user_data, db)
 
 
 class GetUserByIdUseCase(GetUserByIdUseCaseABC):
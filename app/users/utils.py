@@ -1,5 +1,7 @@
 from passlib.context import CryptContext
 
+from app.core.workers import password_hashing_pool
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -7,5 +9,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # if we change the implementation later, we can do so here directly.
 # Remember to keep this in sync with app/auth/utils.py
 # Kept separate for clarity of concerns and to allow microservice separation.
-def hash_password(plain_password: str) -> str:
+async def hash_password(plain_password: str) -> str:
+    return await password_hashing_pool.run(_hash_password, plain_password)
+
+
+# Helper functions
+
+
+def _hash_password(plain_password: str) -> str:
     return pwd_context.hash(plain_password)
@@ -2,5 +2,5 @@
 from .composition import build_votes_router
 
 
-def init_service(app):
-    app.include_router(build_votes_router())
+def init_service(app, posts_cache=None):
+    app.include_router(build_votes_router(posts_cache))
@@ -1,16 +1,19 @@
 from fastapi import APIRouter
 
+from app.core.cache import TTLCache
+from app.core.tracing import traced
+
 from .policies import VotePolicy
-from .repositories import PostRepository, VoteRepository
+from .repositories import VoteRepository
 from .routes import VoteRoutes
 from .services import VoteService
-from .use_cases import VoteUseCase
+from .use_cases import BulkVoteUseCase, VoteUseCase
 
 
-def build_votes_router() -> APIRouter:
-    vote_repository = VoteRepository()
-    post_repository = PostRepository()
-    vote_policy = VotePolicy()
-    vote_service = VoteService(vote_repository, vote_policy, post_repository)
-    votes_use_case = VoteUseCase(vote_service)
-    return VoteRoutes(votes_use_case).router
+def build_votes_router(posts_cache: TTLCache | None = None) -> APIRouter:
+    vote_repository = traced(VoteRepository(), "repository")
+    vote_policy = traced(VotePolicy(), "policy")
+    vote_service = traced(VoteService(vote_repository, vote_policy), "service")
+    votes_use_case = traced(VoteUseCase(vote_service, posts_cache), "use_case")
+    bulk_vote_use_case = traced(BulkVoteUseCase(vote_service, posts_cache), "use_case")
+    return VoteRoutes(votes_use_case, bulk_vote_use_case).router
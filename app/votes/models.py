@@ -1,4 +1,8 @@
+from dataclasses import dataclass
+from enum import Enum
+
 from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.sql.sqltypes import TIMESTAMP
 
 from app.core.dependencies.database import Base
 
@@ -8,3 +12,18 @@ class Vote(Base):
 
     post_id = Column(String, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    # Feeds the time decay of the "hot" post ranking
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default="now()")
+
+
+class VoteResult(Enum):
+    APPLIED = "applied"
+    UNCHANGED = "unchanged"  # already voted, or no vote to remove
+    FORBIDDEN = "forbidden"
+    POST_NOT_FOUND = "post_not_found"
+
+
+@dataclass(frozen=True)
+class VoteData:
+    post_id: str
+    vote_direction: int  # 1 = upvote, 0 = remove the vote
@@ -1,8 +1,24 @@
+from sqlalchemy import ColumnElement, and_, false, true
+
 from app.posts.models import Post
+from app.posts.policies import PostPolicy
 from app.users.models import User
 
 
 class VotePolicy:
     @staticmethod
     def can_vote(post: Post, user: User) -> bool:
-        return bool(user.is_active) and str(post.owner_id) != user.id
+        return (
+            bool(user.is_active)
+            and str(post.owner_id) != user.id
+            and PostPolicy.can_view(post, user)
+        )
+
+    @staticmethod
+    def can_vote_clause(user: User) -> ColumnElement[bool]:
+        # SQL counterpart of can_vote, evaluated against the target post row
+        return and_(
+            true() if user.is_active else false(),
+            Post.owner_id != user.id,
+            PostPolicy.can_view_clause(user),
+        )
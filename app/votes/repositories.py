@@ -1,55 +1,176 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    delete,
+    exists,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, load_only
 
 from app.posts.models import Post
 
-from .models import Vote
+from .models import Vote, VoteResult
 
 
 class VoteRepositoryABC(ABC):
     @abstractmethod
-    def get_vote(self, post_id: str, user_id: str, db: Session) -> Vote:
-        """Return a vote for a post/user, or None if not found."""
+    def add_vote(
+        self, post_id: str, user_id: str, can_vote: ColumnElement[bool], db: Session
+    ) -> VoteResult:
+        """Add a vote for a post/user if the post exists and `can_vote` holds."""
         pass
 
     @abstractmethod
-    def add_vote(self, post_id: str, user_id: str, db: Session) -> None:
-        """Add a vote for a post/user."""
+    def remove_vote(
+        self, post_id: str, user_id: str, can_vote: ColumnElement[bool], db: Session
+    ) -> VoteResult:
+        """Remove a vote for a post/user if the post exists and `can_vote` holds."""
         pass
 
     @abstractmethod
-    def remove_vote(self, post_id: str, user_id: str, db: Session) -> None:
-        """Remove a vote for a post/user."""
+    def get_vote_targets(
+        self, post_ids: Sequence[str], user_id: str, db: Session
+    ) -> dict[str, tuple[Post, bool]]:
+        """
+        Return the existing posts among `post_ids` by id, each with whether the
+        user has voted on it. Posts only have the columns VotePolicy reads loaded.
+        """
+        pass
+
+    @abstractmethod
+    def apply_votes(
+        self, user_id: str, added: Sequence[str], removed: Sequence[str], db: Session
+    ) -> set[str]:
+        """
+        Add and remove the user's votes on posts, keeping votes_count in step.
+        Return the ids of the posts whose vote was actually added or removed.
+        """
         pass
 
 
 class VoteRepository(VoteRepositoryABC):
-    def get_vote(self, post_id: str, user_id: str, db: Session) -> Vote:
-        return (
-            db.query(Vote)
-            .filter(Vote.post_id == post_id, Vote.user_id == user_id)
-            .first()
+    # Each vote is one statement: the target post lookup with the policy check,
+    # the vote INSERT/DELETE and the votes_count update run as CTEs in a single
+    # round trip. The primary key settles concurrent double votes.
+
+    def add_vote(
+        self, post_id: str, user_id: str, can_vote: ColumnElement[bool], db: Session
+    ) -> VoteResult:
+        target = _target_post(post_id, can_vote)
+        inserted = (
+            insert(Vote)
+            .from_select(
+                ["post_id", "user_id"],
+                select(target.c.id, literal(user_id)).where(target.c.allowed),
+            )
+            .on_conflict_do_nothing()
+            .returning(Vote.post_id)
+            .cte("inserted")
         )
+        return _apply_vote_change(post_id, target, inserted, 1, db)
 
-    def add_vote(self, post_id: str, user_id: str, db: Session) -> None:
-        vote = Vote(post_id=post_id, user_id=user_id)
-        db.add(vote)
-        db.commit()
+    def remove_vote(
+        self, post_id: str, user_id: str, can_vote: ColumnElement[bool], db: Session
+    ) -> VoteResult:
+        target = _target_post(post_id, can_vote)
+        deleted = (
+            delete(Vote)
+            .where(
+                Vote.post_id.in_(select(target.c.id).where(target.c.allowed)),
+                Vote.user_id == user_id,
+            )
+            .returning(Vote.post_id)
+            .cte("deleted")
+        )
+        return _apply_vote_change(post_id, target, deleted, -1, db)
+
+    def get_vote_targets(
+        self, post_ids: Sequence[str], user_id: str, db: Session
+    ) -> dict[str, tuple[Post, bool]]:
+        voted = exists().where(Vote.post_id == Post.id, Vote.user_id == user_id)
+        rows = db.execute(
+            select(Post, voted.label("voted"))
+            .options(load_only(Post.id, Post.owner_id, Post.published))
+            .where(Post.id.in_(post_ids))
+        ).all()
+        return {str(post.id): (post, voted) for post, voted in rows}
 
-    def remove_vote(self, post_id: str, user_id: str, db: Session) -> None:
-        db.query(Vote).filter(Vote.post_id == post_id, Vote.user_id == user_id).delete(
-            synchronize_session=False
+    def apply_votes(
+        self, user_id: str, added: Sequence[str], removed: Sequence[str], db: Session
+    ) -> set[str]:
+        # One statement for the whole batch: the vote INSERT and DELETE feed
+        # the votes_count update with the rows they actually changed, so votes
+        # settled concurrently by other requests are not counted twice
+        changes = []
+        if added:
+            inserted = (
+                insert(Vote)
+                .values([{"post_id": post_id, "user_id": user_id} for post_id in added])
+                .on_conflict_do_nothing()
+                .returning(Vote.post_id)
+                .cte("inserted")
+            )
+            changes.append(select(inserted.c.post_id, literal(1).label("amount")))
+        if removed:
+            deleted = (
+                delete(Vote)
+                .where(Vote.user_id == user_id, Vote.post_id.in_(removed))
+                .returning(Vote.post_id)
+                .cte("deleted")
+            )
+            changes.append(select(deleted.c.post_id, literal(-1).label("amount")))
+        if not changes:
+            return set()
+
+        changed = union_all(*changes).cte("changed")
+        counted = (
+            update(Post)
+            .where(Post.id == changed.c.post_id)
+            .values(votes_count=Post.votes_count + changed.c.amount)
+            .returning(Post.id)
+            .cte("counted")
         )
+        counted_ids = {str(post_id) for post_id in db.scalars(select(counted.c.id))}
         db.commit()
+        return counted_ids
 
 
-class PostRepositoryABC(ABC):
-    @abstractmethod
-    def get_post(self, post_id: str, db: Session) -> Post | None:
-        pass
+# Helper functions
+
+
+def _target_post(post_id: str, can_vote: ColumnElement[bool]) -> CTE:
+    return (
+        select(Post.id, can_vote.label("allowed")).where(Post.id == post_id).cte("target")
+    )
+
 
+def _apply_vote_change(
+    post_id: str, target: CTE, changed: CTE, amount: int, db: Session
+) -> VoteResult:
+    # Relative update, so concurrent votes on the same post do not lose counts
+    counted = (
+        update(Post)
+        .where(Post.id == post_id, exists(select(changed.c.post_id)))
+        .values(votes_count=Post.votes_count + amount)
+        .returning(Post.id)
+        .cte("counted")
+    )
+    row = db.execute(
+        select(target.c.allowed, exists(select(counted.c.id)).label("applied"))
+    ).first()
+    db.commit()
 
-class PostRepository(PostRepositoryABC):
-    def get_post(self, post_id: str, db: Session) -> Post | None:
-        return db.query(Post).filter(Post.id == post_id).first()
+    if row is None:
+        return VoteResult.POST_NOT_FOUND
+    if not row.allowed:
+        return VoteResult.FORBIDDEN
+    if not row.applied:
+        return VoteResult.UNCHANGED
+    return VoteResult.APPLIED
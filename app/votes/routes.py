@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.dependencies.current_user import get_current_user
-from app.core.dependencies.database import get_db
+from app.core.dependencies.database import DatabaseSession, get_db, run_in_session
+from app.core.responses import FastJSONResponse
 from app.posts.exceptions import ForbiddenException
 from app.users.models import User
 
@@ -11,27 +12,36 @@ from .exceptions import (
     PostNotFoundException,
     VoteNotFoundException,
 )
-from .schemas import VotePost
-from .use_cases import VotesUseCaseABC
+from .models import VoteData, VoteResult
+from .schemas import VoteBulkResult, VotePost
+from .use_cases import BulkVoteUseCaseABC, VotesUseCaseABC
 
 
 class VoteRoutes:
-    def __init__(self, vote_use_case: VotesUseCaseABC):
+    def __init__(
+        self, vote_use_case: VotesUseCaseABC, bulk_vote_use_case: BulkVoteUseCaseABC
+    ):
         self._vote_use_case = vote_use_case
+        self._bulk_vote_use_case = bulk_vote_use_case
         self.router = APIRouter(prefix="/votes", tags=["Votes"])
         self._build_routes()
 
-    def vote(
+    async def vote(
         self,
         vote_data: VotePost,
-        db: Session = Depends(get_db),
+        db: DatabaseSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ):
 
         try:
             post_id = str(vote_data.post_id)
             vote_direction = vote_data.vote_direction
-            self._vote_use_case.execute(post_id, vote_direction, db, current_user)
+            await run_in_session(
+                db,
+                lambda session: self._vote_use_case.execute(
+                    post_id, vote_direction, session, current_user
+                ),
+            )
             return
 
         except PostNotFoundException:
@@ -58,5 +68,69 @@ class VoteRoutes:
                 detail="Vote does not exist",
             )
 
+    async def vote_in_bulk(
+        self,
+        votes_data: list[VotePost],
+        db: DatabaseSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+    ):
+        if not votes_data:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one vote is required",
+            )
+        if len(votes_data) > settings.votes_bulk_max_items:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Votes must not exceed {settings.votes_bulk_max_items}",
+            )
+
+        votes = [
+            VoteData(str(vote_data.post_id), vote_data.vote_direction)
+            for vote_data in votes_data
+        ]
+        results = await run_in_session(
+            db,
+            lambda session: self._bulk_vote_use_case.execute(
+                votes, session, current_user
+            ),
+        )
+
+        # Each vote gets the status POST /votes/ would answer; 207 unless all
+        # of them were applied
+        items = [_dump_bulk_item(vote, result) for vote, result in zip(votes, results)]
+        all_applied = all(result is VoteResult.APPLIED for result in results)
+        return FastJSONResponse(
+            {"data": items},
+            status_code=(
+                status.HTTP_200_OK if all_applied else status.HTTP_207_MULTI_STATUS
+            ),
+        )
+
     def _build_routes(self):
         self.router.post("/", status_code=status.HTTP_204_NO_CONTENT)(self.vote)
+        self.router.post(
+            "/bulk",
+            response_model=VoteBulkResult,
+            responses={status.HTTP_207_MULTI_STATUS: {"model": VoteBulkResult}},
+        )(self.vote_in_bulk)
+
+
+# Helper functions
+
+
+def _dump_bulk_item(vote: VoteData, result: VoteResult) -> dict:
+    if result is VoteResult.APPLIED:
+        code, detail = status.HTTP_204_NO_CONTENT, None
+    elif result is VoteResult.POST_NOT_FOUND:
+        code, detail = status.HTTP_404_NOT_FOUND, "Post does not exist"
+    elif result is VoteResult.FORBIDDEN:
+        code, detail = (
+            status.HTTP_403_FORBIDDEN,
+            "You are not allowed to vote on this post",
+        )
+    elif vote.vote_direction:
+        code, detail = status.HTTP_409_CONFLICT, "User has already voted on this post"
+    else:
+        code, detail = status.HTTP_404_NOT_FOUND, "Vote does not exist"
+    return {"post_id": vote.post_id, "status": code, "detail": detail}
@@ -12,3 +12,15 @@ class VotePost(BaseModel):
         if value not in (0, 1):
             raise ValueError("vote_direction must be 0 or 1")
         return value
+
+
+class VoteBulkItem(BaseModel):
+    """One vote of a bulk submission: the status the vote alone would get."""
+
+    post_id: str
+    status: int
+    detail: str | None = None
+
+
+class VoteBulkResult(BaseModel):
+    data: list[VoteBulkItem]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from sqlalchemy.orm import Session
 
@@ -9,8 +10,9 @@ from .exceptions import (
     PostNotFoundException,
     VoteNotFoundException,
 )
+from .models import VoteData, VoteResult
 from .policies import VotePolicy
-from .repositories import PostRepositoryABC, VoteRepositoryABC
+from .repositories import VoteRepositoryABC
 
 
 class VoteServiceABC(ABC):
@@ -22,35 +24,81 @@ class VoteServiceABC(ABC):
     def remove_vote(self, post_id: str, db: Session, current_user):
         pass
 
+    @abstractmethod
+    def vote_in_bulk(
+        self, votes: Sequence[VoteData], db: Session, current_user
+    ) -> list[VoteResult]:
+        pass
+
 
 class VoteService(VoteServiceABC):
-    def __init__(
-        self,
-        vote_repository: VoteRepositoryABC,
-        vote_policy: VotePolicy,
-        post_repository: PostRepositoryABC,
-    ):
+    def __init__(self, vote_repository: VoteRepositoryABC, vote_policy: VotePolicy):
         self._vote_repository = vote_repository
         self._vote_policy = vote_policy
-        self._post_repository = post_repository
 
     def add_vote(self, post_id: str, db: Session, current_user):
-        self._enforce_policies(post_id, db, current_user)
-        found_vote = self._vote_repository.get_vote(post_id, current_user.id, db)
-        if found_vote:
-            raise AlreadyVotedException()
-        self._vote_repository.add_vote(post_id, current_user.id, db)
+        result = self._vote_repository.add_vote(
+            post_id, current_user.id, self._vote_policy.can_vote_clause(current_user), db
+        )
+        _raise_for_rejected_vote(result, AlreadyVotedException)
 
     def remove_vote(self, post_id: str, db: Session, current_user):
-        self._enforce_policies(post_id, db, current_user)
-        found_vote = self._vote_repository.get_vote(post_id, current_user.id, db)
-        if not found_vote:
-            raise VoteNotFoundException()
-        self._vote_repository.remove_vote(post_id, current_user.id, db)
-
-    def _enforce_policies(self, post_id: str, db: Session, current_user):
-        post = self._post_repository.get_post(post_id, db)
-        if not post:
-            raise PostNotFoundException()
-        if not self._vote_policy.can_vote(post, current_user):
-            raise ForbiddenException()
+        result = self._vote_repository.remove_vote(
+            post_id, current_user.id, self._vote_policy.can_vote_clause(current_user), db
+        )
+        _raise_for_rejected_vote(result, VoteNotFoundException)
+
+    def vote_in_bulk(
+        self, votes: Sequence[VoteData], db: Session, current_user
+    ) -> list[VoteResult]:
+        targets = self._vote_repository.get_vote_targets(
+            list(dict.fromkeys(vote.post_id for vote in votes)), current_user.id, db
+        )
+
+        # Replay the votes in order against the current ones, so each gets the
+        # result it would get alone (even when a post appears twice), then
+        # store only the net changes
+        voted = {post_id: has_voted for post_id, (_, has_voted) in targets.items()}
+        results = []
+        for vote in votes:
+            target = targets.get(vote.post_id)
+            if target is None:
+                results.append(VoteResult.POST_NOT_FOUND)
+            elif not self._vote_policy.can_vote(target[0], current_user):
+                results.append(VoteResult.FORBIDDEN)
+            elif voted[vote.post_id] == bool(vote.vote_direction):
+                results.append(VoteResult.UNCHANGED)
+            else:
+                voted[vote.post_id] = bool(vote.vote_direction)
+                results.append(VoteResult.APPLIED)
+
+        added = [
+            post_id for post_id, now in voted.items() if now and not targets[post_id][1]
+        ]
+        removed = [
+            post_id for post_id, now in voted.items() if not now and targets[post_id][1]
+        ]
+        changed = self._vote_repository.apply_votes(current_user.id, added, removed, db)
+
+        # A concurrent request may have settled some of these votes first
+        settled_elsewhere = set(added + removed) - changed
+        return [
+            (
+                VoteResult.UNCHANGED
+                if result is VoteResult.APPLIED and vote.post_id in settled_elsewhere
+                else result
+            )
+            for vote, result in zip(votes, results)
+        ]
+
+
+# Helper functions
+
+
+def _raise_for_rejected_vote(result: VoteResult, unchanged_exception: type[Exception]):
+    if result is VoteResult.POST_NOT_FOUND:
+        raise PostNotFoundException()
+    if result is VoteResult.FORBIDDEN:
+        raise ForbiddenException()
+    if result is VoteResult.UNCHANGED:
+        raise unchanged_exception()
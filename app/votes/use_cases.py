@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
+from app.core.cache import TTLCache
+
+from .models import VoteData, VoteResult
 from .services import VoteServiceABC
 
 
@@ -10,11 +14,35 @@ class VotesUseCaseABC(ABC):
 
 
 class VoteUseCase(VotesUseCaseABC):
-    def __init__(self, vote_service: VoteServiceABC):
+    def __init__(self, vote_service: VoteServiceABC, posts_cache: TTLCache | None = None):
         self._vote_service = vote_service
+        self._posts_cache = posts_cache
 
     def execute(self, post_id: str, vote_direction: int, db, current_user) -> None:
         if vote_direction:  # 1 = upvote
             self._vote_service.add_vote(post_id, db, current_user)
         else:  # 0 = downvote
             self._vote_service.remove_vote(post_id, db, current_user)
+
+        # Listings show vote counts, so cached pages are stale now
+        if self._posts_cache is not None:
+            self._posts_cache.invalidate()
+
+
+class BulkVoteUseCaseABC(ABC):
+    @abstractmethod
+    def execute(self, votes: Sequence[VoteData], db, current_user) -> list[VoteResult]:
+        pass
+
+
+class BulkVoteUseCase(BulkVoteUseCaseABC):
+    def __init__(self, vote_service: VoteServiceABC, posts_cache: TTLCache | None = None):
+        self._vote_service = vote_service
+        self._posts_cache = posts_cache
+
+    def execute(self, votes: Sequence[VoteData], db, current_user) -> list[VoteResult]:
+        results = self._vote_service.vote_in_bulk(votes, db, current_user)
+
+        if VoteResult.APPLIED in results and self._posts_cache is not None:
+            self._posts_cache.invalidate()
+        return results
@@ -0,0 +1,418 @@
+"""Load-test the API with scripted scenarios and check for regressions.
+
+Starts the API under uvicorn (or targets --base-url), signs up a pool of users
+who each own a few posts, then runs weighted scenarios from many concurrent
+clients for a fixed duration:
+
+    login          POST /login (a pass of its own, see SCENARIOS)
+    list_posts     GET /posts/, GET /posts/?sort=top
+    search         GET /posts/?search=...
+    vote_storm     POST /votes/ on a handful of hot posts, adding and removing
+    create_update  POST /posts/, PATCH /posts/{post_id}
+
+Latencies are grouped per route template and reported as requests, errors,
+req/s and p50/p95/p99. Results are compared against a baseline JSON file and
+the run exits with status 1 when a route is slower or serves fewer requests
+than the baseline allows (see --tolerance). The baseline also records the
+machine and the API settings it was measured with; compare only runs from
+similar environments. The seeded users, posts and votes are removed afterwards
+when the API was started here.
+
+The API needs Postgres (votes and rankings use Postgres-only SQL), so point
+DATABASE_URL at a local database.
+
+Usage:
+    python -m benchmarks.api_load --concurrency 50 --duration 30
+    python -m benchmarks.api_load --save-baseline
+    python -m benchmarks.api_load --scenarios login --concurrency 4 \
+        --baseline benchmarks/baseline_login.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+from sqlalchemy import text
+
+from .support import UvicornServer, percentile
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+PASSWORD = "benchmark"
+SEARCH_TERMS = ("lorem", "benchmark", "load", "missing-term")
+
+
+@dataclass
+class RouteStats:
+    timings: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+@dataclass
+class LoadContext:
+    client: httpx.AsyncClient
+    users: list[dict[str, str]]
+    post_ids: list[str]
+    hot_post_ids: list[str]
+    stats: dict[str, RouteStats] = field(default_factory=lambda: defaultdict(RouteStats))
+
+    async def request(
+        self,
+        route: str,
+        method: str,
+        url: str,
+        expected: tuple[int, ...] = (200,),
+        **kwargs,
+    ) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            self.stats[route].errors += 1
+            return None
+        if response.status_code in expected:
+            self.stats[route].timings.append((time.perf_counter() - started) * 1000)
+        else:
+            self.stats[route].errors += 1
+        return response
+
+
+def main():
+    args = _parse_args()
+    run_id = uuid.uuid4().hex[:12]
+
+    if args.base_url:
+        report = asyncio.run(_run(args, args.base_url, run_id))
+    else:
+        try:
+            with UvicornServer(args.port, workers=args.workers) as server:
+                report = asyncio.run(_run(args, server.base_url, run_id))
+        finally:
+            _cleanup(run_id)
+
+    _print_report(report)
+    if args.save_baseline:
+        _save_baseline(args, report)
+        print(f"Baseline saved to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["settings"] != _settings(args):
+        print(f"Warning: the baseline was recorded with {baseline['settings']}")
+    if baseline.get("environment") != _environment(args):
+        print(f"Warning: the baseline was recorded on {baseline.get('environment')}")
+    regressions = _compare(report, baseline, args.tolerance)
+    if regressions:
+        print("\nREGRESSIONS against the baseline:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nNo regressions against {args.baseline}")
+
+
+# Scenarios
+
+
+async def login(context: LoadContext, user: dict[str, str]):
+    await context.request(
+        "POST /login",
+        "POST",
+        "/login",
+        data={"username": user["email"], "password": PASSWORD},
+    )
+
+
+async def list_posts(context: LoadContext, user: dict[str, str]):
+    await context.request(
+        "GET /posts/", "GET", "/posts/?size=10", headers=user["headers"]
+    )
+    await context.request(
+        "GET /posts/?sort=top", "GET", "/posts/?size=10&sort=top", headers=user["headers"]
+    )
+
+
+async def search(context: LoadContext, user: dict[str, str]):
+    await context.request(
+        "GET /posts/?search",
+        "GET",
+        f"/posts/?size=10&search={random.choice(SEARCH_TERMS)}",
+        headers=user["headers"],
+    )
+
+
+async def vote_storm(context: LoadContext, user: dict[str, str]):
+    # Everybody hammers the same few posts; 409 (already voted), 404 (vote
+    # already removed) and 403 (own post) are expected outcomes, not errors
+    post_id = random.choice(context.hot_post_ids)
+    for direction in (1, 0):
+        await context.request(
+            "POST /votes/",
+            "POST",
+            "/votes/",
+            expected=(204, 403, 404, 409),
+            json={"post_id": post_id, "vote_direction": direction},
+            headers=user["headers"],
+        )
+
+
+async def create_update(context: LoadContext, user: dict[str, str]):
+    response = await context.request(
+        "POST /posts/",
+        "POST",
+        "/posts/",
+        expected=(201,),
+        json={"title": "Load post", "content": "lorem ipsum"},
+        headers=user["headers"],
+    )
+    if response is None or response.status_code != 201:
+        return
+    await context.request(
+        "PATCH /posts/{post_id}",
+        "PATCH",
+        f"/posts/{response.json()['data']['id']}",
+        expected=(202,),
+        json={"title": "Load post (edited)", "content": "lorem ipsum"},
+        headers=user["headers"],
+    )
+
+
+# Scenario weights: reads dominate, as in production traffic. Logins run in
+# their own pass (--scenarios login) against benchmarks/baseline_login.json:
+# bcrypt's CPU would otherwise set the pace of every other route whenever the
+# hashing workers share cores with the API. That pass uses few clients, since
+# beyond the hashing workers extra logins only measure the pool's queue.
+SCENARIOS = {
+    login: 1,
+    list_posts: 10,
+    search: 4,
+    vote_storm: 6,
+    create_update: 2,
+}
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="target a running API instead of starting one")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--posts-per-user", type=int, default=5)
+    parser.add_argument("--hot-posts", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown of p95 and drop of req/s",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=[scenario.__name__ for scenario in SCENARIOS],
+        default=[scenario.__name__ for scenario in SCENARIOS if scenario is not login],
+        help="scenarios to run; login runs apart by default (see SCENARIOS)",
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    return parser.parse_args()
+
+
+async def _run(args, base_url: str, run_id: str) -> dict:
+    random.seed(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        users = await _seed_users(client, run_id, args.users)
+        post_ids = await _seed_posts(client, users, args.posts_per_user)
+        context = LoadContext(
+            client=client,
+            users=users,
+            post_ids=post_ids,
+            hot_post_ids=random.sample(post_ids, min(args.hot_posts, len(post_ids))),
+        )
+        selected = {
+            scenario: weight
+            for scenario, weight in SCENARIOS.items()
+            if scenario.__name__ in args.scenarios
+        }
+        scenarios, weights = list(selected), list(selected.values())
+        deadline = time.monotonic() + args.duration
+
+        async def worker():
+            while time.monotonic() < deadline:
+                scenario = random.choices(scenarios, weights)[0]
+                await scenario(context, random.choice(users))
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.monotonic() - started
+
+    return {
+        route: {
+            "requests": len(stats.timings),
+            "errors": stats.errors,
+            "rps": len(stats.timings) / elapsed,
+            "p50_ms": percentile(stats.timings, 50),
+            "p95_ms": percentile(stats.timings, 95),
+            "p99_ms": percentile(stats.timings, 99),
+        }
+        for route, stats in sorted(context.stats.items())
+    }
+
+
+async def _seed_users(
+    client: httpx.AsyncClient, run_id: str, count: int
+) -> list[dict[str, str]]:
+    users = []
+    for index in range(count):
+        email = f"load-{run_id}-{index}@example.com"
+        response = await client.post(
+            "/users/", json={"email": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        response = await client.post(
+            "/login", data={"username": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+        users.append({"email": email, "headers": {"Authorization": f"Bearer {token}"}})
+    return users
+
+
+async def _seed_posts(
+    client: httpx.AsyncClient, users: list[dict[str, str]], posts_per_user: int
+) -> list[str]:
+    post_ids = []
+    for user in users:
+        for index in range(posts_per_user):
+            response = await client.post(
+                "/posts/",
+                json={"title": f"Load benchmark post {index}", "content": "lorem ipsum"},
+                headers=user["headers"],
+            )
+            response.raise_for_status()
+            post_ids.append(response.json()["data"]["id"])
+    return post_ids
+
+
+def _print_report(report: dict):
+    print(
+        f"{'route':<26}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for route, row in report.items():
+        print(
+            f"{route:<26}{row['requests']:>10}{row['errors']:>8}{row['rps']:>10.1f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+
+
+def _save_baseline(args, report: dict):
+    baseline = {
+        "settings": _settings(args),
+        "environment": _environment(args),
+        "routes": {
+            route: {key: round(row[key], 2) for key in ("rps", "p95_ms", "p99_ms")}
+            for route, row in report.items()
+            if row["requests"]
+        },
+    }
+    args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def _settings(args) -> dict:
+    return {
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "users": args.users,
+        "workers": args.workers,
+        "scenarios": sorted(args.scenarios),
+    }
+
+
+def _environment(args) -> dict:
+    environment = {
+        "cpus": os.cpu_count(),
+        "cpu": _cpu_model(),
+        "python": platform.python_version(),
+    }
+    if args.base_url:
+        return environment  # the API's settings are not known here
+
+    # Imported here so --base-url runs do not need database settings
+    from app.core.config import settings
+
+    return {
+        **environment,
+        "database_stack": settings.database_stack,
+        "posts_search_strategy": settings.posts_search_strategy,
+        "password_hash_workers": settings.password_hash_workers,
+        "password_hash_max_queue": settings.password_hash_max_queue,
+        "posts_cache_enabled": settings.posts_cache_enabled,
+        "user_cache_enabled": settings.user_cache_enabled,
+    }
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for route, expected in baseline["routes"].items():
+        actual = report.get(route)
+        if actual is None or not actual["requests"]:
+            regressions.append(f"{route}: no successful requests")
+            continue
+        if actual["errors"]:
+            regressions.append(f"{route}: {actual['errors']} failed requests")
+        if actual["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{route}: p95 {actual['p95_ms']:.2f} ms > "
+                f"baseline {expected['p95_ms']:.2f} ms (+{tolerance:.0%})"
+            )
+        if actual["rps"] < expected["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{route}: {actual['rps']:.1f} req/s < "
+                f"baseline {expected['rps']:.1f} req/s (-{tolerance:.0%})"
+            )
+    return regressions
+
+
+def _cleanup(run_id: str):
+    # Imported here so --base-url runs do not need database settings
+    from app.core.dependencies.database import SessionLocal
+
+    # Posts and votes go away with their owners (ON DELETE CASCADE)
+    with SessionLocal() as db:
+        db.execute(
+            text("DELETE FROM users WHERE email LIKE :pattern"),
+            {"pattern": f"load-{run_id}-%@example.com"},
+        )
+        db.commit()
+
+
+if __name__ == "__main__":
+    main()
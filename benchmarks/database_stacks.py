@@ -0,0 +1,131 @@
+"""Compare throughput and p99 latency of the sync and async database stacks.
+
+Starts the API under uvicorn once per stack (DATABASE_STACK=sync|async), with
+the in-process caches disabled so every request reaches the database, and
+drives authenticated GET /posts and GET /posts/{id} requests from many
+concurrent clients for a fixed duration. The seeded user and posts are
+removed afterwards.
+
+Usage:
+    python -m benchmarks.database_stacks --concurrency 200 --duration 20
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+import uuid
+
+import httpx
+from sqlalchemy import text
+
+from app.core.dependencies.database import SessionLocal
+
+from .support import UvicornServer, percentile
+
+STACKS = ("sync", "async")
+
+
+def main():
+    args = _parse_args()
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    results = []
+    try:
+        for stack in STACKS:
+            env = {
+                "DATABASE_STACK": stack,
+                "POSTS_CACHE_ENABLED": "false",
+                "USER_CACHE_ENABLED": "false",
+            }
+            with UvicornServer(args.port, env):
+                results.append((stack, asyncio.run(_run(args, email))))
+    finally:
+        _cleanup(email)
+
+    print(
+        f"{'stack':<8}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p99 ms':>10}"
+    )
+    for stack, (timings, errors, elapsed) in results:
+        print(
+            f"{stack:<8}{len(timings):>10}{errors:>8}{len(timings) / elapsed:>10.1f}"
+            f"{percentile(timings, 50):>10.2f}{percentile(timings, 99):>10.2f}"
+        )
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=20, help="seconds")
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    return parser.parse_args()
+
+
+async def _run(args, email: str) -> tuple[list[float], int, float]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60
+    ) as client:
+        headers = await _authenticate(client, email)
+        post_ids = await _seed_posts(client, headers, args.posts)
+        paths = itertools.cycle(
+            ["/posts/?size=10"] + [f"/posts/{post_id}" for post_id in post_ids]
+        )
+
+        timings: list[float] = []
+        errors = 0
+        deadline = time.monotonic() + args.duration
+
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                response = await client.get(next(paths), headers=headers)
+                if response.status_code == 200:
+                    timings.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        return timings, errors, time.monotonic() - started
+
+
+async def _authenticate(client: httpx.AsyncClient, email: str) -> dict[str, str]:
+    # The user is created on the first run and reused by the next ones
+    await client.post("/users/", json={"email": email, "password": "benchmark"})
+    response = await client.post(
+        "/login", data={"username": email, "password": "benchmark"}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _seed_posts(
+    client: httpx.AsyncClient, headers: dict[str, str], posts: int
+) -> list[str]:
+    post_ids = []
+    for index in range(posts):
+        response = await client.post(
+            "/posts/",
+            json={"title": f"Benchmark post {index}", "content": "lorem ipsum"},
+            headers=headers,
+        )
+        response.raise_for_status()
+        post_ids.append(response.json()["data"]["id"])
+    return post_ids
+
+
+def _cleanup(email: str):
+    # Posts and votes go away with their owner (ON DELETE CASCADE)
+    with SessionLocal() as db:
+        db.execute(text("DELETE FROM users WHERE email = :email"), {"email": email})
+        db.commit()
+
+
+if __name__ == "__main__":
+    main()
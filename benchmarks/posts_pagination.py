@@ -0,0 +1,142 @@
+"""Compare offset and keyset pagination of GET /posts on a seeded dataset.
+
+Seeds a dedicated benchmark user with enough posts to reach the requested
+page, times the repository queries behind both pagination modes for the
+first and the deep page, and removes the seeded rows afterwards.
+
+Usage:
+    python -m benchmarks.posts_pagination --posts 100000 --size 10 --page 10000
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.core.dependencies.database import SessionLocal
+from app.posts.models import Post, PostCursor, PostView
+from app.posts.policies import PostPolicy
+from app.posts.repositories import PostRepository
+from app.users.models import User
+
+from .support import percentile
+
+
+def main():
+    args = _parse_args()
+    if args.posts < args.page * args.size:
+        raise SystemExit("Not enough posts to reach the requested page")
+
+    repository = PostRepository()
+    db = SessionLocal()
+    owner_id = str(uuid.uuid4())
+    # Listings as seen by another user: published posts, plus their own
+    can_view = PostPolicy.can_view_clause(User(id=str(uuid.uuid4())))
+    view = PostView.FULL
+    try:
+        _seed(db, owner_id, args.posts)
+        deep_cursor = _cursor_before_page(db, args.page, args.size)
+
+        results = [
+            (
+                "offset",
+                1,
+                lambda: repository.get_posts(
+                    1, args.size, None, None, view, can_view, db
+                ),
+            ),
+            (
+                "offset",
+                args.page,
+                lambda: repository.get_posts(
+                    args.page, args.size, None, None, view, can_view, db
+                ),
+            ),
+            (
+                "keyset",
+                1,
+                lambda: repository.get_posts_after(
+                    None, args.size, None, view, can_view, db
+                ),
+            ),
+            (
+                "keyset",
+                args.page,
+                lambda: repository.get_posts_after(
+                    deep_cursor, args.size, None, view, can_view, db
+                ),
+            ),
+        ]
+
+        print(f"{'mode':<8}{'page':>8}{'median ms':>12}{'p95 ms':>10}")
+        for mode, page, query in results:
+            timings = _measure(query, args.repeat)
+            print(
+                f"{mode:<8}{page:>8}{statistics.median(timings):>12.2f}"
+                f"{percentile(timings, 95):>10.2f}"
+            )
+    finally:
+        db.rollback()
+        _cleanup(db, owner_id)
+        db.close()
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    return parser.parse_args()
+
+
+def _seed(db, owner_id: str, posts: int):
+    db.add(User(id=owner_id, email=f"bench-{owner_id}@example.com", password="x"))
+    db.flush()
+    # Generated server side so seeding 100k rows takes seconds, not minutes
+    db.execute(
+        text(
+            "INSERT INTO posts (id, owner_id, title, content, created_at) "
+            "SELECT gen_random_uuid()::text, :owner_id, 'Benchmark post ' || g, "
+            "repeat('lorem ipsum ', 20), now() - g * interval '1 second' "
+            "FROM generate_series(1, :posts) AS g"
+        ),
+        {"owner_id": owner_id, "posts": posts},
+    )
+    db.commit()
+    db.execute(text("ANALYZE posts"))
+
+
+def _cursor_before_page(db, page: int, size: int) -> PostCursor:
+    last_post = (
+        db.query(Post)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .offset((page - 1) * size - 1)
+        .first()
+    )
+    return PostCursor(created_at=last_post.created_at, id=str(last_post.id))
+
+
+def _measure(query, repeat: int) -> list[float]:
+    query()  # warm up caches and the connection
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _cleanup(db, owner_id: str):
+    # Posts go away with their owner (ON DELETE CASCADE)
+    db.execute(text("DELETE FROM users WHERE id = :id"), {"id": owner_id})
+    db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Time serializing a GET /posts page: the response_model path against orjson.
+
+Builds in-memory Post rows (with owners, no database) and times turning a
+page of them into response bytes:
+
+    pydantic  PostWithVotes/PostOut per row, then FastAPI's response_model
+              validation and serialization, encoded with the stdlib json
+    orjson    dicts built once from the rows (dump_post_out), encoded by
+              FastJSONResponse, as GET /posts now does
+
+Usage:
+    python -m benchmarks.serialization --sizes 100 1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import FastJSONResponse
+from app.posts.models import Post
+from app.posts.schemas import PostOut, PostsPage, PostWithVotes, dump_post_out
+from app.users.models import User
+
+from .support import percentile
+
+
+def main():
+    args = _parse_args()
+    response_field = create_model_field(name="Response_get_posts", type_=PostsPage)
+    loop = asyncio.new_event_loop()
+
+    print(f"{'items':>6}{'path':>10}{'median ms':>12}{'p95 ms':>10}{'speedup':>10}")
+    for size in args.sizes:
+        rows = _make_rows(size)
+        medians = {}
+        for path, serialize in (
+            ("pydantic", lambda: _pydantic_path(rows, response_field, loop)),
+            ("orjson", lambda: _orjson_path(rows)),
+        ):
+            timings = _measure(serialize, args.repeat)
+            medians[path] = statistics.median(timings)
+            print(
+                f"{size:>6}{path:>10}{medians[path]:>12.3f}"
+                f"{percentile(timings, 95):>10.3f}"
+                f"{medians['pydantic'] / medians[path]:>9.1f}x"
+            )
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    return parser.parse_args()
+
+
+def _make_rows(size: int) -> list[tuple[Post, int]]:
+    now = datetime.now(timezone.utc)
+    owners = [
+        User(
+            id=str(uuid.uuid4()),
+            email=f"owner-{index}@example.com",
+            password="x",
+            is_active=True,
+            created_at=now,
+        )
+        for index in range(10)
+    ]
+    return [
+        (
+            Post(
+                id=str(uuid.uuid4()),
+                title=f"Post {index}",
+                content="lorem ipsum dolor sit amet " * 8,
+                published=True,
+                rating=None,
+                created_at=now,
+                owner=owners[index % len(owners)],
+            ),
+            index,
+        )
+        for index in range(size)
+    ]
+
+
+def _pydantic_path(rows, response_field, loop) -> bytes:
+    # What GET /posts did before: models per row, then FastAPI validates and
+    # serializes the content against the response_model
+    content = {
+        "data": [
+            PostWithVotes(Post=PostOut.model_validate(post), votes=votes)
+            for post, votes in rows
+        ],
+        "next_cursor": None,
+    }
+    serialized = loop.run_until_complete(
+        serialize_response(field=response_field, response_content=content)
+    )
+    return JSONResponse(serialized).body
+
+
+def _orjson_path(rows) -> bytes:
+    content = {
+        "data": [{"Post": dump_post_out(post), "votes": votes} for post, votes in rows],
+        "next_cursor": None,
+    }
+    return FastJSONResponse(content).body
+
+
+def _measure(serialize, repeat: int) -> list[float]:
+    serialize()  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        serialize()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+class UvicornServer:
+    """
+    Runs app.main:app under uvicorn in a subprocess for the duration of a
+    `with` block, with extra environment variables (e.g. settings overrides).
+    """
+
+    def __init__(self, port: int, env: dict[str, str] | None = None, workers: int = 1):
+        self.base_url = f"http://127.0.0.1:{port}"
+        self._port = port
+        self._env = env or {}
+        self._workers = workers
+        self._process: subprocess.Popen | None = None
+
+    def __enter__(self) -> "UvicornServer":
+        self._process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "app.main:app",
+                "--port",
+                str(self._port),
+                "--workers",
+                str(self._workers),
+                "--log-level",
+                "warning",
+            ],
+            env={**os.environ, **self._env},
+        )
+        _wait_until_ready(self.base_url)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._process.terminate()
+        self._process.wait()
+
+
+def percentile(values: list[float], percentile: int) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = round(percentile / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+# Helper functions
+
+
+def _wait_until_ready(base_url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/docs")
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise SystemExit(f"Server at {base_url} did not start")
@@ -0,0 +1,152 @@
+"""Time vote toggling with the single-statement repository against the old flow.
+
+Creates a post owner, a voter and one post, then alternates add/remove votes
+through VoteService and through the previous flow (post SELECT, vote SELECT,
+INSERT/DELETE, votes_count UPDATE), reporting latency and statements per
+vote. The seeded rows are removed afterwards.
+
+Against a local database each round trip is nearly free; pass --rtt-ms to add
+a simulated network round trip to every statement.
+
+Usage:
+    python -m benchmarks.votes_latency --repeat 500 --rtt-ms 1
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import event, text
+
+from app.core.dependencies.database import SessionLocal, engine
+from app.posts.models import Post
+from app.users.models import User
+from app.votes.models import Vote
+from app.votes.policies import VotePolicy
+from app.votes.repositories import VoteRepository
+from app.votes.services import VoteService
+
+from .support import percentile
+
+
+def main():
+    args = _parse_args()
+    # Keep the voter loaded across commits, so only vote statements are counted
+    db = SessionLocal(expire_on_commit=False)
+    owner, voter = _make_user(), _make_user()
+    post_id = str(uuid.uuid4())
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    try:
+        _seed(db, owner, voter, post_id)
+        service = VoteService(VoteRepository(), VotePolicy())
+        flows = [
+            ("single", lambda: service.add_vote(post_id, db, voter)),
+            ("single", lambda: service.remove_vote(post_id, db, voter)),
+            ("legacy", lambda: _legacy_add_vote(post_id, voter, db)),
+            ("legacy", lambda: _legacy_remove_vote(post_id, voter, db)),
+        ]
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+        print(f"{'flow':<8}{'median ms':>12}{'p95 ms':>10}{'statements':>12}")
+        for (flow, add_vote), (_, remove_vote) in zip(flows[::2], flows[1::2]):
+            statements = 0
+            timings = _measure(add_vote, remove_vote, args.repeat)
+            print(
+                f"{flow:<8}{statistics.median(timings):>12.2f}"
+                f"{percentile(timings, 95):>10.2f}"
+                f"{statements / (2 * (args.repeat + 1)):>12.1f}"
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        db.rollback()
+        _cleanup(db, owner, voter)
+        db.close()
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=0)
+    return parser.parse_args()
+
+
+def _make_user() -> User:
+    user_id = str(uuid.uuid4())
+    return User(id=user_id, email=f"bench-{user_id}@example.com", password="x")
+
+
+def _seed(db, owner: User, voter: User, post_id: str):
+    db.add_all([owner, voter])
+    db.flush()
+    db.add(Post(id=post_id, owner_id=owner.id, title="Benchmark", content="Votes"))
+    db.commit()
+
+
+def _legacy_add_vote(post_id: str, voter: User, db):
+    post = db.query(Post).filter(Post.id == post_id).first()
+    assert post and VotePolicy.can_vote(post, voter)
+    assert not _legacy_get_vote(post_id, voter, db)
+    db.add(Vote(post_id=post_id, user_id=voter.id))
+    _legacy_increment_votes_count(post_id, 1, db)
+    db.commit()
+
+
+def _legacy_remove_vote(post_id: str, voter: User, db):
+    post = db.query(Post).filter(Post.id == post_id).first()
+    assert post and VotePolicy.can_vote(post, voter)
+    assert _legacy_get_vote(post_id, voter, db)
+    db.query(Vote).filter(Vote.post_id == post_id, Vote.user_id == voter.id).delete(
+        synchronize_session=False
+    )
+    _legacy_increment_votes_count(post_id, -1, db)
+    db.commit()
+
+
+def _legacy_get_vote(post_id: str, voter: User, db) -> Vote | None:
+    return (
+        db.query(Vote)
+        .filter(Vote.post_id == post_id, Vote.user_id == voter.id)
+        .first()
+    )
+
+
+def _legacy_increment_votes_count(post_id: str, amount: int, db):
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.votes_count: Post.votes_count + amount}, synchronize_session=False
+    )
+
+
+def _measure(add_vote, remove_vote, repeat: int) -> list[float]:
+    add_vote()  # warm up caches and the connection
+    remove_vote()
+    timings = []
+    for _ in range(repeat):
+        for vote in (add_vote, remove_vote):
+            started = time.perf_counter()
+            vote()
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _cleanup(db, owner: User, voter: User):
+    # Posts and votes go away with their users (ON DELETE CASCADE)
+    db.execute(
+        text("DELETE FROM users WHERE id IN (:owner_id, :voter_id)"),
+        {"owner_id": owner.id, "voter_id": voter.id},
+    )
+    db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Generate a large synthetic dataset to reproduce production-scale query plans.
+
+Creates N users, M posts and K votes and streams them into Postgres with COPY
+in batches. Votes follow a Zipf distribution over posts (a few posts get most
+of them), post authorship is skewed the same way, and content lengths vary
+from a one-liner to a few paragraphs. Every user shares one precomputed bcrypt
+hash of --password, so seeding is not CPU-bound.
+
+Votes are copied into an unindexed staging table first and merged with
+ON CONFLICT DO NOTHING, so duplicate (post, user) pairs drawn by the skewed
+sampler are dropped by the database instead of being tracked in memory;
+further rounds top up until K votes exist or the posts are saturated.
+Finally posts.votes_count is reconciled, the post_rankings scores refreshed
+and the tables analyzed.
+
+Rows are added next to existing data; emails are namespaced by a run id.
+
+Usage:
+    python -m scripts.generate_sample_data --users 100000 --posts 1000000 \\
+        --votes 10000000
+"""
+
+import argparse
+import bisect
+import io
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.core.dependencies.database import SessionLocal, engine
+from app.posts.repositories import PostRepository
+from app.users.utils import pwd_context
+
+from .reconcile_votes_count import reconcile_votes_count
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua fastapi postgres python query "
+    "index cache vote ranking latency throughput benchmark deploy release"
+).split()
+SPREAD = timedelta(days=365)
+
+
+def main():
+    args = _parse_args()
+    random.seed(args.seed)
+    run_id = uuid.UUID(int=random.getrandbits(128)).hex[:8]
+    now = datetime.now(timezone.utc)
+    password = pwd_context.hash(args.password)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        started = time.monotonic()
+
+        user_ids = [_random_uuid() for _ in range(args.users)]
+        _copy(
+            cursor,
+            "users (id, email, password, created_at, is_active)",
+            (
+                (user_id, f"user-{run_id}-{index}@example.com", password, _ago(now), "t")
+                for index, user_id in enumerate(user_ids)
+            ),
+            args.batch_size,
+        )
+        connection.commit()
+        print(f"{args.users} users in {time.monotonic() - started:.1f}s")
+
+        post_ids = [_random_uuid() for _ in range(args.posts)]
+        post_created_at = [now - random.random() * SPREAD for _ in range(args.posts)]
+        owners = _zipf_sampler(user_ids, args.zipf_exponent)
+        _copy(
+            cursor,
+            "posts (id, title, content, published, created_at, owner_id, votes_count)",
+            (
+                (
+                    post_id,
+                    _text(random.randint(3, 12)).capitalize(),
+                    _text(int(random.lognormvariate(3.5, 1))),
+                    "t" if random.random() < 0.9 else "f",
+                    created_at.isoformat(),
+                    owners(),
+                    "0",
+                )
+                for post_id, created_at in zip(post_ids, post_created_at)
+            ),
+            args.batch_size,
+        )
+        connection.commit()
+        print(f"{args.posts} posts in {time.monotonic() - started:.1f}s")
+
+        votes = _copy_votes(cursor, connection, args, user_ids, post_ids, post_created_at)
+        print(f"{votes} votes in {time.monotonic() - started:.1f}s")
+    finally:
+        connection.close()
+
+    print(f"Reconciled votes_count on {reconcile_votes_count()} post(s)")
+    with SessionLocal() as db:
+        PostRepository().refresh_rankings(db)
+        db.execute(text("ANALYZE users, posts, votes"))
+        db.commit()
+    print(f"Done in {time.monotonic() - started:.1f}s")
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--votes", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _random_uuid() -> str:
+    # Seeded, so a run is reproducible
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+
+def _ago(now: datetime) -> str:
+    return (now - random.random() * SPREAD).isoformat()
+
+
+def _text(words: int) -> str:
+    # No tabs, newlines or backslashes, so rows need no COPY escaping
+    return " ".join(random.choices(WORDS, k=max(words, 1)))
+
+
+def _zipf_sampler(items: list, exponent: float):
+    # Rank order is shuffled so popularity does not follow insertion order
+    ranked = random.sample(items, len(items))
+    cum_weights = list(
+        itertools.accumulate(1 / rank**exponent for rank in range(1, len(ranked) + 1))
+    )
+    total = cum_weights[-1]
+    return lambda: ranked[bisect.bisect(cum_weights, random.random() * total)]
+
+
+def _copy(cursor, target: str, rows, batch_size: int):
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, batch_size)):
+        buffer = io.StringIO("".join("\t".join(row) + "\n" for row in batch))
+        cursor.copy_expert(f"COPY {target} FROM STDIN", buffer)
+
+
+def _copy_votes(
+    cursor, connection, args, user_ids, post_ids, post_created_at, max_rounds: int = 5
+) -> int:
+    cursor.execute(
+        "CREATE TEMP TABLE votes_staging "
+        "(post_id varchar, user_id varchar, created_at timestamptz)"
+    )
+    indexes = _zipf_sampler(range(len(post_ids)), args.zipf_exponent)
+    now = datetime.now(timezone.utc)
+    inserted = 0
+    for _ in range(max_rounds):
+        missing = args.votes - inserted
+        if missing <= 0:
+            break
+
+        def rows():
+            for _ in range(missing):
+                index = indexes()
+                created_at = post_created_at[index]
+                yield (
+                    post_ids[index],
+                    random.choice(user_ids),
+                    (created_at + random.random() * (now - created_at)).isoformat(),
+                )
+
+        _copy(
+            cursor,
+            "votes_staging (post_id, user_id, created_at)",
+            rows(),
+            args.batch_size,
+        )
+        cursor.execute(
+            "INSERT INTO votes (post_id, user_id, created_at) "
+            "SELECT post_id, user_id, created_at FROM votes_staging "
+            "ORDER BY post_id, user_id ON CONFLICT DO NOTHING"
+        )
+        added = cursor.rowcount
+        cursor.execute("TRUNCATE votes_staging")
+        connection.commit()
+        inserted += added
+        # Popular posts are saturated with voters; stop when rounds stall
+        if added < missing * 0.01:
+            break
+    return inserted
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Print traces exported by the API (TRACING_ENABLED=true) as span trees.
+
+Reads the OTLP/JSON lines written to TRACING_EXPORT_PATH and prints each
+trace as a tree with durations, so it is easy to see whether a request spent
+its time in policy checks, the database or serializing the response. The file
+can also be loaded into any OTLP-compatible viewer.
+
+Usage:
+    python -m scripts.print_traces traces.jsonl --last 5
+"""
+
+import argparse
+import json
+from collections import defaultdict, deque
+
+from app.core.config import settings
+
+
+def main():
+    args = _parse_args()
+    with open(args.path) as file:
+        lines = deque(file, maxlen=args.last)
+    for line in lines:
+        for spans in _traces(json.loads(line)):
+            _print_tree(spans)
+            print()
+
+
+# Helper functions
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", default=settings.tracing_export_path)
+    parser.add_argument("--last", type=int, default=10, help="traces to print")
+    return parser.parse_args()
+
+
+def _traces(request: dict) -> list[list[dict]]:
+    return [
+        scope_spans["spans"]
+        for resource_spans in request["resourceSpans"]
+        for scope_spans in resource_spans["scopeSpans"]
+    ]
+
+
+def _print_tree(spans: list[dict]):
+    children = defaultdict(list)
+    for span in spans:
+        children[span.get("parentSpanId")].append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: int(span["startTimeUnixNano"]))
+
+    (root,) = children[None]
+    total = _duration_ms(root)
+
+    def print_span(span: dict, depth: int):
+        duration = _duration_ms(span)
+        share = duration / total * 100 if total else 0
+        error = "  ERROR" if span["status"]["code"] == 2 else ""
+        print(f"{duration:>9.2f} ms {share:>5.1f}%  {'  ' * depth}{span['name']}{error}")
+        for child in children[span["spanId"]]:
+            print_span(child, depth + 1)
+
+    print_span(root, 0)
+
+
+def _duration_ms(span: dict) -> float:
+    return (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Repair posts.votes_count drift against the votes table.
+
+The counter is maintained by the votes repository in the same transaction
+as each vote, but rows changed outside the API (manual SQL, cascades from
+deleted users, bulk loads) can leave it out of sync. Run this to recompute
+the counters; only posts whose counter is wrong are updated. Votes cast
+while it runs may be missed, so prefer a quiet period.
+
+Usage:
+    python -m scripts.reconcile_votes_count
+"""
+
+from sqlalchemy import text
+
+from app.core.dependencies.database import SessionLocal
+
+RECONCILE_VOTES_COUNT = text(
+    """
+    UPDATE posts
+    SET votes_count = actual.votes
+    FROM (
+        SELECT posts.id, count(votes.post_id) AS votes
+        FROM posts
+        LEFT JOIN votes ON votes.post_id = posts.id
+        GROUP BY posts.id
+    ) AS actual
+    WHERE actual.id = posts.id AND posts.votes_count <> actual.votes
+    """
+)
+
+
+def reconcile_votes_count() -> int:
+    db = SessionLocal()
+    try:
+        result = db.execute(RECONCILE_VOTES_COUNT)
+        db.commit()
+        return result.rowcount
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print(f"Repaired votes_count on {reconcile_votes_count()} post(s)")
@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -17,7 +18,7 @@ class TestAuthService:
         self.auth_service = AuthService(repository=self.mock_repository)
         self.mock_db = Mock(spec=Session)
 
-    @patch("app.auth.services.verify_password")
+    @patch("app.auth.services.verify_password", new_callable=AsyncMock)
     def test_authenticate_user_happy_path(self, mock_verify_password):
         """Should return user object if authentication is successful."""
         stored_user = make_stored_user()
@@ -25,11 +26,14 @@ class TestAuthService:
         self.mock_repository.get_user_by_email.return_value = stored_user
         mock_verify_password.return_value = True
 
-        returned_user = self.auth_service.authenticate_user(
-            self.mock_db, str(stored_user.id), "correct_password"
+        returned_user = asyncio.run(
+            self.auth_service.authenticate_user(
+                self.mock_db, str(stored_user.id), "correct_password"
+            )
         )
 
         assert returned_user == stored_user
+        self.mock_db.commit.assert_called_once()
 
     def test_authenticate_user_not_found(self):
         """Should raise UserNotFoundException if user does not exist."""
@@ -38,16 +42,20 @@ class TestAuthService:
         with pytest.raises(UserNotFoundException):
             any_user_id = random_user_id()
             any_password = random_password()
-            self.auth_service.authenticate_user(
-                self.mock_db, str(any_user_id), any_password
+            asyncio.run(
+                self.auth_service.authenticate_user(
+                    self.mock_db, str(any_user_id), any_password
+                )
             )
 
-    @patch("app.auth.services.verify_password")
+    @patch("app.auth.services.verify_password", new_callable=AsyncMock)
     def test_authenticate_user_password_verification_error(self, mock_verify_password):
         """Should raise PasswordVerificationException if password is invalid."""
         mock_verify_password.return_value = False
 
         with pytest.raises(PasswordVerificationException):
-            self.auth_service.authenticate_user(
-                self.mock_db, str(random_user_id()), "invalid_password"
+            asyncio.run(
+                self.auth_service.authenticate_user(
+                    self.mock_db, str(random_user_id()), "invalid_password"
+                )
             )
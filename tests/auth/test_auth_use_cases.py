@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy.orm import Session
@@ -11,7 +12,7 @@ from tests.shared.test_helpers import random_password, random_string, random_use
 
 class TestAuthenticateUserUseCase:
     def setup_method(self):
-        self.auth_service_mock = Mock()
+        self.auth_service_mock = Mock(authenticate_user=AsyncMock())
         self.token_provider_mock = Mock()
         self.sut = AuthenticateUserUseCase(
             self.auth_service_mock, self.token_provider_mock
@@ -27,9 +28,11 @@ class TestAuthenticateUserUseCase:
 
         self.token_provider_mock.create_access_token.return_value = created_token
 
-        result = self.sut.execute(self.mock_db, str(user_id), correct_password)
+        result = asyncio.run(
+            self.sut.execute(self.mock_db, str(user_id), correct_password)
+        )
 
-        self.auth_service_mock.authenticate_user.assert_called_once_with(
+        self.auth_service_mock.authenticate_user.assert_awaited_once_with(
             self.mock_db, str(user_id), correct_password
         )
 
@@ -44,7 +47,9 @@ class TestAuthenticateUserUseCase:
         self.auth_service_mock.authenticate_user.side_effect = UserNotFoundException
 
         with pytest.raises(UserNotFoundException):
-            self.sut.execute(self.mock_db, non_existent_user_id, random_password())
+            asyncio.run(
+                self.sut.execute(self.mock_db, non_existent_user_id, random_password())
+            )
 
         self.token_provider_mock.create_access_token.assert_not_called()
 
@@ -57,6 +62,6 @@ class TestAuthenticateUserUseCase:
         )
 
         with pytest.raises(PasswordVerificationException):
-            self.sut.execute(self.mock_db, random_user_id(), wrong_password)
+            asyncio.run(self.sut.execute(self.mock_db, random_user_id(), wrong_password))
 
         self.token_provider_mock.create_access_token.assert_not_called()
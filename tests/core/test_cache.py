@@ -0,0 +1,67 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.sut = TTLCache(max_size=2, ttl=10, clock=self.clock)
+
+    def test_get_should_return_stored_value(self):
+        """Should count a hit when the key is cached."""
+        self.sut.put("key", "value")
+
+        assert self.sut.get("key") == "value"
+        assert self.sut.stats().hits == 1
+
+    def test_get_should_miss_unknown_key(self):
+        """Should return None and count a miss for unknown keys."""
+        assert self.sut.get("key") is None
+        assert self.sut.stats().misses == 1
+
+    def test_get_should_expire_entries_after_ttl(self):
+        """Should drop entries once their time-to-live has elapsed."""
+        self.sut.put("key", "value")
+        self.clock.now = 10
+
+        assert self.sut.get("key") is None
+        assert self.sut.stats().expirations == 1
+        assert self.sut.stats().size == 0
+
+    def test_put_should_evict_least_recently_used_entry(self):
+        """Should evict the least recently used entry when full."""
+        self.sut.put("a", 1)
+        self.sut.put("b", 2)
+        self.sut.get("a")
+
+        self.sut.put("c", 3)
+
+        assert self.sut.get("b") is None
+        assert self.sut.get("a") == 1
+        assert self.sut.get("c") == 3
+        assert self.sut.stats().evictions == 1
+
+    def test_invalidate_should_hide_existing_entries(self):
+        """Should not serve entries stored before an invalidation."""
+        self.sut.put("key", "value")
+
+        self.sut.invalidate()
+
+        assert self.sut.get("key") is None
+        assert self.sut.stats().invalidations == 1
+
+    def test_put_should_drop_values_computed_before_invalidation(self):
+        """Should ignore values tagged with an outdated generation."""
+        generation = self.sut.generation
+        self.sut.invalidate()
+
+        self.sut.put("key", "stale", generation)
+
+        assert self.sut.get("key") is None
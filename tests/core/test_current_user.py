@@ -0,0 +1,123 @@
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models  # noqa: F401  # register all tables on Base.metadata
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.dependencies import current_user
+from app.core.dependencies.database import REPLICA_SESSION, Base
+from app.users.models import User
+
+from ..shared.test_helpers import now_with_tz, random_email, random_user_id
+
+
+class TestFetchUser:
+    """
+    Integration tests for the cached user lookup behind get_current_user,
+    run on an in-memory SQLite database.
+    """
+
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine, autoflush=False)
+        self.selects = 0
+        event.listen(self.engine, "before_cursor_execute", self._count_select)
+        current_user.user_cache.invalidate()
+
+        self.user_id = random_user_id()
+        with self.session_factory() as db:
+            db.add(
+                User(
+                    id=self.user_id,
+                    email=random_email(),
+                    password="hashed",
+                    is_active=True,
+                    created_at=now_with_tz(),
+                )
+            )
+            db.commit()
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_fetch_user_should_serve_repeated_lookups_from_cache(self):
+        """Should query the users table only for the first lookup."""
+        with self.session_factory() as db:
+            current_user._fetch_user(self.user_id, db)
+        with self.session_factory() as db:
+            user = current_user._fetch_user(self.user_id, db)
+
+            assert user.id == self.user_id
+            assert user in db
+
+        assert self.selects == 1
+
+    def test_fetch_user_should_reload_user_after_deactivation(self):
+        """Should not serve a cached snapshot once the user was changed."""
+        with self.session_factory() as db:
+            user = current_user._fetch_user(self.user_id, db)
+            user.is_active = False
+            db.commit()
+
+        with self.session_factory() as db:
+            user = current_user._fetch_user(self.user_id, db)
+
+            assert user.is_active is False
+
+        assert self.selects == 2
+
+    def test_fetch_user_should_see_unsignalled_changes_after_the_ttl(self, monkeypatch):
+        """Should reload users changed in plain SQL once user_cache_ttl passed."""
+        now = [0.0]
+        monkeypatch.setattr(
+            current_user,
+            "user_cache",
+            TTLCache(max_size=10, ttl=settings.user_cache_ttl, clock=lambda: now[0]),
+        )
+        with self.session_factory() as db:
+            current_user._fetch_user(self.user_id, db)
+            # No ORM event, as for another worker or an admin script
+            db.execute(
+                text("UPDATE users SET is_active = false WHERE id = :id"),
+                {"id": self.user_id},
+            )
+            db.commit()
+
+        with self.session_factory() as db:
+            assert current_user._fetch_user(self.user_id, db).is_active is True
+        now[0] = settings.user_cache_ttl
+        with self.session_factory() as db:
+            assert current_user._fetch_user(self.user_id, db).is_active is False
+
+    def test_fetch_user_should_not_cache_unknown_users(self):
+        """Should look up unknown users every time."""
+        unknown_user_id = random_user_id()
+
+        with self.session_factory() as db:
+            assert current_user._fetch_user(unknown_user_id, db) is None
+            assert current_user._fetch_user(unknown_user_id, db) is None
+
+        assert self.selects == 2
+
+    def test_fetch_user_should_not_cache_users_read_from_a_replica(self):
+        """Should look up again users last read from a (possibly lagging) replica."""
+        replica_session_factory = sessionmaker(
+            bind=self.engine, autoflush=False, info={REPLICA_SESSION: True}
+        )
+
+        with replica_session_factory() as db:
+            current_user._fetch_user(self.user_id, db)
+        with replica_session_factory() as db:
+            current_user._fetch_user(self.user_id, db)
+
+        assert self.selects == 2
+
+    def _count_select(self, conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.selects += 1
@@ -0,0 +1,106 @@
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import QueuePool, create_engine
+
+from app.core.metrics import MetricsMiddleware, instrument_engine, render_metrics
+from app.core.workers import BoundedProcessPool
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsMiddleware:
+    def setup_method(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            if item_id == "missing":
+                raise HTTPException(status_code=404)
+            return {"id": item_id}
+
+        self.client = TestClient(app)
+
+    def test_should_label_requests_with_the_route_template(self):
+        """Should count requests per route template and status code."""
+        labels = {"method": "GET", "route": "/items/{item_id}"}
+        ok_before = _sample("http_requests_total", **labels, status="200")
+        missing_before = _sample("http_requests_total", **labels, status="404")
+        observed_before = _sample("http_request_duration_seconds_count", **labels)
+
+        self.client.get("/items/1")
+        self.client.get("/items/2")
+        self.client.get("/items/missing")
+
+        assert _sample("http_requests_total", **labels, status="200") == ok_before + 2
+        assert (
+            _sample("http_requests_total", **labels, status="404") == missing_before + 1
+        )
+        assert (
+            _sample("http_request_duration_seconds_count", **labels)
+            == observed_before + 3
+        )
+
+    def test_should_share_one_label_for_unmatched_paths(self):
+        """Should not create a label per unknown path."""
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = _sample("http_requests_total", **labels)
+
+        self.client.get("/nope/1")
+        self.client.get("/nope/2")
+
+        assert _sample("http_requests_total", **labels) == before + 2
+        assert _sample("http_requests_in_flight") == 0
+
+
+class TestInstrumentEngine:
+    def test_should_track_checked_out_connections(self, tmp_path):
+        """Should update the pool gauges on checkout and checkin."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'metrics.db'}",
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=1,
+        )
+        instrument_engine(engine)
+
+        with engine.connect():
+            assert _sample("db_pool_checked_out") == 1
+            assert _sample("db_pool_size") == 1
+            with engine.connect():
+                assert _sample("db_pool_checked_out") == 2
+                assert _sample("db_pool_overflow") == 1
+            # Kept idle in the pool, so it still counts as overflow
+            assert _sample("db_pool_checked_out") == 1
+            assert _sample("db_pool_overflow") == 1
+        # Closed, since the pool is full
+        assert _sample("db_pool_checked_out") == 0
+        assert _sample("db_pool_overflow") == 0
+        engine.dispose()
+
+
+class TestWorkerPoolMetrics:
+    def test_should_record_task_durations_per_pool_and_task(self):
+        """Should observe how long each task ran in a worker."""
+        pool = BoundedProcessPool(workers=1, max_queue=0, name="test_pool")
+        labels = {"pool": "test_pool", "task": "pow"}
+        try:
+            asyncio.run(pool.run(pow, 2, 10))
+        finally:
+            pool.shutdown()
+
+        assert _sample("worker_pool_task_duration_seconds_count", **labels) == 1
+        assert _sample("worker_pool_queue_wait_seconds_count", pool="test_pool") == 1
+
+
+def test_render_metrics_should_use_text_exposition_format():
+    """Should expose samples in the Prometheus text format."""
+    content, content_type = render_metrics()
+
+    assert content_type.startswith("text/plain")
+    assert b"# TYPE http_requests_total counter" in content
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+
+from app.core.pool import InstrumentedQueuePool, warm_up_pool
+from app.core.query_stats import QueryStatsMiddleware
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+class TestInstrumentedQueuePool:
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite:///file:pool?mode=memory&cache=shared&uri=true",
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2,
+        )
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_should_observe_checkout_waits(self):
+        """Should record how long each checkout took."""
+        before = _sample("db_pool_wait_seconds_count")
+
+        with self.engine.connect():
+            pass
+        with self.engine.connect():
+            pass
+
+        assert _sample("db_pool_wait_seconds_count") == before + 2
+
+    def test_should_observe_checkouts_made_by_sessions(self):
+        """Should time the checkout behind a session's first statement."""
+        before = _sample("db_pool_wait_seconds_count")
+
+        with Session(self.engine) as db:
+            db.execute(text("SELECT 1"))
+
+        assert _sample("db_pool_wait_seconds_count") == before + 1
+
+    def test_should_count_timeouts_when_the_pool_is_exhausted(self):
+        """Should count and re-raise checkouts that gave up waiting."""
+        before = _sample("db_pool_timeouts_total")
+
+        with self.engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                self.engine.connect()
+
+        assert _sample("db_pool_timeouts_total") == before + 1
+
+    def test_should_report_pool_wait_per_request(self):
+        """Should add the request's pool wait to its Server-Timing header."""
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware)
+        held = self.engine.connect()
+
+        @app.get("/items")
+        def list_items():
+            # Free the only connection while the request waits for it
+            threading.Timer(0.02, held.close).start()
+            with self.engine.connect():
+                return []
+
+        response = TestClient(app).get("/items")
+
+        server_timing = response.headers["Server-Timing"]
+        pool_wait_ms = float(server_timing.split("pool;dur=")[1].split(",")[0])
+        assert pool_wait_ms >= 10
+
+
+class TestWarmUpPool:
+    def test_should_leave_connections_open_in_the_pool(self, tmp_path):
+        """Should open the requested connections and keep them idle in the pool."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=3,
+        )
+
+        asyncio.run(warm_up_pool(engine, 3))
+
+        assert engine.pool.checkedin() == 3
+        assert engine.pool.checkedout() == 0
+        engine.dispose()
@@ -0,0 +1,114 @@
+import json
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.dependencies.database import run_in_session
+from app.core.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    build_profiles_router,
+    render_profile,
+)
+
+
+def _busy_work(db: Session):
+    return sum(i * i for i in range(20_000))
+
+
+def _build_client(store: ProfileStore, sample_rate: int = 0) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware, store=store, token="s3cret", sample_rate=sample_rate
+    )
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"value": await run_in_session(Mock(spec=Session), _busy_work)}
+
+    app.include_router(build_profiles_router(store, "s3cret"))
+    return TestClient(app)
+
+
+class TestProfilingMiddleware:
+    def setup_method(self):
+        self.store = ProfileStore(max_entries=2)
+
+    def test_should_profile_requests_with_the_admin_token(self):
+        """Should profile the request and send the id of its profile."""
+        response = _build_client(self.store).get(
+            "/items/1", headers={"X-Profile-Token": "s3cret"}
+        )
+
+        entry = self.store.get(int(response.headers["X-Profile-Id"]))
+        assert entry.route == "/items/{item_id}"
+        assert entry.status == 200
+        assert not entry.sampled
+        speedscope = json.loads(render_profile(entry.session, "speedscope"))
+        frames = {frame["name"] for frame in speedscope["shared"]["frames"]}
+        assert "_busy_work" in frames  # sampled on the threadpool
+
+    def test_should_ignore_requests_with_a_wrong_token(self):
+        """Should not profile requests unless the token matches."""
+        response = _build_client(self.store).get(
+            "/items/1", headers={"X-Profile-Token": "guess"}
+        )
+
+        assert "X-Profile-Id" not in response.headers
+        assert self.store.list() == []
+
+    def test_should_sample_requests_and_keep_the_latest(self):
+        """Should profile 1 in N requests into a bounded ring buffer."""
+        client = _build_client(self.store, sample_rate=1)
+
+        for item_id in range(3):
+            client.get(f"/items/{item_id}")
+
+        entries = self.store.list()
+        assert [entry.id for entry in entries] == [2, 3]
+        assert all(entry.sampled for entry in entries)
+        assert self.store.aggregate("GET", "/items/{item_id}") is not None
+        assert self.store.aggregate("GET", "/missing") is None
+
+
+class TestProfilesRouter:
+    def setup_method(self):
+        # Large enough to keep the profiles of the requests below as well
+        self.client = _build_client(ProfileStore(max_entries=10))
+        self.headers = {"X-Profile-Token": "s3cret"}
+
+    def test_should_hide_profiles_without_the_admin_token(self):
+        """Should answer 404 to requests without a valid token."""
+        self.client.get("/items/1", headers=self.headers)
+
+        assert self.client.get("/internal/profiles").status_code == 404
+        response = self.client.get(
+            "/internal/profiles/1", headers={"X-Profile-Token": "x"}
+        )
+        assert response.status_code == 404
+
+    def test_should_list_and_render_kept_profiles(self):
+        """Should list the kept profiles and render one or a route's aggregate."""
+        profile_id = self.client.get("/items/1", headers=self.headers).headers[
+            "X-Profile-Id"
+        ]
+
+        listed = self.client.get("/internal/profiles", headers=self.headers).json()
+        html = self.client.get(
+            f"/internal/profiles/{profile_id}?format=html", headers=self.headers
+        )
+        aggregate = self.client.get(
+            "/internal/profiles/aggregate",
+            params={"method": "get", "route": "/items/{item_id}"},
+            headers=self.headers,
+        )
+        unknown_format = self.client.get(
+            f"/internal/profiles/{profile_id}?format=pdf", headers=self.headers
+        )
+
+        assert [entry["id"] for entry in listed["data"]] == [int(profile_id)]
+        assert html.headers["content-type"].startswith("text/html")
+        assert aggregate.status_code == 200
+        assert unknown_format.status_code == 400
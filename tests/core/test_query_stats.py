@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.query_stats import (
+    QueryStatsMiddleware,
+    RepeatedQueryWarning,
+    instrument_queries,
+)
+
+
+def _build_client(engine, statements: int) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items")
+    def list_items():
+        with engine.connect() as conn:
+            for item_id in range(statements):
+                conn.execute(text("SELECT :item_id"), {"item_id": item_id})
+        return []
+
+    return TestClient(app)
+
+
+class TestQueryStats:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_should_send_statement_count_and_time_as_server_timing(self):
+        """Should report the request's statements in a Server-Timing header."""
+        instrument_queries(self.engine)
+
+        response = _build_client(self.engine, statements=3).get("/items")
+
+        server_timing = response.headers["Server-Timing"]
+        assert server_timing.startswith("db;dur=")
+        assert 'desc="3 statements"' in server_timing
+
+    def test_should_log_slow_queries_with_redacted_parameters(self, caplog):
+        """Should log the statement without the parameter values."""
+        instrument_queries(self.engine, slow_query_threshold=1e-9)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT :secret"), {"secret": "hunter2"})
+
+        (record,) = caplog.records
+        assert record.db_statement == "SELECT ?"
+        assert record.db_parameters == ["?"]
+        assert "hunter2" not in record.getMessage()
+
+    def test_should_warn_when_a_statement_repeats_in_one_request(self):
+        """Should flag likely N+1 queries once per request."""
+        instrument_queries(self.engine, repeat_threshold=2)
+        client = _build_client(self.engine, statements=5)
+
+        with pytest.warns(RepeatedQueryWarning) as record:
+            client.get("/items")
+
+        assert len(record) == 1
+
+    def test_should_not_warn_below_the_repeat_threshold(self, recwarn):
+        """Should stay quiet while statements repeat at most the threshold."""
+        instrument_queries(self.engine, repeat_threshold=2)
+
+        _build_client(self.engine, statements=2).get("/items")
+
+        assert not [w for w in recwarn if w.category is RepeatedQueryWarning]
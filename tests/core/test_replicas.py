@@ -0,0 +1,156 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.dependencies import database
+from app.core.dependencies.database import get_sync_read_db
+from app.core.replicas import (
+    READ_PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+    Replica,
+    ReplicaSet,
+    make_replica,
+)
+
+
+def _replica(name: str) -> Replica:
+    return Replica(name=name, engine=Mock(), session_factory=Mock(), ping=Mock())
+
+
+class TestReplicaSet:
+    def test_pick_should_go_round_robin(self):
+        """Should hand out the replicas in turn."""
+        first, second = _replica("first"), _replica("second")
+        sut = ReplicaSet([first, second])
+
+        assert [sut.pick() for _ in range(4)] == [first, second, first, second]
+
+    def test_pick_should_skip_unhealthy_replicas(self):
+        """Should only hand out healthy replicas, and none when all are down."""
+        first, second = _replica("first"), _replica("second")
+        sut = ReplicaSet([first, second])
+
+        sut.mark_unhealthy(first)
+        assert [sut.pick() for _ in range(3)] == [second, second, second]
+
+        sut.mark_unhealthy(second)
+        assert sut.pick() is None
+
+    def test_check_health_should_mark_replicas_by_their_ping(self):
+        """Should mark failing replicas unhealthy and recovered ones healthy."""
+        failing, recovered = _replica("failing"), _replica("recovered")
+        failing.ping.side_effect = OperationalError("SELECT 1", {}, Exception())
+        recovered.healthy = False
+        sut = ReplicaSet([failing, recovered])
+
+        sut.check_health()
+
+        assert failing.healthy is False
+        assert recovered.healthy is True
+
+
+class TestReadRouting:
+    """
+    Integration tests for get_read_db, with SQLite files standing in for the
+    primary and two replicas. Each database tells its name.
+    """
+
+    @pytest.fixture(autouse=True)
+    def databases(self, tmp_path, monkeypatch):
+        self.engines = {
+            name: create_engine(f"sqlite:///{tmp_path / name}.db")
+            for name in ("primary", "replica-1", "replica-2")
+        }
+        for name, engine in self.engines.items():
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE source (name TEXT)"))
+                conn.execute(text("INSERT INTO source VALUES (:name)"), {"name": name})
+
+        self.replicas = ReplicaSet(
+            [
+                make_replica(
+                    str(engine.url), engine, sessionmaker(autoflush=False, bind=engine)
+                )
+                for name, engine in self.engines.items()
+                if name != "primary"
+            ]
+        )
+        monkeypatch.setattr(database, "read_replicas", self.replicas)
+        monkeypatch.setattr(
+            database, "SessionLocal", sessionmaker(bind=self.engines["primary"])
+        )
+        self.client = TestClient(_build_app())
+        yield
+        for engine in self.engines.values():
+            engine.dispose()
+
+    def test_reads_should_alternate_between_replicas(self):
+        """Should read from each replica in turn, never from the primary."""
+        sources = [self.client.get("/source").json() for _ in range(4)]
+
+        assert sources == ["replica-1", "replica-2", "replica-1", "replica-2"]
+
+    def test_reads_should_go_to_the_primary_after_a_write(self):
+        """Should set the sticky cookie on a write and read from the primary."""
+        response = self.client.post("/writes")
+
+        assert response.cookies[READ_PRIMARY_COOKIE] == "1"
+        assert "Max-Age=5" in response.headers["set-cookie"]
+        assert self.client.get("/source").json() == "primary"
+
+    def test_failed_write_should_not_pin_reads_to_the_primary(self):
+        """Should not set the sticky cookie when the write failed."""
+        response = self.client.post("/writes?fail=true")
+
+        assert READ_PRIMARY_COOKIE not in response.cookies
+        assert self.client.get("/source").json() == "replica-1"
+
+    def test_reads_should_skip_a_replica_whose_health_check_fails(self):
+        """Should route around a replica whose ping fails."""
+        self.replicas.replicas[0].ping = Mock(
+            side_effect=OperationalError("SELECT 1", {}, Exception())
+        )
+        self.replicas.check_health()
+
+        sources = {self.client.get("/source").json() for _ in range(3)}
+
+        assert sources == {"replica-2"}
+
+    def test_reads_should_fall_back_to_the_primary_without_healthy_replicas(self):
+        """Should read from the primary when every replica is down."""
+        for replica in self.replicas.replicas:
+            self.replicas.mark_unhealthy(replica)
+
+        assert self.client.get("/source").json() == "primary"
+
+    def test_failed_read_should_mark_the_replica_unhealthy(self):
+        """Should stop reading from a replica once a read on it fails."""
+        with self.engines["replica-1"].begin() as conn:
+            conn.execute(text("DROP TABLE source"))
+
+        with pytest.raises(OperationalError):
+            self.client.get("/source")
+
+        assert self.replicas.replicas[0].healthy is False
+        assert self.client.get("/source").json() == "replica-2"
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window=5)
+
+    @app.get("/source")
+    def read_source(db: Session = Depends(get_sync_read_db)):
+        return db.scalar(text("SELECT name FROM source"))
+
+    @app.post("/writes", status_code=201)
+    def write(fail: bool = False):
+        if fail:
+            raise HTTPException(status_code=409)
+
+    return app
@@ -0,0 +1,35 @@
+import threading
+
+from app.core.tasks import PeriodicTask
+
+
+class TestPeriodicTask:
+    def test_start_should_keep_running_after_failures(self):
+        """Should log a failed run and try again on the next interval."""
+        runs = []
+        done = threading.Event()
+
+        def task():
+            runs.append(len(runs))
+            if len(runs) == 1:
+                raise RuntimeError("first run fails")
+            done.set()
+
+        sut = PeriodicTask("test-task", 0.01, task)
+        sut.start()
+        try:
+            assert done.wait(timeout=2)
+        finally:
+            sut.stop()
+
+        assert len(runs) >= 2
+
+    def test_stop_should_not_run_task_again(self):
+        """Should stop scheduling runs once stopped."""
+        runs = []
+        sut = PeriodicTask("test-task", 60, lambda: runs.append(1))
+
+        sut.start()
+        sut.stop()
+
+        assert runs == []
@@ -0,0 +1,147 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.tracing import (
+    FileSpanExporter,
+    Span,
+    TracingMiddleware,
+    TracingProxy,
+    instrument_engine_tracing,
+    traced,
+)
+
+
+class FakeRepository:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def get_item(self, item_id: str):
+        with self._engine.connect() as conn:
+            return conn.execute(text("SELECT :item_id"), {"item_id": item_id}).scalar()
+
+
+class FakeService:
+    def __init__(self, repository):
+        self._repository = repository
+
+    def get_item(self, item_id: str):
+        if item_id == "boom":
+            raise ValueError(item_id)
+        return self._repository.get_item(item_id)
+
+    async def get_item_later(self, item_id: str):
+        await asyncio.sleep(0)
+        return self._repository.get_item(item_id)
+
+
+def _read_spans(path) -> dict[str, dict]:
+    (line,) = path.read_text().splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    return {span["name"]: span for span in scope_spans["spans"]}
+
+
+class TestTracing:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        instrument_engine_tracing(self.engine)
+        repository = TracingProxy(FakeRepository(self.engine), "repository")
+        self.service = TracingProxy(FakeService(repository), "service")
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def _client(self, tmp_path) -> TestClient:
+        self.exporter = FileSpanExporter(str(tmp_path / "traces.jsonl"))
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware, exporter=self.exporter)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            return {"value": self.service.get_item(item_id)}
+
+        @app.get("/later/{item_id}")
+        async def get_item_later(item_id: str):
+            return {"value": await self.service.get_item_later(item_id)}
+
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_should_export_nested_spans_per_layer(self, tmp_path):
+        """Should record route, service, repository and db spans as a tree."""
+        self._client(tmp_path).get("/items/1")
+
+        self.exporter.shutdown()
+        spans = _read_spans(tmp_path / "traces.jsonl")
+        root = spans["GET /items/{item_id}"]
+        service = spans["service FakeService.get_item"]
+        repository = spans["repository FakeRepository.get_item"]
+        db = spans["db SELECT"]
+        assert "parentSpanId" not in root
+        assert service["parentSpanId"] == root["spanId"]
+        assert repository["parentSpanId"] == service["spanId"]
+        assert db["parentSpanId"] == repository["spanId"]
+        assert len({span["traceId"] for span in spans.values()}) == 1
+
+    def test_should_keep_spans_of_coroutines_open_until_they_finish(self, tmp_path):
+        """Should record calls made after an await under the coroutine's span."""
+        response = self._client(tmp_path).get("/later/1")
+
+        assert response.json() == {"value": "1"}
+        self.exporter.shutdown()
+        spans = _read_spans(tmp_path / "traces.jsonl")
+        service = spans["service FakeService.get_item_later"]
+        repository = spans["repository FakeRepository.get_item"]
+        assert repository["parentSpanId"] == service["spanId"]
+        assert int(service["endTimeUnixNano"]) >= int(repository["endTimeUnixNano"])
+
+    def test_should_mark_failed_calls_as_errors(self, tmp_path):
+        """Should set the error status on spans whose call raised."""
+        self._client(tmp_path).get("/items/boom")
+
+        self.exporter.shutdown()
+        spans = _read_spans(tmp_path / "traces.jsonl")
+        assert spans["service FakeService.get_item"]["status"]["code"] == 2
+
+    def test_should_not_record_spans_outside_a_traced_request(self):
+        """Should call through without a trace in progress."""
+        assert self.service.get_item("1") == "1"
+
+
+def test_file_span_exporter_should_append_queued_traces_in_order(tmp_path):
+    """Should write every queued trace, one line each, by shutdown."""
+    path = tmp_path / "traces.jsonl"
+    exporter = FileSpanExporter(str(path), batch_size=2)
+    traces = [
+        [
+            Span(
+                trace_id=f"{index:032x}",
+                span_id="1" * 16,
+                parent_id=None,
+                name=str(index),
+                start_ns=1,
+                end_ns=2,
+            )
+        ]
+        for index in range(5)
+    ]
+
+    for spans in traces:
+        exporter.export(spans)
+    exporter.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    names = [
+        line["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for line in lines
+    ]
+    assert names == ["0", "1", "2", "3", "4"]
+
+
+def test_traced_should_return_the_target_when_tracing_is_disabled():
+    """Should not add a proxy (or its overhead) unless tracing is enabled."""
+    target = object()
+
+    assert traced(target, "service") is target
@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.exceptions import WorkerPoolSaturatedException
+from app.core.workers import BoundedProcessPool
+
+
+class TestBoundedProcessPool:
+    def setup_method(self):
+        self.sut = BoundedProcessPool(workers=1, max_queue=0)
+
+    def teardown_method(self):
+        self.sut.shutdown()
+
+    def test_run_should_return_result_and_record_timings(self):
+        """Should run the call in a worker and record its timings."""
+        assert asyncio.run(self.sut.run(pow, 2, 10)) == 1024
+
+        stats = self.sut.stats()
+        assert stats.completed == 1
+        assert stats.in_flight == 0
+        assert stats.run_seconds_total >= 0
+
+    def test_run_should_reject_calls_when_queue_is_full(self):
+        """Should fail fast instead of queueing beyond the configured depth."""
+
+        async def run_while_busy():
+            busy = asyncio.create_task(self.sut.run(time.sleep, 0.5))
+            while self.sut.stats().in_flight == 0:
+                await asyncio.sleep(0.01)
+            try:
+                with pytest.raises(WorkerPoolSaturatedException):
+                    await self.sut.run(pow, 2, 2)
+            finally:
+                await busy
+
+        asyncio.run(run_while_busy())
+        assert self.sut.stats().rejected == 1
+
+    def test_run_should_propagate_worker_errors(self):
+        """Should raise the worker's exception and release the slot."""
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(self.sut.run(divmod, 1, 0))
+
+        assert asyncio.run(self.sut.run(pow, 3, 2)) == 9
@@ -0,0 +1,332 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert, true
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models  # noqa: F401  # register all tables on Base.metadata
+from app.core.dependencies.database import Base
+from app.posts.exceptions import PostsNotCreatedException
+from app.posts.models import Post, PostBulkMode, PostSort, PostView, post_rankings
+from app.posts.policies import PostPolicy
+from app.posts.repositories import PostRepository
+from app.posts.schemas import PostOut, PostSummary
+from app.users.models import User
+
+from ..shared.test_helpers import now_with_tz, random_email, random_user_id
+
+
+class TestPostQueries:
+    """
+    Integration tests counting the SQL statements behind post reads, run on
+    an in-memory SQLite database.
+    """
+
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record_statement)
+        # Mirrors SessionLocal, which keeps objects loaded after commit
+        self.session_factory = sessionmaker(
+            bind=self.engine, autoflush=False, expire_on_commit=False
+        )
+        self.sut = PostRepository()
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_get_posts_should_load_owners_in_one_statement(self):
+        """Should serialize a 100-post page with a single SELECT."""
+        _seed_posts_with_distinct_owners(self.session_factory, 100)
+
+        with self.session_factory() as db:
+            self.statements.clear()
+            posts = self.sut.get_posts(1, 100, None, None, PostView.FULL, true(), db)
+            serialized = [PostOut.model_validate(post) for post, _ in posts]
+
+        assert len(serialized) == 100
+        assert len(self.statements) == 1
+
+    def test_get_posts_after_should_load_owners_in_one_statement(self):
+        """Should serialize a 100-post keyset page with a single SELECT."""
+        _seed_posts_with_distinct_owners(self.session_factory, 100)
+
+        with self.session_factory() as db:
+            self.statements.clear()
+            posts = self.sut.get_posts_after(None, 100, None, PostView.FULL, true(), db)
+            serialized = [PostOut.model_validate(post) for post, _ in posts]
+
+        assert len(serialized) == 100
+        assert len(self.statements) == 1
+
+    def test_get_posts_should_filter_with_the_view_clause_and_fill_pages(self):
+        """Should hide others' unpublished posts in the query, keeping pages full."""
+        owner_ids = _seed_posts_with_distinct_owners(self.session_factory, 6, True)
+        with self.session_factory() as db:
+            # Every other post is a draft; the viewer owns the first (newest) one
+            db.query(Post).filter(Post.owner_id.in_(owner_ids[::2])).update(
+                {Post.published: False}
+            )
+            db.commit()
+        viewer = User(id=owner_ids[0])
+
+        with self.session_factory() as db:
+            page = self.sut.get_posts(
+                1, 3, None, None, PostView.FULL, PostPolicy.can_view_clause(viewer), db
+            )
+            keyset_page = self.sut.get_posts_after(
+                None, 3, None, PostView.FULL, PostPolicy.can_view_clause(viewer), db
+            )
+
+        expected_titles = ["Post 0", "Post 1", "Post 3"]
+        assert [post.title for post, _ in page] == expected_titles
+        assert [post.title for post, _ in keyset_page] == expected_titles
+
+    def test_ranked_listings_should_include_posts_created_since_the_last_refresh(self):
+        """Should rank a new post with a score of 0 before any refresh."""
+        ranked_ids = _seed_posts_with_distinct_owners(self.session_factory, 2)
+        with self.session_factory() as db:
+            # Scores as of the last refresh
+            db.execute(
+                insert(post_rankings),
+                [
+                    {"post_id": ranked_ids[0], "top_score": 0, "hot_score": 0.0},
+                    {"post_id": ranked_ids[1], "top_score": 3, "hot_score": 1.5},
+                ],
+            )
+            db.commit()
+            owner_id = db.get(Post, ranked_ids[0]).owner_id
+            new_post = self.sut.create_post(_new_posts(owner_id, ["New"])[0], db)
+            new_id = str(new_post.id)
+
+        with self.session_factory() as db:
+            top = self.sut.get_posts(1, 10, None, PostSort.TOP, PostView.FULL, true(), db)
+            hot = self.sut.get_posts(1, 10, None, PostSort.HOT, PostView.FULL, true(), db)
+
+        unranked = sorted([ranked_ids[0], new_id])
+        assert [str(post.id) for post, _ in top] == [ranked_ids[1], *unranked]
+        assert [str(post.id) for post, _ in hot] == [ranked_ids[1], *unranked]
+
+    def test_get_draft_owner_ids_should_list_owners_of_unpublished_posts(self):
+        """Should return each owner with a draft once, and nobody else."""
+        owner_ids = _seed_posts_with_distinct_owners(self.session_factory, 3, True)
+        with self.session_factory() as db:
+            db.query(Post).filter(Post.owner_id == owner_ids[0]).update(
+                {Post.published: False}
+            )
+            db.query(Post).filter(Post.owner_id == owner_ids[1]).update(
+                {Post.published: None}
+            )
+            db.commit()
+
+        with self.session_factory() as db:
+            draft_owner_ids = self.sut.get_draft_owner_ids(db)
+
+        assert draft_owner_ids == {owner_ids[0], owner_ids[1]}
+
+    def test_get_post_by_id_should_load_owner_in_one_statement(self):
+        """Should serialize a single post with a single SELECT."""
+        post_id = _seed_posts_with_distinct_owners(self.session_factory, 1)[0]
+
+        with self.session_factory() as db:
+            self.statements.clear()
+            post = self.sut.get_post_by_id(post_id, PostView.FULL, db)
+            PostOut.model_validate(post)
+
+        assert len(self.statements) == 1
+
+    def test_get_posts_by_ids_should_load_a_batch_in_one_statement(self):
+        """Should load the posts, owners and vote counts of a batch at once."""
+        post_ids = _seed_posts_with_distinct_owners(self.session_factory, 20)
+
+        with self.session_factory() as db:
+            self.statements.clear()
+            posts = self.sut.get_posts_by_ids(
+                post_ids[:10] + ["missing"], PostView.FULL, db
+            )
+            serialized = [PostOut.model_validate(post) for post, _ in posts]
+
+        assert {str(post.id) for post in serialized} == set(post_ids[:10])
+        assert len(self.statements) == 1
+
+    def test_summary_reads_should_load_an_excerpt_instead_of_the_content(self):
+        """Should select a truncated excerpt and never the full content."""
+        post_id = _seed_posts_with_distinct_owners(self.session_factory, 1)[0]
+        with self.session_factory() as db:
+            db.query(Post).update({Post.content: "x" * 300})
+            db.commit()
+        self.sut = PostRepository(excerpt_length=10)
+
+        with self.session_factory() as db:
+            self.statements.clear()
+            (post, _), *_ = self.sut.get_posts(
+                1, 10, None, None, PostView.SUMMARY, true(), db
+            )
+            summary = PostSummary.model_validate(post)
+            by_id = self.sut.get_post_by_id(post_id, PostView.SUMMARY, db)
+
+        assert summary.excerpt == "x" * 10 + "..."
+        assert by_id.excerpt == "x" * 10 + "..."
+        assert len(self.statements) == 2
+        assert all("posts.content AS" not in s for s in self.statements)
+
+    def test_create_post_should_issue_a_single_insert(self):
+        """Should INSERT ... RETURNING plus the post's ranking row, owner from session."""
+        owner_id = _seed_posts_with_distinct_owners(self.session_factory, 1, True)[0]
+
+        with self.session_factory() as db:
+            owner = db.get(User, owner_id)
+            self.statements.clear()
+            new_post = Post(
+                owner_id=owner.id,
+                title="New post",
+                content="Content",
+                published=True,
+                created_at=now_with_tz(),
+            )
+            PostOut.model_validate(self.sut.create_post(new_post, db))
+
+        assert len(self.statements) == 2
+        assert self.statements[0].startswith("INSERT INTO posts")
+        assert "RETURNING" in self.statements[0]
+        assert self.statements[1].startswith("INSERT INTO post_rankings")
+
+    def test_create_posts_should_issue_a_single_insert(self):
+        """Should store a batch with one multi-row INSERT ... RETURNING, then rankings."""
+        owner_id = _seed_posts_with_distinct_owners(self.session_factory, 1, True)[0]
+
+        with self.session_factory() as db:
+            db.get(User, owner_id)  # the current user, loaded by authentication
+            self.statements.clear()
+            posts = self.sut.create_posts(
+                _new_posts(owner_id, ["A", "B", "C"]), PostBulkMode.ATOMIC, db
+            )
+            serialized = [PostOut.model_validate(post) for post in posts]
+
+        assert [post.title for post in serialized] == ["A", "B", "C"]
+        assert {str(post.owner.id) for post in serialized} == {owner_id}
+        inserts = [s for s in self.statements if s.startswith("INSERT")]
+        assert len(inserts) == 2
+        assert inserts[0].startswith("INSERT INTO posts")
+        assert "RETURNING" in inserts[0]
+        assert inserts[1].startswith("INSERT INTO post_rankings")
+
+    def test_create_posts_should_store_nothing_when_an_atomic_batch_fails(self):
+        """Should roll the whole batch back when the database rejects a post."""
+        owner_id = _seed_posts_with_distinct_owners(self.session_factory, 1, True)[0]
+
+        with self.session_factory() as db:
+            with pytest.raises(PostsNotCreatedException):
+                self.sut.create_posts(
+                    _new_posts(owner_id, ["A", None, "C"]), PostBulkMode.ATOMIC, db
+                )
+            count = db.query(Post).count()
+
+        assert count == 1
+
+    def test_create_posts_should_store_accepted_posts_in_best_effort_mode(self):
+        """Should store every post the database accepts and None for the others."""
+        owner_id = _seed_posts_with_distinct_owners(self.session_factory, 1, True)[0]
+
+        with self.session_factory() as db:
+            posts = self.sut.create_posts(
+                _new_posts(owner_id, ["A", None, "C"]), PostBulkMode.BEST_EFFORT, db
+            )
+            titles = {title for (title,) in db.query(Post.title)}
+
+        assert [post and post.title for post in posts] == ["A", None, "C"]
+        assert titles == {"Post 0", "A", "C"}
+
+    def test_update_post_should_issue_a_single_update(self):
+        """Should UPDATE ... RETURNING and take the owner from the session."""
+        owner_id = _seed_posts_with_distinct_owners(self.session_factory, 1, True)[0]
+
+        with self.session_factory() as db:
+            owner = db.get(User, owner_id)
+            post_id = db.query(Post.id).filter(Post.owner_id == owner_id).scalar()
+            self.statements.clear()
+            post = self.sut.update_post(
+                post_id,
+                {Post.title: "Updated"},
+                PostPolicy.can_update_clause(owner),
+                db,
+            )
+            post_out = PostOut.model_validate(post)
+
+        assert post_out.title == "Updated"
+        assert len(self.statements) == 1
+        assert self.statements[0].startswith("UPDATE")
+
+    def test_update_post_should_skip_posts_denied_by_policy(self):
+        """Should leave the post untouched when the policy clause fails."""
+        post_id = _seed_posts_with_distinct_owners(self.session_factory, 1)[0]
+        other_user = User(id=random_user_id())
+
+        with self.session_factory() as db:
+            post = self.sut.update_post(
+                post_id,
+                {Post.title: "Updated"},
+                PostPolicy.can_update_clause(other_user),
+                db,
+            )
+            title = db.query(Post.title).filter(Post.id == post_id).scalar()
+
+        assert post is None
+        assert title == "Post 0"
+
+    def _record_statement(self, conn, cursor, statement, parameters, context, many):
+        self.statements.append(statement)
+
+
+# === Helper functions ===
+
+
+def _seed_posts_with_distinct_owners(
+    session_factory, count: int, return_owner_ids: bool = False
+) -> list[str]:
+    now = now_with_tz()
+    with session_factory() as db:
+        posts = []
+        for index in range(count):
+            owner = User(
+                id=random_user_id(),
+                email=random_email(),
+                password="hashed",
+                is_active=True,
+                created_at=now,
+            )
+            posts.append(
+                Post(
+                    id=random_user_id(),
+                    owner=owner,
+                    title=f"Post {index}",
+                    content="Content",
+                    published=True,
+                    created_at=now - timedelta(seconds=index),
+                )
+            )
+        db.add_all(posts)
+        db.commit()
+        if return_owner_ids:
+            return [str(post.owner_id) for post in posts]
+        return [str(post.id) for post in posts]
+
+
+def _new_posts(owner_id: str, titles: list[str | None]) -> list[Post]:
+    # A None title breaks the NOT NULL constraint, so the database rejects it
+    return [
+        Post(
+            owner_id=owner_id,
+            title=title,
+            content="Content",
+            published=True,
+            created_at=now_with_tz(),
+        )
+        for title in titles
+    ]
@@ -0,0 +1,279 @@
+from unittest.mock import Mock
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.dependencies.current_user import (
+    get_current_user,
+    get_current_user_for_reads,
+)
+from app.posts.exceptions import ForbiddenException, PostsNotCreatedException
+from app.posts.models import (
+    PostBulkMode,
+    PostCursor,
+    PostLookup,
+    PostLookupStatus,
+    PostSort,
+    PostView,
+)
+from app.posts.routes import PostsRoutes
+from app.posts.schemas import PostBatch, PostBulkResult, PostsPage, PostSummariesPage
+from app.posts.use_cases import (
+    CreatePostsUseCaseABC,
+    CreatePostUseCaseABC,
+    DeletePostUseCaseABC,
+    GetPostByIdUseCaseABC,
+    GetPostsByCursorUseCaseABC,
+    GetPostsByIdsUseCaseABC,
+    GetPostsUseCaseABC,
+    UpdatePostUseCaseABC,
+)
+from app.posts.utils import decode_cursor, encode_cursor
+
+from ..shared.test_helpers import make_stored_post, make_stored_user, now_with_tz
+
+
+class TestPostsRoutes:
+    def setup_method(self):
+        self.get_posts_use_case_mock = Mock(spec=GetPostsUseCaseABC)
+        self.get_posts_by_cursor_use_case_mock = Mock(spec=GetPostsByCursorUseCaseABC)
+        self.get_post_by_id_use_case_mock = Mock(spec=GetPostByIdUseCaseABC)
+        self.get_posts_by_ids_use_case_mock = Mock(spec=GetPostsByIdsUseCaseABC)
+        self.create_posts_use_case_mock = Mock(spec=CreatePostsUseCaseABC)
+        self.sut = PostsRoutes(
+            self.get_posts_use_case_mock,
+            self.get_posts_by_cursor_use_case_mock,
+            Mock(spec=CreatePostUseCaseABC),
+            self.create_posts_use_case_mock,
+            self.get_post_by_id_use_case_mock,
+            self.get_posts_by_ids_use_case_mock,
+            Mock(spec=UpdatePostUseCaseABC),
+            Mock(spec=DeletePostUseCaseABC),
+        )
+        self.current_user = make_stored_user()
+        self.app = FastAPI()
+        self.app.include_router(self.sut.router)
+        self.app.dependency_overrides[get_current_user] = lambda: self.current_user
+        self.app.dependency_overrides[get_current_user_for_reads] = (
+            lambda: self.current_user
+        )
+        self.client = TestClient(self.app)
+
+    def test_get_posts_should_use_offsets_without_cursor(self):
+        """Should page with page/size and return no cursor."""
+        post = make_stored_post()
+        self.get_posts_use_case_mock.execute.return_value = [(post, 3)]
+
+        response = self.client.get("/posts/?page=2&size=5")
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["next_cursor"] is None
+        assert body["data"][0]["Post"]["id"] == post.id
+        assert body["data"][0]["votes"] == 3
+        self.get_posts_by_cursor_use_case_mock.execute.assert_not_called()
+
+    def test_get_posts_should_start_keyset_pagination_with_empty_cursor(self):
+        """Should seek from the newest post and return an opaque next cursor."""
+        post = make_stored_post()
+        next_cursor = PostCursor(created_at=post.created_at, id=post.id)
+        self.get_posts_by_cursor_use_case_mock.execute.return_value = (
+            [(post, 0)],
+            next_cursor,
+        )
+
+        response = self.client.get("/posts/?cursor=&size=1")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert decode_cursor(response.json()["next_cursor"]) == next_cursor
+        args = self.get_posts_by_cursor_use_case_mock.execute.call_args.args
+        assert args[0] is None
+        assert args[1] == 1
+
+    def test_get_posts_should_decode_given_cursor(self):
+        """Should pass the decoded cursor to the use case."""
+        cursor = PostCursor(created_at=now_with_tz(), id=make_stored_post().id)
+        self.get_posts_by_cursor_use_case_mock.execute.return_value = ([], None)
+
+        response = self.client.get(f"/posts/?cursor={encode_cursor(cursor)}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"data": [], "next_cursor": None}
+        args = self.get_posts_by_cursor_use_case_mock.execute.call_args.args
+        assert args[0] == cursor
+
+    def test_get_posts_should_reject_invalid_cursor(self):
+        """Should return 400 BAD REQUEST for a tampered cursor."""
+        response = self.client.get("/posts/?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "Invalid cursor"}
+
+    def test_get_posts_should_reject_page_combined_with_cursor(self):
+        """Should return 400 BAD REQUEST when both page and cursor are given."""
+        response = self.client.get("/posts/?cursor=&page=3")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_posts_should_forward_sort_to_use_case(self):
+        """Should pass the requested ranking down to the listing use case."""
+        self.get_posts_use_case_mock.execute.return_value = []
+
+        response = self.client.get("/posts/?sort=hot")
+
+        assert response.status_code == status.HTTP_200_OK
+        args = self.get_posts_use_case_mock.execute.call_args.args
+        assert args[3] == PostSort.HOT
+
+    def test_get_posts_should_reject_ranked_sort_combined_with_cursor(self):
+        """Should return 400 BAD REQUEST since keyset pages are newest first."""
+        response = self.client.get("/posts/?cursor=&sort=top")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.get_posts_by_cursor_use_case_mock.execute.assert_not_called()
+
+    def test_get_posts_should_match_the_response_model(self):
+        """Should send exactly what the response_model would serialize."""
+        owner = make_stored_user(created_at=now_with_tz())
+        posts = [(make_stored_post(owner=owner), 3), (make_stored_post(owner=owner), 0)]
+        self.get_posts_use_case_mock.execute.return_value = posts
+
+        response = self.client.get("/posts/")
+
+        expected = PostsPage.model_validate(
+            {"data": [{"Post": post, "votes": votes} for post, votes in posts]},
+            from_attributes=True,
+        )
+        assert response.json() == expected.model_dump(mode="json")
+
+    def test_get_posts_should_return_summaries_for_the_summary_view(self):
+        """Should pass view=summary down and send excerpts instead of content."""
+        post = make_stored_post(owner=make_stored_user(created_at=now_with_tz()))
+        post.excerpt = "An excerpt..."
+        self.get_posts_use_case_mock.execute.return_value = [(post, 1)]
+
+        response = self.client.get("/posts/?view=summary")
+
+        assert response.status_code == status.HTTP_200_OK
+        args = self.get_posts_use_case_mock.execute.call_args.args
+        assert args[4] == PostView.SUMMARY
+        expected = PostSummariesPage.model_validate(
+            {"data": [{"Post": post, "votes": 1}]}, from_attributes=True
+        )
+        assert response.json() == expected.model_dump(mode="json")
+        assert "content" not in response.json()["data"][0]["Post"]
+
+    def test_get_post_by_id_should_return_403_when_forbidden(self):
+        """Should return 403 FORBIDDEN for another user's unpublished post."""
+        self.get_post_by_id_use_case_mock.execute.side_effect = ForbiddenException()
+
+        response = self.client.get(f"/posts/{make_stored_post().id}")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_get_posts_by_ids_should_answer_each_id_with_its_status(self):
+        """Should return found posts and per-id 404/403 markers, in request order."""
+        owner = make_stored_user(created_at=now_with_tz())
+        post = make_stored_post(owner=owner)
+        self.get_posts_by_ids_use_case_mock.execute.return_value = [
+            PostLookup("missing", PostLookupStatus.NOT_FOUND),
+            PostLookup(post.id, PostLookupStatus.FOUND, post, 2),
+            PostLookup("draft", PostLookupStatus.FORBIDDEN),
+        ]
+
+        response = self.client.get(f"/posts/batch?ids=missing,{post.id}&ids=draft")
+
+        assert response.status_code == status.HTTP_200_OK
+        args = self.get_posts_by_ids_use_case_mock.execute.call_args.args
+        assert args[0] == ["missing", post.id, "draft"]
+        self.get_post_by_id_use_case_mock.execute.assert_not_called()
+        body = response.json()
+        assert [(item["id"], item["status"]) for item in body["data"]] == [
+            ("missing", 404),
+            (post.id, 200),
+            ("draft", 403),
+        ]
+        assert body == PostBatch.model_validate(body).model_dump(mode="json")
+        assert body["data"][1]["Post"]["id"] == post.id
+        assert body["data"][1]["votes"] == 2
+
+    def test_get_posts_by_ids_should_look_up_repeated_ids_once(self):
+        """Should drop repeated ids, keeping their first position."""
+        self.get_posts_by_ids_use_case_mock.execute.return_value = []
+
+        self.client.get("/posts/batch?ids=b,a,b&ids=a")
+
+        args = self.get_posts_by_ids_use_case_mock.execute.call_args.args
+        assert args[0] == ["b", "a"]
+
+    def test_get_posts_by_ids_should_reject_too_many_ids(self):
+        """Should return 400 BAD REQUEST above the configured batch size."""
+        ids = ",".join(str(index) for index in range(settings.posts_batch_max_ids + 1))
+
+        response = self.client.get(f"/posts/batch?ids={ids}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.get_posts_by_ids_use_case_mock.execute.assert_not_called()
+
+    def test_create_posts_should_return_201_when_every_post_was_created(self):
+        """Should create the batch atomically by default and list each post."""
+        owner = make_stored_user(created_at=now_with_tz())
+        posts = [make_stored_post(owner=owner) for _ in range(2)]
+        self.create_posts_use_case_mock.execute.return_value = posts
+
+        response = self.client.post("/posts/bulk", json=_bulk_body(2))
+
+        assert response.status_code == status.HTTP_201_CREATED
+        args = self.create_posts_use_case_mock.execute.call_args.args
+        assert [post_data.title for post_data in args[0]] == ["Post 0", "Post 1"]
+        assert args[1] == PostBulkMode.ATOMIC
+        body = response.json()
+        assert body == PostBulkResult.model_validate(body).model_dump(mode="json")
+        assert [item["Post"]["id"] for item in body["data"]] == [p.id for p in posts]
+
+    def test_create_posts_should_return_207_when_some_posts_were_rejected(self):
+        """Should mark each rejected post of a best-effort batch with 422."""
+        post = make_stored_post(owner=self.current_user)
+        self.create_posts_use_case_mock.execute.return_value = [None, post]
+
+        response = self.client.post("/posts/bulk?mode=best_effort", json=_bulk_body(2))
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        args = self.create_posts_use_case_mock.execute.call_args.args
+        assert args[1] == PostBulkMode.BEST_EFFORT
+        items = response.json()["data"]
+        assert [(item["index"], item["status"]) for item in items] == [(0, 422), (1, 201)]
+        assert items[0]["Post"] is None
+
+    def test_create_posts_should_return_422_when_an_atomic_batch_fails(self):
+        """Should report that nothing was created."""
+        self.create_posts_use_case_mock.execute.side_effect = PostsNotCreatedException()
+
+        response = self.client.post("/posts/bulk", json=_bulk_body(2))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_create_posts_should_return_403_when_forbidden(self):
+        """Should return 403 FORBIDDEN when the user cannot create posts."""
+        self.create_posts_use_case_mock.execute.side_effect = ForbiddenException()
+
+        response = self.client.post("/posts/bulk", json=_bulk_body(1))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_create_posts_should_reject_too_many_posts(self):
+        """Should return 400 BAD REQUEST above the configured batch size."""
+        body = _bulk_body(settings.posts_bulk_max_items + 1)
+
+        response = self.client.post("/posts/bulk", json=body)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.create_posts_use_case_mock.execute.assert_not_called()
+
+
+# === Helper functions ===
+
+
+def _bulk_body(count: int) -> list[dict]:
+    return [{"title": f"Post {index}", "content": "Content"} for index in range(count)]
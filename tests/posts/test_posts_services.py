@@ -0,0 +1,213 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.posts.exceptions import ForbiddenException
+from app.posts.models import (
+    CreatePostData,
+    PostBulkMode,
+    PostCursor,
+    PostLookup,
+    PostLookupStatus,
+    PostView,
+    UpdatePostData,
+)
+from app.posts.policies import PostPolicy
+from app.posts.repositories import PostRepositoryABC
+from app.posts.services import PostService
+
+from ..shared.test_helpers import make_stored_post, make_stored_user, now_with_tz
+
+
+class TestPostService:
+    def setup_method(self):
+        self.post_repository_mock = Mock(spec=PostRepositoryABC)
+        self.post_policy_mock = Mock(spec=PostPolicy)
+        self.post_policy_mock.can_view.return_value = True
+        self.can_view_clause = self.post_policy_mock.can_view_clause.return_value
+        self.sut = PostService(self.post_repository_mock, self.post_policy_mock)
+        self.db = Mock(spec=Session)
+        self.current_user = make_stored_user()
+
+    def test_get_posts_by_cursor_should_return_next_cursor_when_more_posts(self):
+        """Should return the page and a cursor pointing at its last post."""
+        stored_posts = _make_posts_newest_first(4)
+        self.post_repository_mock.get_posts_after.return_value = stored_posts
+
+        posts, next_cursor = self.sut.get_posts_by_cursor(
+            None, 3, None, PostView.FULL, self.db, self.current_user
+        )
+
+        self.post_repository_mock.get_posts_after.assert_called_once_with(
+            None, 4, None, PostView.FULL, self.can_view_clause, self.db
+        )
+        assert posts == stored_posts[:3]
+        last_post = stored_posts[2][0]
+        assert next_cursor == PostCursor(
+            created_at=last_post.created_at, id=str(last_post.id)
+        )
+
+    def test_get_posts_by_cursor_should_return_no_cursor_on_last_page(self):
+        """Should not return a cursor when there are no posts left."""
+        stored_posts = _make_posts_newest_first(2)
+        self.post_repository_mock.get_posts_after.return_value = stored_posts
+
+        posts, next_cursor = self.sut.get_posts_by_cursor(
+            None, 3, None, PostView.FULL, self.db, self.current_user
+        )
+
+        assert posts == stored_posts
+        assert next_cursor is None
+
+    def test_get_posts_by_cursor_should_forward_cursor_to_repository(self):
+        """Should seek from the given cursor."""
+        cursor = PostCursor(created_at=now_with_tz(), id=str(make_stored_post().id))
+        self.post_repository_mock.get_posts_after.return_value = []
+
+        self.sut.get_posts_by_cursor(
+            cursor, 5, "term", PostView.SUMMARY, self.db, self.current_user
+        )
+
+        self.post_repository_mock.get_posts_after.assert_called_once_with(
+            cursor, 6, "term", PostView.SUMMARY, self.can_view_clause, self.db
+        )
+
+    def test_get_posts_should_filter_with_the_policy_clause_in_the_query(self):
+        """Should let the repository filter, returning its page untouched."""
+        stored_posts = _make_posts_newest_first(3)
+        self.post_repository_mock.get_posts.return_value = stored_posts
+
+        posts = self.sut.get_posts(
+            1, 3, None, None, PostView.FULL, self.db, self.current_user
+        )
+
+        assert posts == stored_posts
+        self.post_policy_mock.can_view_clause.assert_called_once_with(self.current_user)
+        self.post_repository_mock.get_posts.assert_called_once_with(
+            1, 3, None, None, PostView.FULL, self.can_view_clause, self.db
+        )
+        self.post_policy_mock.can_view.assert_not_called()
+
+    def test_get_post_by_id_should_raise_forbidden_when_policy_denies(self):
+        """Should raise ForbiddenException for a post the user cannot view."""
+        self.post_repository_mock.get_post_by_id.return_value = make_stored_post()
+        self.post_policy_mock.can_view.return_value = False
+
+        with pytest.raises(ForbiddenException):
+            self.sut.get_post_by_id("post-id", PostView.FULL, self.db, self.current_user)
+
+    def test_get_post_by_id_should_return_none_when_post_does_not_exist(self):
+        """Should return None so the route can answer 404."""
+        self.post_repository_mock.get_post_by_id.return_value = None
+
+        post = self.sut.get_post_by_id(
+            "post-id", PostView.FULL, self.db, self.current_user
+        )
+
+        assert post is None
+        self.post_policy_mock.can_view.assert_not_called()
+
+    def test_create_posts_should_check_the_policy_once_for_the_batch(self):
+        """Should build every post for the current user after a single check."""
+        posts_data = [CreatePostData(title=f"t{i}", content="c") for i in range(3)]
+        self.post_policy_mock.can_create.return_value = True
+
+        self.sut.create_posts(
+            posts_data, PostBulkMode.ATOMIC, self.db, self.current_user
+        )
+
+        self.post_policy_mock.can_create.assert_called_once_with(self.current_user)
+        posts, mode, db = self.post_repository_mock.create_posts.call_args.args
+        assert [post.title for post in posts] == ["t0", "t1", "t2"]
+        assert {post.owner_id for post in posts} == {self.current_user.id}
+        assert (mode, db) == (PostBulkMode.ATOMIC, self.db)
+
+    def test_create_posts_should_raise_forbidden_when_policy_denies(self):
+        """Should store nothing when the user cannot create posts."""
+        self.post_policy_mock.can_create.return_value = False
+
+        with pytest.raises(ForbiddenException):
+            self.sut.create_posts(
+                [CreatePostData(title="t", content="c")],
+                PostBulkMode.BEST_EFFORT,
+                self.db,
+                self.current_user,
+            )
+
+        self.post_repository_mock.create_posts.assert_not_called()
+
+    def test_get_posts_by_ids_should_check_the_policy_on_each_post(self):
+        """Should fetch the batch at once and give each id its own outcome."""
+        visible, hidden = make_stored_post(), make_stored_post(published=False)
+        self.post_repository_mock.get_posts_by_ids.return_value = [
+            (hidden, 0),
+            (visible, 4),
+        ]
+        self.post_policy_mock.can_view.side_effect = lambda post, _: post is visible
+        post_ids = [visible.id, "missing", hidden.id]
+
+        lookups = self.sut.get_posts_by_ids(
+            post_ids, PostView.FULL, self.db, self.current_user
+        )
+
+        self.post_repository_mock.get_posts_by_ids.assert_called_once_with(
+            post_ids, PostView.FULL, self.db
+        )
+        assert lookups == [
+            PostLookup(visible.id, PostLookupStatus.FOUND, visible, 4),
+            PostLookup("missing", PostLookupStatus.NOT_FOUND),
+            PostLookup(hidden.id, PostLookupStatus.FORBIDDEN),
+        ]
+
+    def test_update_post_should_return_updated_post(self):
+        """Should not look the post up again when the update went through."""
+        updated_post = make_stored_post(owner=self.current_user)
+        self.post_repository_mock.update_post.return_value = updated_post
+
+        post = self.sut.update_post(
+            str(updated_post.id), _make_update_data(), self.db, self.current_user
+        )
+
+        assert post == updated_post
+        self.post_repository_mock.post_exists.assert_not_called()
+
+    def test_update_post_should_raise_forbidden_when_post_exists(self):
+        """Should raise ForbiddenException when the policy blocked the update."""
+        self.post_repository_mock.update_post.return_value = None
+        self.post_repository_mock.post_exists.return_value = True
+
+        with pytest.raises(ForbiddenException):
+            self.sut.update_post(
+                str(make_stored_post().id),
+                _make_update_data(),
+                self.db,
+                self.current_user,
+            )
+
+    def test_update_post_should_return_none_when_post_does_not_exist(self):
+        """Should return None so the route can answer 404."""
+        self.post_repository_mock.update_post.return_value = None
+        self.post_repository_mock.post_exists.return_value = False
+
+        post = self.sut.update_post(
+            str(make_stored_post().id), _make_update_data(), self.db, self.current_user
+        )
+
+        assert post is None
+
+
+# === Helper functions ===
+
+
+def _make_update_data() -> UpdatePostData:
+    return UpdatePostData(title="Title", content="Content")
+
+
+def _make_posts_newest_first(count: int):
+    now = now_with_tz()
+    return [
+        (make_stored_post(created_at=now - timedelta(minutes=index)), index)
+        for index in range(count)
+    ]
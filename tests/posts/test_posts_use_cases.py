@@ -0,0 +1,168 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.dependencies.database import REPLICA_SESSION
+from app.posts.models import CreatePostData, PostBulkMode, PostSort, PostView
+from app.posts.services import PostServiceABC
+from app.posts.use_cases import (
+    CachedGetPostsUseCase,
+    CreatePostsUseCase,
+    CreatePostUseCase,
+    DeletePostUseCase,
+    GetPostsUseCaseABC,
+)
+
+from ..shared.test_helpers import make_stored_post, make_stored_user, random_user_id
+
+FULL = PostView.FULL
+
+
+class TestCachedGetPostsUseCase:
+    def setup_method(self):
+        self.get_posts_use_case_mock = Mock(spec=GetPostsUseCaseABC)
+        self.cache = TTLCache(max_size=10, ttl=60)
+        self.service_mock = Mock(spec=PostServiceABC)
+        self.service_mock.get_draft_owner_ids.return_value = set()
+        self.sut = CachedGetPostsUseCase(
+            self.get_posts_use_case_mock, self.cache, self.service_mock
+        )
+        self.db = Mock(spec=Session, info={})
+        self.current_user = make_stored_user()
+
+    def test_execute_should_serve_repeated_requests_from_cache(self):
+        """Should hit the wrapped use case only once for identical requests."""
+        posts = [(make_stored_post(), 0)]
+        self.get_posts_use_case_mock.execute.return_value = posts
+
+        first = self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        second = self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+
+        assert first == second == posts
+        self.get_posts_use_case_mock.execute.assert_called_once()
+
+    def test_execute_should_key_on_page_size_and_search(self):
+        """Should not share entries between different listings."""
+        self.get_posts_use_case_mock.execute.return_value = []
+
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(2, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, "term", None, FULL, self.db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 3
+
+    def test_execute_should_key_on_sort(self):
+        """Should not serve a ranked listing for a different sort."""
+        self.get_posts_use_case_mock.execute.return_value = []
+
+        self.sut.execute(1, 5, None, PostSort.TOP, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, None, PostSort.HOT, FULL, self.db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 2
+
+    def test_execute_should_key_on_view(self):
+        """Should not serve summaries for a full listing, or the reverse."""
+        self.get_posts_use_case_mock.execute.return_value = []
+
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, None, None, PostView.SUMMARY, self.db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 2
+
+    def test_execute_should_share_entries_between_users_without_drafts(self):
+        """Should serve one published-only listing to every user without drafts."""
+        self.get_posts_use_case_mock.execute.return_value = []
+        other_user = make_stored_user(id=random_user_id())
+
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, None, None, FULL, self.db, other_user)
+
+        self.get_posts_use_case_mock.execute.assert_called_once()
+        self.service_mock.get_draft_owner_ids.assert_called_once()
+
+    def test_execute_should_key_on_user_when_they_have_drafts(self):
+        """Should not serve a listing with a user's drafts to anyone else."""
+        self.get_posts_use_case_mock.execute.return_value = []
+        self.service_mock.get_draft_owner_ids.return_value = {str(self.current_user.id)}
+        other_user = make_stored_user(id=random_user_id())
+
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, None, None, FULL, self.db, other_user)
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 2
+
+    def test_execute_should_not_cache_replica_reads(self):
+        """Should serve but not keep listings read from a possibly lagging replica."""
+        self.get_posts_use_case_mock.execute.return_value = []
+        replica_db = Mock(spec=Session, info={REPLICA_SESSION: True})
+
+        self.sut.execute(1, 5, None, None, FULL, replica_db, self.current_user)
+        self.sut.execute(1, 5, None, None, FULL, replica_db, self.current_user)
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+        self.sut.execute(1, 5, None, None, FULL, replica_db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 3
+        assert self.service_mock.get_draft_owner_ids.call_count == 3
+
+    def test_execute_should_reload_after_invalidation(self):
+        """Should query again once a write invalidated the cache."""
+        self.get_posts_use_case_mock.execute.return_value = []
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+
+        self.cache.invalidate()
+        self.sut.execute(1, 5, None, None, FULL, self.db, self.current_user)
+
+        assert self.get_posts_use_case_mock.execute.call_count == 2
+        assert self.service_mock.get_draft_owner_ids.call_count == 2
+
+
+class TestPostWriteUseCases:
+    def setup_method(self):
+        self.service_mock = Mock(spec=PostServiceABC)
+        self.cache_mock = Mock(spec=TTLCache)
+        self.db = Mock(spec=Session)
+        self.current_user = make_stored_user()
+
+    def test_create_post_should_invalidate_listing_cache(self):
+        """Should invalidate cached listings after creating a post."""
+        sut = CreatePostUseCase(self.service_mock, self.cache_mock)
+
+        sut.execute(CreatePostData(title="t", content="c"), self.db, self.current_user)
+
+        self.cache_mock.invalidate.assert_called_once()
+
+    def test_create_post_should_keep_cache_when_creation_fails(self):
+        """Should not invalidate anything when the service raises."""
+        self.service_mock.create_post.side_effect = RuntimeError()
+        sut = CreatePostUseCase(self.service_mock, self.cache_mock)
+
+        with pytest.raises(RuntimeError):
+            sut.execute(
+                CreatePostData(title="t", content="c"), self.db, self.current_user
+            )
+
+        self.cache_mock.invalidate.assert_not_called()
+
+    def test_create_posts_should_invalidate_only_when_posts_were_created(self):
+        """Should keep cached listings when a bulk creation stored nothing."""
+        posts_data = [CreatePostData(title="t", content="c")]
+        sut = CreatePostsUseCase(self.service_mock, self.cache_mock)
+
+        self.service_mock.create_posts.return_value = [None]
+        sut.execute(posts_data, PostBulkMode.BEST_EFFORT, self.db, self.current_user)
+        self.cache_mock.invalidate.assert_not_called()
+
+        self.service_mock.create_posts.return_value = [make_stored_post()]
+        sut.execute(posts_data, PostBulkMode.BEST_EFFORT, self.db, self.current_user)
+        self.cache_mock.invalidate.assert_called_once()
+
+    def test_delete_post_should_invalidate_listing_cache(self):
+        """Should invalidate cached listings after deleting a post."""
+        sut = DeletePostUseCase(self.service_mock, self.cache_mock)
+
+        sut.execute(make_stored_post().id, self.db, self.current_user)
+
+        self.cache_mock.invalidate.assert_called_once()
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
+from app.posts.models import Post
 from app.users.models import User
 
 
@@ -41,3 +42,25 @@ def make_stored_user(
         is_active=is_active,
         created_at=created_at,
     )
+
+
+def make_stored_post(
+    owner: User | None = None,
+    id: str | None = None,
+    title: str | None = None,
+    content: str | None = None,
+    published: bool = True,
+    created_at: datetime | None = None,
+) -> Post:
+    owner = owner or make_stored_user(id=random_user_id())
+    post = Post(
+        id=id or str(uuid.uuid4()),
+        owner_id=owner.id,
+        title=title or random_string(12),
+        content=content or random_string(40),
+        published=published,
+        rating=None,
+        created_at=created_at or now_with_tz(),
+    )
+    post.owner = owner
+    return post
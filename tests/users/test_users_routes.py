@@ -9,7 +9,7 @@ from app.users.routes import UserRoutes
 from app.users.schemas import UserOut
 from app.users.use_cases import CreateUserUseCaseABC, GetUserByIdUseCaseABC
 
-from ..shared.test_helpers import make_stored_user, random_user_id
+from ..shared.test_helpers import make_stored_user, now_with_tz, random_user_id
 
 
 class TestUserRoutes:
@@ -72,6 +72,16 @@ class TestUserRoutes:
 
         _assert_user_equals(returned_user, stored_user)
 
+    def test_get_user_by_id_should_match_the_response_model(self):
+        """Should send exactly what UserOut would serialize, and no password."""
+        stored_user = make_stored_user(created_at=now_with_tz())
+        self.get_user_by_id_use_case_mock.execute.return_value = stored_user
+
+        response = self.client.get(f"/users/{stored_user.id}")
+
+        expected = UserOut.model_validate(stored_user).model_dump(mode="json")
+        assert response.json() == {"data": expected}
+
     def test_get_user_by_id_not_found(self):
         """
         Should return 404 NOT FOUND if user not found.
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -32,10 +33,34 @@ class TestUserService:
         self.user_repository_mock.get_user_by_email.return_value = None
         self.user_repository_mock.add_user.return_value = new_stored_user
 
-        returned_user = self.sut.create_user(create_user_request_data, self.db)
+        returned_user = asyncio.run(
+            self.sut.create_user(create_user_request_data, self.db)
+        )
 
         assert returned_user == new_stored_user
 
+    def test_create_user_should_not_hold_a_transaction_while_hashing(self):
+        """Should end the email lookup's transaction before hashing the password."""
+        commits_before_hashing = []
+
+        async def fake_hash_password(plain_password: str) -> str:
+            commits_before_hashing.append(self.db.commit.call_count)
+            return "hashed"
+
+        self.user_repository_mock.get_user_by_email.return_value = None
+        self.user_repository_mock.add_user.side_effect = lambda db, user: user
+
+        with patch("app.users.services.hash_password", fake_hash_password):
+            new_user = asyncio.run(
+                self.sut.create_user(
+                    CreateUserData(email=random_email(), password=random_password()),
+                    self.db,
+                )
+            )
+
+        assert commits_before_hashing == [1]
+        assert new_user.password == "hashed"
+
     def test_create_user_email_exists(self):
         """Should raise EmailAlreadyExistsException if email already exists."""
         email = random_email()
@@ -48,7 +73,7 @@ class TestUserService:
         )
 
         with pytest.raises(EmailAlreadyExistsException):
-            self.sut.create_user(create_user_request_data, self.db)
+            asyncio.run(self.sut.create_user(create_user_request_data, self.db))
 
     def test_get_user_by_id_happy_path(self):
         """Should return user when user_id exists."""
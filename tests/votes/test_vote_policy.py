@@ -9,7 +9,7 @@ class TestVotePolicy:
         """
         Should allow voting if user is active and not the owner of the post.
         """
-        post = Post(owner_id=random_user_id())
+        post = Post(owner_id=random_user_id(), published=True)
         active_non_owner_user = User(id=random_user_id(), is_active=True)
 
         assert VotePolicy.can_vote(post, active_non_owner_user) is True
@@ -18,7 +18,7 @@ class TestVotePolicy:
         """
         Should not allow voting if user is inactive, even if not the owner.
         """
-        post = Post(owner_id=random_user_id())
+        post = Post(owner_id=random_user_id(), published=True)
         inactive_non_owner_user = User(id=random_user_id(), is_active=False)
 
         assert VotePolicy.can_vote(post, inactive_non_owner_user) is False
@@ -28,7 +28,7 @@ class TestVotePolicy:
         Should not allow voting if user is the owner, even if active.
         """
         user_id = random_user_id()
-        post = Post(owner_id=user_id)
+        post = Post(owner_id=user_id, published=True)
         active_owner_user = User(id=user_id, is_active=True)
 
         assert VotePolicy.can_vote(post, active_owner_user) is False
@@ -38,7 +38,36 @@ class TestVotePolicy:
         Should not allow voting if user is the owner and inactive.
         """
         user_id = random_user_id()
-        post = Post(owner_id=user_id)
+        post = Post(owner_id=user_id, published=True)
         inactive_owner_user = User(id=user_id, is_active=False)
 
         assert VotePolicy.can_vote(post, inactive_owner_user) is False
+
+    def test_can_vote_draft_of_another_user(self):
+        """
+        Should not allow voting on a post the user cannot view.
+        """
+        draft = Post(owner_id=random_user_id(), published=False)
+        active_user = User(id=random_user_id(), is_active=True)
+
+        assert VotePolicy.can_vote(draft, active_user) is False
+
+    def test_can_vote_clause_inactive_user(self):
+        """
+        Should reduce to a false SQL clause if the user is inactive.
+        """
+        inactive_user = User(id=random_user_id(), is_active=False)
+
+        clause = VotePolicy.can_vote_clause(inactive_user)
+
+        assert str(clause.compile()) == "false"
+
+    def test_can_vote_clause_requires_a_viewable_post(self):
+        """
+        Should only match posts that are published or owned by the user.
+        """
+        active_user = User(id=random_user_id(), is_active=True)
+
+        clause = str(VotePolicy.can_vote_clause(active_user).compile())
+
+        assert "posts.published OR posts.owner_id" in clause
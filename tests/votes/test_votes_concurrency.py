@@ -0,0 +1,182 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pytest
+from sqlalchemy import create_engine, func, select, text, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.posts.models import Post
+from app.users.models import User
+from app.votes.models import Vote, VoteResult
+from app.votes.policies import VotePolicy
+from app.votes.repositories import VoteRepository
+from tests.shared.test_helpers import now_with_tz, random_email, random_user_id
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+CONCURRENCY = 16
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="set TEST_DATABASE_URL to a migrated PostgreSQL database",
+)
+
+
+class TestVoteRepositoryConcurrency:
+    """
+    Integration tests running (and racing) votes against a migrated
+    PostgreSQL database.
+    """
+
+    def setup_method(self):
+        self.engine = create_engine(TEST_DATABASE_URL, pool_size=CONCURRENCY)
+        self.session_factory = sessionmaker(
+            bind=self.engine, autoflush=False, expire_on_commit=False
+        )
+        self.sut = VoteRepository()
+
+        self.owner = _make_user()
+        self.voters = [_make_user() for _ in range(CONCURRENCY)]
+        self.post_id = random_user_id()
+        with self.session_factory() as db:
+            db.add_all([self.owner, *self.voters])
+            db.flush()
+            db.add(
+                Post(
+                    id=self.post_id,
+                    owner_id=self.owner.id,
+                    title="Concurrency",
+                    content="Content",
+                    created_at=now_with_tz(),
+                )
+            )
+            db.commit()
+
+    def teardown_method(self):
+        user_ids = [self.owner.id, *(voter.id for voter in self.voters)]
+        with self.session_factory() as db:
+            # Posts and votes go away with their users (ON DELETE CASCADE)
+            db.execute(text("DELETE FROM users WHERE id = ANY(:ids)"), {"ids": user_ids})
+            db.commit()
+        self.engine.dispose()
+
+    def test_add_vote_should_accept_one_of_concurrent_double_votes(self):
+        """Should record a single vote when one user votes many times at once."""
+        voter = self.voters[0]
+
+        results = self._race(lambda db, _: self._add_vote(voter, db), CONCURRENCY)
+
+        assert results.count(VoteResult.APPLIED) == 1
+        assert results.count(VoteResult.UNCHANGED) == CONCURRENCY - 1
+        assert self._votes() == (1, 1)
+
+    def test_votes_count_should_match_votes_after_concurrent_toggles(self):
+        """Should keep votes_count equal to the stored votes under contention."""
+        add_results = self._race_per_voter(self._add_vote)
+        remove_results = self._race_per_voter(self._remove_vote, self.voters[::2])
+
+        assert add_results == [VoteResult.APPLIED] * CONCURRENCY
+        assert remove_results == [VoteResult.APPLIED] * (CONCURRENCY // 2)
+        assert self._votes() == (CONCURRENCY // 2, CONCURRENCY // 2)
+
+    def test_bulk_votes_should_not_double_count_concurrent_single_votes(self):
+        """Should count and report only the votes it stored when racing single votes."""
+        voter = self.voters[0]
+
+        def vote(db: Session, index: int):
+            if index % 2:
+                return self._add_vote(voter, db)
+            return self.sut.apply_votes(voter.id, [self.post_id], [], db)
+
+        results = self._race(vote, CONCURRENCY)
+
+        # Exactly one request stored the vote, and only that one reports it
+        bulk_stored = sum(1 for changed in results[::2] if changed)
+        single_stored = results[1::2].count(VoteResult.APPLIED)
+        assert bulk_stored + single_stored == 1
+        assert self._votes() == (1, 1)
+
+    def test_bulk_votes_should_add_and_remove_votes_in_one_statement(self):
+        """Should resolve targets and apply the batch's net changes."""
+        voter = self.voters[0]
+        with self.session_factory() as db:
+            targets = self.sut.get_vote_targets([self.post_id, "missing"], voter.id, db)
+            added = self.sut.apply_votes(voter.id, [self.post_id], [], db)
+            voted_after_add = self.sut.get_vote_targets([self.post_id], voter.id, db)
+            votes_after_add = self._votes()
+            added_again = self.sut.apply_votes(voter.id, [self.post_id], [], db)
+            removed = self.sut.apply_votes(voter.id, [], [self.post_id], db)
+
+        assert list(targets) == [self.post_id]
+        assert targets[self.post_id][0].owner_id == self.owner.id
+        assert targets[self.post_id][1] is False
+        assert voted_after_add[self.post_id][1] is True
+        assert votes_after_add == (1, 1)
+        assert (added, added_again, removed) == ({self.post_id}, set(), {self.post_id})
+        assert self._votes() == (0, 0)
+
+    def test_add_vote_should_forbid_votes_on_other_users_drafts(self):
+        """Should reject votes on posts the voter cannot view, as GET does."""
+        voter = self.voters[0]
+        with self.session_factory() as db:
+            db.execute(
+                update(Post).where(Post.id == self.post_id).values(published=False)
+            )
+            db.commit()
+            result = self._add_vote(voter, db)
+            targets = self.sut.get_vote_targets([self.post_id], voter.id, db)
+
+        assert result is VoteResult.FORBIDDEN
+        assert VotePolicy.can_vote(targets[self.post_id][0], voter) is False
+        assert self._votes() == (0, 0)
+
+    def _add_vote(self, voter: User, db: Session) -> VoteResult:
+        return self.sut.add_vote(
+            self.post_id, voter.id, VotePolicy.can_vote_clause(voter), db
+        )
+
+    def _remove_vote(self, voter: User, db: Session) -> VoteResult:
+        return self.sut.remove_vote(
+            self.post_id, voter.id, VotePolicy.can_vote_clause(voter), db
+        )
+
+    def _race_per_voter(self, vote, voters: list[User] | None = None) -> list[VoteResult]:
+        voters = voters or self.voters
+        return self._race(lambda db, index: vote(voters[index], db), len(voters))
+
+    def _race(
+        self, vote: Callable[[Session, int], VoteResult], count: int
+    ) -> list[VoteResult]:
+        barrier = threading.Barrier(count)
+
+        def run(index: int) -> VoteResult:
+            with self.session_factory() as db:
+                barrier.wait()
+                return vote(db, index)
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(run, range(count)))
+
+    def _votes(self) -> tuple[int, int]:
+        with self.session_factory() as db:
+            votes_count = db.scalar(
+                select(Post.votes_count).where(Post.id == self.post_id)
+            )
+            stored_votes = db.scalar(
+                select(func.count()).select_from(Vote).where(Vote.post_id == self.post_id)
+            )
+        return votes_count, stored_votes
+
+
+# Helper functions
+
+
+def _make_user() -> User:
+    return User(
+        id=random_user_id(),
+        email=random_email(),
+        password="hashed",
+        is_active=True,
+        created_at=now_with_tz(),
+    )
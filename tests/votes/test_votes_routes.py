@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.dependencies.current_user import get_current_user
+from app.votes.models import VoteData, VoteResult
+from app.votes.routes import VoteRoutes
+from app.votes.schemas import VoteBulkResult
+from app.votes.use_cases import BulkVoteUseCaseABC, VotesUseCaseABC
+from tests.shared.test_helpers import make_stored_user, random_user_id
+
+
+class TestVoteRoutes:
+    def setup_method(self):
+        self.bulk_vote_use_case_mock = Mock(spec=BulkVoteUseCaseABC)
+        self.sut = VoteRoutes(Mock(spec=VotesUseCaseABC), self.bulk_vote_use_case_mock)
+        self.current_user = make_stored_user()
+        self.app = FastAPI()
+        self.app.include_router(self.sut.router)
+        self.app.dependency_overrides[get_current_user] = lambda: self.current_user
+        self.client = TestClient(self.app)
+
+    def test_vote_in_bulk_should_answer_each_vote_like_a_single_vote(self):
+        """Should map each result to the status POST /votes/ would return."""
+        post_ids = [random_user_id() for _ in range(5)]
+        directions = [1, 1, 1, 1, 0]
+        self.bulk_vote_use_case_mock.execute.return_value = [
+            VoteResult.APPLIED,
+            VoteResult.POST_NOT_FOUND,
+            VoteResult.FORBIDDEN,
+            VoteResult.UNCHANGED,
+            VoteResult.UNCHANGED,
+        ]
+
+        response = self.client.post(
+            "/votes/bulk",
+            json=[
+                {"post_id": post_id, "vote_direction": direction}
+                for post_id, direction in zip(post_ids, directions)
+            ],
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        votes = self.bulk_vote_use_case_mock.execute.call_args.args[0]
+        assert votes == [VoteData(*vote) for vote in zip(post_ids, directions)]
+        body = response.json()
+        assert body == VoteBulkResult.model_validate(body).model_dump(mode="json")
+        assert [(item["post_id"], item["status"]) for item in body["data"]] == list(
+            zip(post_ids, [204, 404, 403, 409, 404])
+        )
+
+    def test_vote_in_bulk_should_return_200_when_every_vote_was_applied(self):
+        """Should not report a multi-status when nothing was rejected."""
+        self.bulk_vote_use_case_mock.execute.return_value = [VoteResult.APPLIED]
+
+        response = self.client.post(
+            "/votes/bulk", json=[{"post_id": random_user_id(), "vote_direction": 1}]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_vote_in_bulk_should_reject_too_many_votes(self):
+        """Should return 400 BAD REQUEST above the configured batch size."""
+        votes = [{"post_id": random_user_id(), "vote_direction": 1}] * (
+            settings.votes_bulk_max_items + 1
+        )
+
+        response = self.client.post("/votes/bulk", json=votes)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.bulk_vote_use_case_mock.execute.assert_not_called()
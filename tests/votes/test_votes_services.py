@@ -0,0 +1,115 @@
+from unittest.mock import ANY, Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.posts.exceptions import ForbiddenException
+from app.votes.exceptions import (
+    AlreadyVotedException,
+    PostNotFoundException,
+    VoteNotFoundException,
+)
+from app.votes.models import VoteData, VoteResult
+from app.votes.policies import VotePolicy
+from app.votes.repositories import VoteRepositoryABC
+from app.votes.services import VoteService
+from tests.shared.test_helpers import make_stored_post, make_stored_user, random_user_id
+
+
+class TestVoteService:
+    def setup_method(self):
+        self.vote_repository_mock = Mock(spec=VoteRepositoryABC)
+        self.sut = VoteService(self.vote_repository_mock, VotePolicy())
+        self.db = Mock(spec=Session)
+        self.current_user = make_stored_user(id=random_user_id())
+        self.post_id = random_user_id()
+
+    def test_add_vote_should_pass_policy_clause_to_repository(self):
+        """Should vote in a single repository call guarded by the policy."""
+        self.vote_repository_mock.add_vote.return_value = VoteResult.APPLIED
+
+        self.sut.add_vote(self.post_id, self.db, self.current_user)
+
+        self.vote_repository_mock.add_vote.assert_called_once_with(
+            self.post_id, self.current_user.id, ANY, self.db
+        )
+
+    @pytest.mark.parametrize(
+        "result, exception",
+        [
+            (VoteResult.POST_NOT_FOUND, PostNotFoundException),
+            (VoteResult.FORBIDDEN, ForbiddenException),
+            (VoteResult.UNCHANGED, AlreadyVotedException),
+        ],
+    )
+    def test_add_vote_should_raise_when_vote_is_rejected(self, result, exception):
+        """Should map each rejected outcome to its domain exception."""
+        self.vote_repository_mock.add_vote.return_value = result
+
+        with pytest.raises(exception):
+            self.sut.add_vote(self.post_id, self.db, self.current_user)
+
+    def test_remove_vote_should_raise_when_no_vote_exists(self):
+        """Should raise VoteNotFoundException when there was nothing to remove."""
+        self.vote_repository_mock.remove_vote.return_value = VoteResult.UNCHANGED
+
+        with pytest.raises(VoteNotFoundException):
+            self.sut.remove_vote(self.post_id, self.db, self.current_user)
+
+    def test_vote_in_bulk_should_give_each_vote_its_single_vote_result(self):
+        """Should replay the votes in order and store only the net changes."""
+        own = make_stored_post(owner=self.current_user)
+        draft = make_stored_post(published=False)
+        voted, unvoted = make_stored_post(), make_stored_post()
+        self.vote_repository_mock.get_vote_targets.return_value = {
+            own.id: (own, False),
+            draft.id: (draft, False),
+            voted.id: (voted, True),
+            unvoted.id: (unvoted, False),
+        }
+        votes = [
+            VoteData("missing", 1),
+            VoteData(own.id, 1),
+            VoteData(draft.id, 1),
+            VoteData(voted.id, 1),
+            VoteData(unvoted.id, 1),
+            VoteData(unvoted.id, 1),
+            VoteData(voted.id, 0),
+        ]
+        self.vote_repository_mock.apply_votes.return_value = {unvoted.id, voted.id}
+
+        results = self.sut.vote_in_bulk(votes, self.db, self.current_user)
+
+        assert results == [
+            VoteResult.POST_NOT_FOUND,
+            VoteResult.FORBIDDEN,
+            VoteResult.FORBIDDEN,
+            VoteResult.UNCHANGED,
+            VoteResult.APPLIED,
+            VoteResult.UNCHANGED,
+            VoteResult.APPLIED,
+        ]
+        self.vote_repository_mock.get_vote_targets.assert_called_once_with(
+            ["missing", own.id, draft.id, voted.id, unvoted.id],
+            self.current_user.id,
+            self.db,
+        )
+        self.vote_repository_mock.apply_votes.assert_called_once_with(
+            self.current_user.id, [unvoted.id], [voted.id], self.db
+        )
+
+    def test_vote_in_bulk_should_report_votes_settled_concurrently_as_unchanged(self):
+        """Should only report APPLIED for the votes the repository changed."""
+        first, second = make_stored_post(), make_stored_post()
+        self.vote_repository_mock.get_vote_targets.return_value = {
+            first.id: (first, False),
+            second.id: (second, False),
+        }
+        # A concurrent single vote on the second post won the race
+        self.vote_repository_mock.apply_votes.return_value = {first.id}
+
+        results = self.sut.vote_in_bulk(
+            [VoteData(first.id, 1), VoteData(second.id, 1)], self.db, self.current_user
+        )
+
+        assert results == [VoteResult.APPLIED, VoteResult.UNCHANGED]
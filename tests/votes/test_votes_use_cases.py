@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.votes.exceptions import AlreadyVotedException
+from app.votes.models import VoteData, VoteResult
+from app.votes.services import VoteServiceABC
+from app.votes.use_cases import BulkVoteUseCase, VoteUseCase
+from tests.shared.test_helpers import make_stored_user, random_user_id
+
+
+class TestVoteUseCase:
+    def setup_method(self):
+        self.vote_service_mock = Mock(spec=VoteServiceABC)
+        self.posts_cache_mock = Mock(spec=TTLCache)
+        self.sut = VoteUseCase(self.vote_service_mock, self.posts_cache_mock)
+        self.db = Mock(spec=Session)
+        self.current_user = make_stored_user()
+
+    def test_execute_should_invalidate_posts_cache_after_vote(self):
+        """Should invalidate cached listings once a vote is recorded."""
+        post_id = random_user_id()
+
+        self.sut.execute(post_id, 1, self.db, self.current_user)
+
+        self.vote_service_mock.add_vote.assert_called_once_with(
+            post_id, self.db, self.current_user
+        )
+        self.posts_cache_mock.invalidate.assert_called_once()
+
+    def test_execute_should_keep_posts_cache_when_vote_is_rejected(self):
+        """Should not invalidate cached listings when the vote fails."""
+        self.vote_service_mock.add_vote.side_effect = AlreadyVotedException()
+
+        with pytest.raises(AlreadyVotedException):
+            self.sut.execute(random_user_id(), 1, self.db, self.current_user)
+
+        self.posts_cache_mock.invalidate.assert_not_called()
+
+
+class TestBulkVoteUseCase:
+    def setup_method(self):
+        self.vote_service_mock = Mock(spec=VoteServiceABC)
+        self.posts_cache_mock = Mock(spec=TTLCache)
+        self.sut = BulkVoteUseCase(self.vote_service_mock, self.posts_cache_mock)
+        self.db = Mock(spec=Session)
+        self.current_user = make_stored_user()
+
+    def test_execute_should_invalidate_posts_cache_only_after_applied_votes(self):
+        """Should keep cached listings when no vote of the batch was applied."""
+        votes = [VoteData(random_user_id(), 1)]
+
+        self.vote_service_mock.vote_in_bulk.return_value = [VoteResult.UNCHANGED]
+        self.sut.execute(votes, self.db, self.current_user)
+        self.posts_cache_mock.invalidate.assert_not_called()
+
+        self.vote_service_mock.vote_in_bulk.return_value = [VoteResult.APPLIED]
+        self.sut.execute(votes, self.db, self.current_user)
+        self.posts_cache_mock.invalidate.assert_called_once()